@@ -18,6 +18,7 @@ from core.database import get_async_session
 from core.dependencies import current_active_user, get_task_progress_registry
 from core.exceptions import EpisodeNotFoundError, SeriesNotFoundError
 from database.models import User
+from services.processing.subtitle_source_policy import SubtitleSourcePolicy
 from services.videoservice.video_service import VideoService
 
 logger = get_logger(__name__)
@@ -145,6 +146,28 @@ async def upload_subtitle(
         raise_not_found("Video file", video_path)
 
 
+@router.put("/subtitle/source-policy", name="set_subtitle_source_policy")
+@handle_api_errors("setting subtitle source policy")
+async def set_subtitle_source_policy(
+    video_path: str,
+    policy: SubtitleSourcePolicy | None = None,
+    current_user: User = Depends(current_active_user),
+    video_service: VideoService = Depends(get_video_service),
+):
+    """
+    Choose between existing subtitles and speech recognition for a video - Requires authentication
+    Omitting the policy resets the video to the configured default
+    """
+    try:
+        video_service.set_subtitle_source_policy(video_path, policy)
+
+        return {"success": True, "video_path": video_path, "policy": policy}
+    except ValueError as e:
+        raise_bad_request(str(e))
+    except FileNotFoundError:
+        raise_not_found("Video file", video_path)
+
+
 @router.post("/scan", name="scan_videos")
 async def scan_videos(
     current_user: User = Depends(current_active_user), video_service: VideoService = Depends(get_video_service)
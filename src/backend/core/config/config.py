@@ -53,9 +53,69 @@ class Settings(BaseSettings):
     translation_service: str = Field(default="opus-de-es-big", alias="LANGPLUG_TRANSLATION_SERVICE")  # de->es big model
     default_language: str = Field(default="de", alias="LANGPLUG_DEFAULT_LANGUAGE")
 
+    # Transcription performance settings
+    transcription_decode_workers: int = Field(default=1, alias="LANGPLUG_TRANSCRIPTION_DECODE_WORKERS")
+    # Batch size for batched chunk decoding (0 = sequential decoding)
+    transcription_batch_size: int = Field(default=0, alias="LANGPLUG_TRANSCRIPTION_BATCH_SIZE")
+    # Transcription result cache: reuse segments for identical (video, range, model, language, options)
+    transcription_cache_enabled: bool = Field(default=False, alias="LANGPLUG_TRANSCRIPTION_CACHE_ENABLED")
+    transcription_cache_dir: str | None = Field(default=None, alias="LANGPLUG_TRANSCRIPTION_CACHE_DIR")
+    transcription_cache_max_mb: int = Field(default=256, alias="LANGPLUG_TRANSCRIPTION_CACHE_MAX_MB")
+
+    # Audio extraction settings
+    audio_fast_seek: bool = Field(default=True, alias="LANGPLUG_AUDIO_FAST_SEEK")  # ffmpeg input seeking
+    audio_seek_preroll_seconds: float = Field(default=0.0, alias="LANGPLUG_AUDIO_SEEK_PREROLL_SECONDS")
+    # Pipe chunk PCM from ffmpeg into memory instead of writing temporary WAV files
+    audio_stream_to_memory: bool = Field(default=True, alias="LANGPLUG_AUDIO_STREAM_TO_MEMORY")
+    # Episode-level PCM cache: decode each episode once, serve chunks as memory-mapped slices
+    audio_cache_enabled: bool = Field(default=False, alias="LANGPLUG_AUDIO_CACHE_ENABLED")
+    audio_cache_dir: str | None = Field(default=None, alias="LANGPLUG_AUDIO_CACHE_DIR")
+    audio_cache_max_mb: int = Field(default=4096, alias="LANGPLUG_AUDIO_CACHE_MAX_MB")
+
+    # Translation performance settings
+    # Persistent directory for CTranslate2 models prepared ahead of time (default: <data path>/translation_models)
+    translation_models_path: str | None = Field(default=None, alias="LANGPLUG_TRANSLATION_MODELS_PATH")
+    # Memory the loaded translation models may use before idle ones are unloaded (LRU)
+    translation_model_memory_budget_mb: float = Field(default=2048, alias="LANGPLUG_TRANSLATION_MODEL_MEMORY_BUDGET_MB")
+    # Subtitle segments per translate_batch call
+    translation_batch_size: int = Field(default=32, alias="LANGPLUG_TRANSLATION_BATCH_SIZE")
+    # Worker threads running translation off the event loop (bounds concurrent model calls)
+    translation_workers: int = Field(default=1, alias="LANGPLUG_TRANSLATION_WORKERS")
+    # Coalesce concurrent translate_batch calls for the same model across requests
+    translation_micro_batching_enabled: bool = Field(default=False, alias="LANGPLUG_TRANSLATION_MICRO_BATCHING_ENABLED")
+    translation_micro_batch_max_size: int = Field(default=64, alias="LANGPLUG_TRANSLATION_MICRO_BATCH_MAX_SIZE")
+    translation_micro_batch_wait_ms: float = Field(default=5.0, alias="LANGPLUG_TRANSLATION_MICRO_BATCH_WAIT_MS")
+    # Translation memory: reuse translations of repeated subtitle lines (SQLite file + in-process LRU)
+    translation_memory_enabled: bool = Field(default=False, alias="LANGPLUG_TRANSLATION_MEMORY_ENABLED")
+    translation_memory_path: str | None = Field(default=None, alias="LANGPLUG_TRANSLATION_MEMORY_PATH")
+    translation_memory_lru_size: int = Field(default=10000, alias="LANGPLUG_TRANSLATION_MEMORY_LRU_SIZE")
+
+    # Share user-independent chunk artifacts (transcript, full translation) across users
+    chunk_artifact_sharing_enabled: bool = Field(default=False, alias="LANGPLUG_CHUNK_ARTIFACT_SHARING_ENABLED")
+    chunk_artifact_cache_size: int = Field(default=64, alias="LANGPLUG_CHUNK_ARTIFACT_CACHE_SIZE")  # chunks
+    # Prepare chunk N+1 in the background after chunk N (requires artifact sharing)
+    chunk_prefetch_enabled: bool = Field(default=False, alias="LANGPLUG_CHUNK_PREFETCH_ENABLED")
+    # Chunk subtitle source for videos without a per-video override: "force_asr" or "prefer_sidecar"
+    # (use existing/uploaded subtitles sliced to the chunk, ASR only when there are none)
+    subtitle_source_policy: str = Field(default="force_asr", alias="LANGPLUG_SUBTITLE_SOURCE_POLICY")
+
     # SpaCy model settings
     spacy_model_de: str = Field(default="de_core_news_lg", alias="LANGPLUG_SPACY_MODEL_DE")
     spacy_model_en: str = Field(default="en_core_web_sm", alias="LANGPLUG_SPACY_MODEL_EN")
+    # Override the size of every spaCy model: sm (least memory), md or lg (most accurate); unset = as configured
+    spacy_model_size: str | None = Field(default=None, alias="LANGPLUG_SPACY_MODEL_SIZE")
+    # nlp.pipe over all subtitle texts of a file: worker processes (1 = in-process) and texts per batch
+    spacy_n_process: int = Field(default=1, alias="LANGPLUG_SPACY_N_PROCESS")
+    spacy_batch_size: int = Field(default=256, alias="LANGPLUG_SPACY_BATCH_SIZE")
+    # Components to load: "vocabulary" (no dependency parser etc.) or "full" (every component)
+    spacy_pipeline_profile: str = Field(default="vocabulary", alias="LANGPLUG_SPACY_PIPELINE_PROFILE")
+    # Persistent process pool for subtitle analysis (0 = one worker thread in this process).
+    # Each worker loads its own model once; unlike spacy_n_process, models are not reloaded per file.
+    spacy_worker_processes: int = Field(default=0, alias="LANGPLUG_SPACY_WORKER_PROCESSES")
+    # Process-wide (language, word) -> lemma/POS/proper-name cache shared by all lemmatizers
+    lemma_cache_size: int = Field(default=50000, alias="LANGPLUG_LEMMA_CACHE_SIZE")  # surface forms
+    # Preload the lemma cache with the vocabulary table at startup
+    lemma_cache_warm_load: bool = Field(default=False, alias="LANGPLUG_LEMMA_CACHE_WARM_LOAD")
 
     # Security settings
     secret_key: str = Field(..., alias="LANGPLUG_SECRET_KEY", min_length=32)
@@ -178,6 +238,14 @@ class Settings(BaseSettings):
         path.mkdir(exist_ok=True)
         return path
 
+    def get_translation_models_path(self) -> Path:
+        """Get the directory holding converted CTranslate2 translation models"""
+        if self.translation_models_path:
+            return Path(self.translation_models_path)
+
+        # Default: next to the application data (survives reboots, unlike the temp dir)
+        return self.get_data_path() / "translation_models"
+
     def get_user_temp_path(self, user_id: int | str) -> Path:
         """
         Get a temporary directory path for user-specific data.
@@ -1,6 +1,7 @@
 """Task and lifecycle dependencies for FastAPI"""
 
 import csv
+import importlib.util
 import os
 import subprocess
 import sys
@@ -70,6 +71,13 @@ async def init_services():
             logger.info("Step 2.5/6: Checking vocabulary data...")
             await _ensure_vocabulary_data()
 
+        # Preload lemma cache from the vocabulary table (opt-in)
+        from core.config.config import settings
+
+        if settings.lemma_cache_warm_load:
+            logger.info("Step 2.6/6: Warming lemma cache...")
+            await _warm_lemma_cache()
+
         # Initialize transcription service
         if os.getenv("TESTING") != "1":
             logger.info("Step 3/6: Initializing transcription service")
@@ -121,17 +129,49 @@ async def cleanup_services():
 
     cleanup_auth_services()
 
+    # Cancel background chunk prefetches before their resources go away
+    from services.processing.chunk_prefetcher import get_chunk_prefetcher
+
+    get_chunk_prefetcher().cancel_all()
+
     # Close database engine
     from core.database.database import engine
 
     await engine.dispose()
 
+    # Stop spaCy worker processes
+    from services.nlp_executor import shutdown_nlp_executor
+
+    shutdown_nlp_executor()
+
+    # Stop ASR decoding threads
+    from services.transcriptionservice.decoding_bridge import shutdown_decoding_executor
+
+    shutdown_decoding_executor()
+
+    # Stop machine-translation threads
+    from services.translationservice.executor import shutdown_translation_executor
+
+    shutdown_translation_executor()
+
     # Clear task progress registry content (not cache, as we removed @lru_cache)
     _task_progress_registry.clear()
 
     logger.info("Service cleanup complete")
 
 
+async def _warm_lemma_cache() -> None:
+    """Preload the process-wide lemma cache with the vocabulary table (non-blocking on failure)"""
+    from core.database.database import AsyncSessionLocal
+    from services.lemma_cache import warm_lemma_cache
+
+    try:
+        async with AsyncSessionLocal() as session:
+            await warm_lemma_cache(session)
+    except Exception as e:
+        logger.warning("Could not warm lemma cache", error=str(e))
+
+
 def _validate_spacy_models() -> None:
     """Validate that required spaCy models are installed.
     
@@ -151,8 +191,12 @@ def _validate_spacy_models() -> None:
         settings.spacy_model_de = debug_model_de
         model_de = debug_model_de
 
-    # Use a local variable for English as well for consistency
-    model_en = settings.spacy_model_en
+    # Resolve through the shared NLP model service so LANGPLUG_SPACY_MODEL_SIZE is applied
+    from services.nlp_model_service import get_nlp_model_service
+
+    nlp_service = get_nlp_model_service()
+    model_de = nlp_service.resolve_model_name("de")
+    model_en = nlp_service.resolve_model_name("en")
 
     required_models = [
         ("de", model_de),
@@ -161,9 +205,7 @@ def _validate_spacy_models() -> None:
 
     missing_models = []
 
-    try:
-        import spacy
-    except ImportError:
+    if importlib.util.find_spec("spacy") is None:
         logger.info("[AUTO-INSTALL] Installing spaCy...")
         try:
             subprocess.run(
@@ -172,7 +214,8 @@ def _validate_spacy_models() -> None:
                 capture_output=True,
                 text=True,
             )
-            import spacy
+            # Make the freshly installed package visible to nlp_service.load_model
+            importlib.invalidate_caches()
             logger.info("[AUTO-INSTALL] spaCy installed successfully")
         except subprocess.CalledProcessError as e:
             raise RuntimeError(
@@ -180,11 +223,12 @@ def _validate_spacy_models() -> None:
                 "Run: pip install spacy"
             )
 
+    # Models loaded here stay loaded in the shared service for vocabulary processing
     for lang, model_name in required_models:
         try:
-            spacy.load(model_name)
+            nlp_service.load_model(model_name)
             logger.info("spaCy model loaded successfully", model=model_name, language=lang)
-        except OSError:
+        except RuntimeError:
             missing_models.append(model_name)
 
     if missing_models:
@@ -213,9 +257,9 @@ def _validate_spacy_models() -> None:
         # Verify installation
         for lang, model_name in required_models:
             try:
-                spacy.load(model_name)
+                nlp_service.load_model(model_name)
                 logger.info("spaCy model loaded successfully", model=model_name, language=lang)
-            except OSError:
+            except RuntimeError:
                 raise RuntimeError(
                     f"[FATAL] Failed to load {model_name} after installation. "
                     f"Run: python -m spacy download {model_name}"
@@ -3,10 +3,13 @@ Subtitle Processor Service
 Handles processing of subtitles through filtering pipeline
 """
 
+import inspect
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 from core.config.logging_config import get_logger
+from services.lemma_cache import TokenAnalysis
+from services.nlp_executor import analyze_texts_async
 
 from ..interface import FilteredSubtitle, FilteredWord, FilteringResult, WordStatus
 from .word_filter import WordFilter
@@ -53,15 +56,89 @@ class SubtitleProcessor:
         # Initialize processing state
         processing_state = self._initialize_processing_state()
 
+        # One spaCy pass over all subtitle texts instead of per-word pipeline calls
+        token_analyses = await self._analyze_subtitles(subtitles, language)
+
+        # One bulk vocabulary lookup for all words of the file instead of one query per word
+        word_infos = await self._lookup_words(subtitles, token_analyses, language, vocab_service, db)
+
         # Process each subtitle
-        for subtitle in subtitles:
+        for subtitle, subtitle_analysis in zip(subtitles, token_analyses, strict=True):
             await self._process_single_subtitle(
-                subtitle, user_known_words, user_level, language, vocab_service, db, processing_state
+                subtitle,
+                user_known_words,
+                user_level,
+                language,
+                vocab_service,
+                db,
+                processing_state,
+                subtitle_analysis,
+                word_infos,
             )
 
         # Create and return result
         return self._create_filtering_result(processing_state, len(subtitles), user_level, language)
 
+    async def _analyze_subtitles(
+        self, subtitles: list[FilteredSubtitle], language: str
+    ) -> list[dict[str, TokenAnalysis]]:
+        """
+        Analyze all subtitle texts with one nlp.pipe pass (off the event loop, in the
+        spaCy worker pool if LANGPLUG_SPACY_WORKER_PROCESSES is set)
+
+        Returns:
+            Per subtitle, lowercased token text -> analysis. Empty mappings if spaCy fails,
+            in which case words fall back to per-word analysis.
+        """
+        if not subtitles:
+            return []
+
+        try:
+            return await analyze_texts_async([subtitle.original_text for subtitle in subtitles], language)
+        except Exception as exc:
+            logger.error("Subtitle analysis failed, falling back to per-word analysis", error=str(exc))
+            return [{} for _ in subtitles]
+
+    async def _lookup_words(
+        self,
+        subtitles: list[FilteredSubtitle],
+        token_analyses: list[dict[str, TokenAnalysis]],
+        language: str,
+        vocab_service: Any,
+        db: "AsyncSession",
+    ) -> dict[str, dict[str, Any]] | None:
+        """
+        Resolve all vocabulary words of the subtitles with the vocabulary service's bulk lookup
+
+        Words are looked up by the lemmas spaCy assigned them in context; only words
+        without an analysis are lemmatized again by the vocabulary service.
+
+        Returns:
+            Word text -> word info, or None if the vocabulary service has no bulk lookup or it
+            fails, in which case words are looked up one by one.
+        """
+        get_words_info = getattr(vocab_service, "get_words_info", None)
+        if not inspect.iscoroutinefunction(get_words_info):
+            return None
+
+        word_texts = []
+        lemmas: dict[str, str] = {}
+        for subtitle, subtitle_analysis in zip(subtitles, token_analyses, strict=True):
+            for word in subtitle.words:
+                word_text = word.text.lower().strip()
+                if not self.validator.is_valid_vocabulary_word(word_text, language):
+                    continue
+                word_texts.append(word_text)
+                analysis = subtitle_analysis.get(word.text.lower())
+                if analysis is not None and analysis.lemma:
+                    lemmas.setdefault(word_text, analysis.lemma)
+
+        try:
+            return await get_words_info(word_texts, language, db, lemmas=lemmas)
+        except Exception as exc:
+            logger.error("Bulk word lookup failed, falling back to per-word lookups", error=str(exc))
+            return None
+
     def _initialize_processing_state(self) -> dict:
         """Initialize state tracking for subtitle processing"""
         return {
@@ -82,8 +159,11 @@ class SubtitleProcessor:
         vocab_service: Any,
         db: "AsyncSession",
         processing_state: dict,
+        token_analysis: dict[str, TokenAnalysis] | None = None,
+        word_infos: dict[str, dict[str, Any]] | None = None,
     ) -> None:
         """Process a single subtitle and update processing state"""
+        token_analysis = token_analysis or {}
         processed_words = []
         subtitle_active_words = []
 
@@ -91,7 +171,14 @@ class SubtitleProcessor:
             processing_state["total_words"] += 1
 
             processed_word = await self._process_and_filter_word(
-                word, user_known_words, user_level, language, vocab_service, db
+                word,
+                user_known_words,
+                user_level,
+                language,
+                vocab_service,
+                db,
+                token_analysis.get(word.text.lower()),
+                word_infos,
             )
             processed_words.append(processed_word)
 
@@ -115,6 +202,8 @@ class SubtitleProcessor:
         language: str,
         vocab_service: Any,
         db: "AsyncSession",
+        analysis: TokenAnalysis | None = None,
+        word_infos: dict[str, dict[str, Any]] | None = None,
     ) -> FilteredWord:
         """Process and filter a single word"""
         word_text = word.text.lower().strip()
@@ -126,15 +215,21 @@ class SubtitleProcessor:
             word.filter_reason = f"Non-vocabulary word ({reason})"
             return word
 
-        # Step 2: Get word info from vocabulary service (using passed session, not creating new one)
-        try:
-            word_info = await vocab_service.get_word_info(word_text, language, db)
-        except Exception as exc:
-            logger.error("Failed to load word info", word=word_text, error=str(exc))
-            word_info = None
+        # Step 2: Get word info from the bulk lookup, else from vocabulary service
+        # (using passed session, not creating new one)
+        if word_infos is not None:
+            word_info = word_infos.get(word_text)
+        else:
+            try:
+                word_info = await vocab_service.get_word_info(word_text, language, db)
+            except Exception as exc:
+                logger.error("Failed to load word info", word=word_text, error=str(exc))
+                word_info = None
 
         # Step 3: Apply filtering logic
-        return self.word_filter.filter_word(word, user_known_words, user_level, language, word_info=word_info)
+        return self.word_filter.filter_word(
+            word, user_known_words, user_level, language, word_info=word_info, analysis=analysis
+        )
 
     def _categorize_subtitle(
         self, subtitle: FilteredSubtitle, subtitle_active_words: list[FilteredWord], processing_state: dict
@@ -6,7 +6,7 @@ Handles filtering logic for words based on user knowledge and difficulty
 from typing import Any
 
 from core.config.logging_config import get_logger
-from services.lemma_resolver import is_proper_name, lemmatize_word
+from services.lemma_resolver import TokenAnalysis, is_proper_name, lemmatize_word
 
 from ..interface import FilteredWord, WordStatus
 
@@ -26,6 +26,7 @@ class WordFilter:
         user_level: str,
         language: str,
         word_info: dict[str, Any] | None = None,
+        analysis: TokenAnalysis | None = None,
     ) -> FilteredWord:
         """
         Apply all filtering logic to a single word
@@ -36,6 +37,8 @@ class WordFilter:
             user_level: User's CEFR level
             language: Language code
             word_info: Optional word information from vocabulary service
+            analysis: spaCy analysis of the word in its subtitle (from analyze_texts); without it
+                the isolated word is run through spaCy
 
         Returns:
             FilteredWord with status and metadata updated
@@ -43,7 +46,7 @@ class WordFilter:
         logger.debug("Processing word", word=word.text, user_level=user_level)
 
         # Check if proper name - filter out immediately
-        if is_proper_name(word.text, language):
+        if analysis.is_proper_name if analysis else is_proper_name(word.text, language):
             word.status = WordStatus.FILTERED_OTHER
             word.filter_reason = "Proper name (automatically filtered)"
             logger.debug("Filtered proper name", word=word.text)
@@ -51,7 +54,7 @@ class WordFilter:
 
         # Generate lemma using spaCy (always, no fallbacks)
         try:
-            lemma = lemmatize_word(word.text, language)
+            lemma = analysis.lemma if analysis and analysis.lemma else lemmatize_word(word.text, language)
             logger.debug("Lemmatized", word=word.text, lemma=lemma)
         except Exception as e:
             logger.error("Lemmatization failed", word=word.text, error=str(e))
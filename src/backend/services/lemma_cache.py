@@ -0,0 +1,235 @@
+"""
+Process-wide lemma cache
+
+Lemmatizing a single word runs the full spaCy pipeline, and the same surface
+forms ("ist", "nicht", "das") appear thousands of times across subtitle files.
+The cache remembers the analysis of every (language, surface form) pair once,
+for every caller in the process: lemma_resolver (vocabulary filtering) and
+LemmatizationService (vocabulary lookups) share it.
+
+Key Components:
+    - TokenAnalysis: Lemma, part of speech and entity membership of a token
+    - LemmaCache: Bounded, thread-safe LRU of token analyses with hit-rate statistics
+    - get_lemma_cache: Process-wide cache instance
+    - warm_lemma_cache: Preload the cache from the vocabulary table
+
+Usage Example:
+    ```python
+    cache = get_lemma_cache()
+
+    analysis = cache.get("de", "häuser")
+    if analysis is None:
+        analysis = analyze_with_spacy("häuser")
+        cache.put("de", "häuser", analysis)
+
+    # At startup (LANGPLUG_LEMMA_CACHE_WARM_LOAD=true)
+    async with AsyncSessionLocal() as session:
+        await warm_lemma_cache(session)
+    ```
+
+Thread Safety:
+    Yes. Lemmatization runs in worker threads; all cache state is guarded by a lock.
+
+Performance Notes:
+    - Hit: O(1), no spaCy call
+    - The least recently used entry is dropped once max_entries is reached
+    - Surface forms are case-sensitive keys; spaCy tags "Bank" and "bank" differently
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.config.logging_config import get_logger
+from database.models import VocabularyWord
+
+logger = get_logger(__name__)
+
+# Universal POS tags for the free-text part_of_speech column of the vocabulary table
+_VOCABULARY_POS = {
+    "noun": "NOUN",
+    "verb": "VERB",
+    "adjective": "ADJ",
+    "adverb": "ADV",
+    "pronoun": "PRON",
+    "preposition": "ADP",
+    "conjunction": "CCONJ",
+    "article": "DET",
+    "numeral": "NUM",
+    "interjection": "INTJ",
+}
+
+
+@dataclass(frozen=True)
+class TokenAnalysis:
+    """Lemma, part of speech and entity membership of a token, taken from its sentence context"""
+
+    lemma: str
+    pos: str
+    is_entity: bool
+
+    @property
+    def is_proper_name(self) -> bool:
+        """Proper nouns and tokens inside named entities are not vocabulary"""
+        return self.pos == "PROPN" or self.is_entity
+
+
+class LemmaCache:
+    """
+    Bounded LRU cache of token analyses keyed by (language, surface form).
+
+    Attributes:
+        max_entries: Maximum number of cached surface forms
+        stats: Counters for hits, misses and evictions
+    """
+
+    def __init__(self, max_entries: int = 50000):
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._entries: OrderedDict[tuple[str, str], TokenAnalysis] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, language: str, surface: str) -> TokenAnalysis | None:
+        """
+        Look up the analysis of a surface form.
+
+        Args:
+            language: Language code
+            surface: Word as it appears in the text
+
+        Returns:
+            Cached analysis, or None on a miss
+        """
+        key = (language.lower(), surface)
+        with self._lock:
+            analysis = self._entries.get(key)
+            if analysis is None:
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return analysis
+
+    def put(self, language: str, surface: str, analysis: TokenAnalysis) -> None:
+        """Store the analysis of a surface form"""
+        self.put_many(language, {surface: analysis})
+
+    def put_many(self, language: str, analyses: dict[str, TokenAnalysis]) -> None:
+        """Store analyses of several surface forms of one language"""
+        if self.max_entries <= 0:
+            return
+
+        language = language.lower()
+        with self._lock:
+            for surface, analysis in analyses.items():
+                key = (language, surface)
+                self._entries[key] = analysis
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, evictions, hit ratio, size and capacity
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            size = len(self._entries)
+        total = stats["hits"] + stats["misses"]
+        hit_ratio = (stats["hits"] / total * 100) if total > 0 else 0
+
+        return {**stats, "hit_ratio": f"{hit_ratio:.1f}%", "size": size, "max_entries": self.max_entries}
+
+    def reset_stats(self) -> None:
+        """Reset statistics counters."""
+        with self._lock:
+            self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def clear(self) -> None:
+        """Drop all cached analyses"""
+        with self._lock:
+            self._entries.clear()
+
+
+_lemma_cache: LemmaCache | None = None
+
+
+def get_lemma_cache() -> LemmaCache:
+    """
+    Get the process-wide lemma cache.
+
+    Configured by LANGPLUG_LEMMA_CACHE_SIZE.
+    """
+    global _lemma_cache
+    if _lemma_cache is None:
+        from core.config import settings
+
+        _lemma_cache = LemmaCache(settings.lemma_cache_size)
+    return _lemma_cache
+
+
+async def warm_lemma_cache(db: AsyncSession, cache: LemmaCache | None = None, language: str | None = None) -> int:
+    """
+    Preload the cache with the word/lemma pairs of the vocabulary table.
+
+    Vocabulary words are never proper names. Each word is stored as written and
+    in lowercase, the form subtitle words are extracted in. Most frequent words
+    are loaded first, until their forms fill the cache capacity, and end up most
+    recently used.
+
+    Args:
+        db: Database session
+        cache: Cache to fill (default: process-wide cache)
+        language: Only load words of this language (default: all languages)
+
+    Returns:
+        Number of vocabulary words loaded
+    """
+    if cache is None:
+        cache = get_lemma_cache()
+    stmt = select(VocabularyWord.word, VocabularyWord.lemma, VocabularyWord.language, VocabularyWord.part_of_speech)
+    if language:
+        stmt = stmt.where(VocabularyWord.language == language)
+    stmt = stmt.order_by(VocabularyWord.frequency_rank.nullslast()).limit(cache.max_entries)
+
+    result = await db.execute(stmt)
+    by_language: dict[str, dict[str, TokenAnalysis]] = {}
+    loaded = stored = 0
+    for word, lemma, word_language, part_of_speech in result.all():
+        if not word or not lemma:
+            continue
+        analyses = by_language.setdefault(word_language, {})
+        forms = [form for form in dict.fromkeys((word, word.lower())) if form not in analyses]
+        # A word takes up to two entries; stop before less frequent words evict more frequent ones
+        if stored + len(forms) > cache.max_entries:
+            break
+        pos = _VOCABULARY_POS.get((part_of_speech or "").strip().lower(), "X")
+        analysis = TokenAnalysis(lemma=lemma.strip().lower(), pos=pos, is_entity=False)
+        for form in forms:
+            analyses[form] = analysis
+        stored += len(forms)
+        loaded += 1
+
+    for word_language, analyses in by_language.items():
+        # Least frequent first, so the most frequent words are the last to be evicted
+        cache.put_many(word_language, dict(reversed(analyses.items())))
+
+    logger.info("Lemma cache warmed from vocabulary", words=loaded, size=len(cache))
+    return loaded
+
+
+__all__ = ["LemmaCache", "TokenAnalysis", "get_lemma_cache", "warm_lemma_cache"]
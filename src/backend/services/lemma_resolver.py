@@ -9,62 +9,72 @@ except ImportError as exc:
 
 from core.config import settings
 from core.config.logging_config import get_logger
-from core.language_preferences import SPACY_MODEL_MAP
+from services.lemma_cache import TokenAnalysis
+from services.nlp_model_service import get_nlp_model_service
 
 logger = get_logger(__name__)
 
 
-_MODEL_CACHE: dict[str, spacy.Language] = {}
+def _resolve_model_name(language_code: str) -> str:
+    """Resolve spaCy model name for a given language code (see NLPModelService)."""
+    return get_nlp_model_service().resolve_model_name(language_code)
 
 
-def _resolve_model_name(language_code: str) -> str:
-    """Resolve spaCy model name for a given language code.
+def _load_model(model_name: str) -> spacy.Language:
+    """Load spaCy model through the shared NLP model service, fail early if unavailable"""
+    return get_nlp_model_service().load_model(model_name)
 
-    Uses dynamic settings for configured languages so that debug-time
-    overrides (e.g. switching to de_core_news_sm) are honored.
-    """
-    language_code = (language_code or "").lower()
 
-    # Build a mapping that incorporates settings overrides
-    language_to_model = {
-        "de": settings.spacy_model_de or SPACY_MODEL_MAP.get("de", SPACY_MODEL_MAP["default"]),
-        "en": settings.spacy_model_en or SPACY_MODEL_MAP.get("en", SPACY_MODEL_MAP["default"]),
-        # Add more overrides here if needed
-    }
-    # Use the override mapping first, then fall back to SPACY_MODEL_MAP
-    return language_to_model.get(language_code, SPACY_MODEL_MAP.get(language_code, SPACY_MODEL_MAP["default"]))
+def analyze_texts(
+    texts: list[str],
+    language_code: str,
+    n_process: int | None = None,
+    batch_size: int | None = None,
+) -> list[dict[str, TokenAnalysis]]:
+    """Analyze whole subtitle texts with a single nlp.pipe pass.
 
+    Running the pipeline once per text (instead of twice per isolated word) is
+    orders of magnitude faster and gives the tagger and NER their sentence context.
 
-def _load_model(model_name: str) -> spacy.Language:
-    """Load spaCy model, fail early if unavailable"""
-    if model_name in _MODEL_CACHE:
-        return _MODEL_CACHE[model_name]
-
-    try:
-        nlp = spacy.load(model_name)
-        logger.info("Loaded spaCy model successfully", model=model_name)
-    except OSError as exc:
-        logger.error(
-            "[SPACY MODEL ERROR] Cannot load model - vocabulary filtering disabled",
-            model=model_name,
-            fix=f"python -m spacy download {model_name}",
-            error=str(exc),
-        )
-        raise RuntimeError(
-            f"Failed to load spaCy model '{model_name}'. Install it with: python -m spacy download {model_name}"
-        ) from exc
-    except Exception as exc:
-        logger.error(
-            "[SPACY ERROR] Unexpected error loading model",
-            model=model_name,
-            error=str(exc),
-        )
-        raise RuntimeError(
-            f"Failed to load spaCy model '{model_name}'. Install it with: python -m spacy download {model_name}"
-        ) from exc
-
-    _MODEL_CACHE[model_name] = nlp
-    return nlp
+    Args:
+        texts: Subtitle texts (original casing)
+        language_code: Language of the texts
+        n_process: Worker processes for nlp.pipe (default: LANGPLUG_SPACY_N_PROCESS)
+        batch_size: Texts per nlp.pipe batch (default: LANGPLUG_SPACY_BATCH_SIZE)
+
+    Returns:
+        Per text, a mapping of lowercased token text to its analysis (first occurrence wins)
+
+    Raises:
+        RuntimeError: If the spaCy model is unavailable
+    """
+    nlp = _load_model(_resolve_model_name(language_code))
+    n_process = settings.spacy_n_process if n_process is None else n_process
+    batch_size = settings.spacy_batch_size if batch_size is None else batch_size
+
+    analyses = []
+    for doc in nlp.pipe(texts, n_process=max(1, n_process), batch_size=max(1, batch_size)):
+        entity_tokens = {token.i for ent in doc.ents for token in ent}
+        tokens: dict[str, TokenAnalysis] = {}
+        for token in doc:
+            key = token.text.lower()
+            if key not in tokens:
+                tokens[key] = TokenAnalysis(
+                    lemma=token.lemma_.strip().lower(), pos=token.pos_, is_entity=token.i in entity_tokens
+                )
+        analyses.append(tokens)
+
+    logger.debug("Analyzed texts with spaCy", texts=len(texts), n_process=n_process)
+    return analyses
+
+
+def _analyze_word(word: str, language_code: str) -> TokenAnalysis | None:
+    """Analyze an isolated word with the shared NLP model service (cached).
+
+    Returns None if spaCy produced no tokens.
+    Raises RuntimeError if the spaCy model is unavailable.
+    """
+    return get_nlp_model_service().analyze_words([word], language_code)[0]
 
 
 def lemmatize_word(word: str, language_code: str) -> str:
@@ -76,20 +86,14 @@ def lemmatize_word(word: str, language_code: str) -> str:
     if not word:
         raise ValueError("Cannot lemmatize empty word")
 
-    model_name = _resolve_model_name(language_code)
-    nlp = _load_model(model_name)
-
-    doc = nlp(word)
-    if not doc or len(doc) == 0:
+    analysis = _analyze_word(word, language_code)
+    if analysis is None:
         raise RuntimeError(f"spaCy failed to tokenize word '{word}'")
 
-    token = doc[0]
-    lemma = token.lemma_.strip().lower()
-
-    if not lemma:
+    if not analysis.lemma:
         raise RuntimeError(f"spaCy returned empty lemma for word '{word}'")
 
-    return lemma
+    return analysis.lemma
 
 
 def is_proper_name(word: str, language_code: str) -> bool:
@@ -104,29 +108,8 @@ def is_proper_name(word: str, language_code: str) -> bool:
     if not word:
         return False
 
-    model_name = _resolve_model_name(language_code)
-    nlp = _load_model(model_name)
-
-    doc = nlp(word)
-    if not doc or len(doc) == 0:
-        return False
-
-    token = doc[0]
-
-    # Check if POS tag is proper noun
-    if token.pos_ == "PROPN":
-        logger.debug("Word '%s' detected as proper noun (POS=PROPN)", word)
-        return True
-
-    # Check if recognized as named entity
-    # Common NER labels: PER (person), ORG (organization), LOC (location), GPE (geopolitical entity)
-    if doc.ents:
-        for ent in doc.ents:
-            if token.i >= ent.start and token.i < ent.end:
-                logger.debug("Word '%s' detected as named entity (label=%s)", word, ent.label_)
-                return True
-
-    return False
+    analysis = _analyze_word(word, language_code)
+    return analysis is not None and analysis.is_proper_name
 
 
-__all__ = ["is_proper_name", "lemmatize_word"]
+__all__ = ["TokenAnalysis", "analyze_texts", "is_proper_name", "lemmatize_word"]
@@ -3,53 +3,24 @@ German Lemmatization Service using spaCy
 """
 
 from core.config.logging_config import get_logger
-
-try:
-    import spacy
-
-    SPACY_AVAILABLE = True
-except ImportError:
-    SPACY_AVAILABLE = False
+from services.lemma_cache import TokenAnalysis
+from services.nlp_model_service import NLPModelService, get_nlp_model_service
 
 logger = get_logger(__name__)
 
 
 class LemmatizationService:
-    """Service for German word lemmatization"""
-
-    def __init__(self):
-        self._nlp: spacy.Language | None = None
-        self._cache: dict[str, str] = {}
-        self._model_loaded = False
-
-    def _load_model(self) -> bool:
-        """Load spaCy German model"""
-        if self._model_loaded:
-            return True
-
-        if not SPACY_AVAILABLE:
-            logger.info("spaCy not available, using simple rules")
-            return False
-
-        try:
-            # Try to load the German model
-            self._nlp = spacy.load("de_core_news_sm")
-            self._model_loaded = True
-            logger.info("German spaCy model loaded", model="de_core_news_sm")
-            return True
-        except OSError as e:
-            logger.warning(
-                "[SPACY MODEL] de_core_news_sm not found - using simple rule-based lemmatization",
-                error=str(e),
-                fix="python -m spacy download de_core_news_sm",
-            )
-            return False
-        except Exception as e:
-            logger.warning(
-                "[SPACY MODEL] Could not load German model - using simple rules",
-                error=str(e),
-            )
-            return False
+    """Service for German word lemmatization
+
+    Uses the shared NLP model service, so vocabulary lookups get the same
+    pipeline, lemmas and cache as vocabulary filtering (lemma_resolver).
+    """
+
+    LANGUAGE = "de"
+
+    def __init__(self, nlp_service: NLPModelService | None = None):
+        self._nlp_service = nlp_service or get_nlp_model_service()
+        self._model_available = True
 
     def lemmatize(self, word: str, pos: str | None = None) -> str:
         """
@@ -62,38 +33,46 @@ class LemmatizationService:
         Returns:
             The lemma form of the word
         """
-        # Check cache first
-        cache_key = f"{word}:{pos}" if pos else word
-        if cache_key in self._cache:
-            return self._cache[cache_key]
-
-        # Load model if needed
-        if not self._load_model():
-            # If model can't be loaded, use simple rules
-            lemma = self._simple_lemmatize(word)
-            self._cache[cache_key] = lemma
-            return lemma
-
-        try:
-            # Process with spaCy
-            doc = self._nlp(word)
-            if doc and len(doc) > 0:
-                token = doc[0]
-                lemma = token.lemma_
-
-                # German nouns should keep capitalization
-                if token.pos_ == "NOUN" and word[0].isupper():
-                    lemma = lemma.capitalize()
-
-                self._cache[cache_key] = lemma
-                return lemma
-        except Exception as e:
-            logger.error("Error lemmatizing word", word=word, error=str(e))
-
-        # Fallback to simple rules
-        lemma = self._simple_lemmatize(word)
-        self._cache[cache_key] = lemma
-        return lemma
+        return self.lemmatize_batch([word])[0]
+
+    def lemmatize_batch(self, words: list[str]) -> list[str]:
+        """
+        Lemmatize German words with a single spaCy pass over the uncached ones
+
+        Args:
+            words: The words to lemmatize
+
+        Returns:
+            The lemma form of each word
+        """
+        return [
+            self._surface_lemma(word, analysis) if analysis and analysis.lemma else self._simple_lemmatize(word)
+            for word, analysis in zip(words, self._analyze(words), strict=True)
+        ]
+
+    def _analyze(self, words: list[str]) -> list[TokenAnalysis | None]:
+        """spaCy analyses of the words; cached analyses only if the model is unavailable"""
+        if self._model_available:
+            try:
+                return self._nlp_service.analyze_words(words, self.LANGUAGE)
+            except RuntimeError as e:
+                self._model_available = False
+                logger.warning(
+                    "[SPACY MODEL] German model not available - using simple rule-based lemmatization",
+                    model=self._nlp_service.resolve_model_name(self.LANGUAGE),
+                    error=str(e),
+                )
+            except Exception as e:
+                logger.error("Error lemmatizing words", words=len(words), error=str(e))
+
+        cache = self._nlp_service.lemma_cache
+        return [cache.get(self.LANGUAGE, word) for word in words]
+
+    def _surface_lemma(self, word: str, analysis: TokenAnalysis) -> str:
+        """German nouns should keep capitalization"""
+        if analysis.pos == "NOUN" and word[0].isupper():
+            return analysis.lemma.capitalize()
+        return analysis.lemma
 
     def _handle_special_cases(self, word_lower: str) -> str | None:
         """Handle special case words"""
@@ -164,8 +143,8 @@ class LemmatizationService:
         return self._preserve_capitalization(word, word_lower)
 
     def clear_cache(self):
-        """Clear the lemmatization cache"""
-        self._cache.clear()
+        """Clear the shared lemma cache"""
+        self._nlp_service.lemma_cache.clear()
 
 
 def get_lemmatization_service() -> LemmatizationService:
@@ -1,5 +1,16 @@
 """Media processing utilities."""
 
-from services.media.audio_extractor import extract_audio_from_video
+from services.media.audio_cache import AudioCacheError, EpisodeAudioCache, get_episode_audio_cache
+from services.media.audio_extractor import AudioExtractionError, extract_audio_array, extract_audio_from_video
+from services.media.subtitle_extractor import SubtitleExtractionError, extract_embedded_subtitles
 
-__all__ = ["extract_audio_from_video"]
+__all__ = [
+    "AudioCacheError",
+    "AudioExtractionError",
+    "EpisodeAudioCache",
+    "SubtitleExtractionError",
+    "extract_audio_array",
+    "extract_audio_from_video",
+    "extract_embedded_subtitles",
+    "get_episode_audio_cache",
+]
@@ -0,0 +1,244 @@
+"""
+Episode-level PCM audio cache.
+
+Decodes the audio track of an episode once into a raw 16 kHz mono float32 file
+and serves chunk audio as memory-mapped NumPy slices. Consecutive chunks and
+reprocessing after the vocabulary game then skip ffmpeg demux/decode entirely,
+and the slice is handed to the transcription backend without copying.
+
+Cached episodes are evicted least-recently-used once the cache directory grows
+beyond its disk quota.
+
+Usage Example:
+    ```python
+    cache = get_episode_audio_cache()
+    audio = await cache.get_chunk(Path("/videos/show/s01e01.mp4"), 300.0, 600.0)
+    result = await transcription_service.transcribe_with_progress(audio, language="de")
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import subprocess
+import tempfile
+import threading
+import weakref
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from core.config.logging_config import get_logger
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = get_logger(__name__)
+
+SAMPLE_RATE = 16000
+BYTES_PER_SAMPLE = 4  # float32
+PCM_SUFFIX = ".f32"
+
+
+class AudioCacheError(Exception):
+    """Exception for episode audio cache errors"""
+
+    pass
+
+
+class EpisodeAudioCache:
+    """
+    Disk cache of decoded episode audio with LRU eviction.
+
+    Attributes:
+        cache_dir: Directory holding raw PCM files (one per episode)
+        max_bytes: Disk quota for all cached episodes
+        sample_rate: Sample rate of cached PCM
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int, sample_rate: int = SAMPLE_RATE):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.sample_rate = sample_rate
+        # Per-episode locks, dropped once no request holds or waits on them
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+        self._locks_guard = threading.Lock()
+
+    def cache_key(self, video_file: Path) -> str:
+        """
+        Build a cache key for a video file.
+
+        The key changes whenever the file is replaced (size or mtime differ).
+        """
+        stat = video_file.stat()
+        raw = f"{video_file.resolve()}|{stat.st_size}|{stat.st_mtime_ns}|{self.sample_rate}"
+        return hashlib.sha1(raw.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+    def pcm_path(self, video_file: Path) -> Path:
+        """Path of the cached PCM file for a video"""
+        return self.cache_dir / f"{self.cache_key(video_file)}{PCM_SUFFIX}"
+
+    async def get_episode_pcm(self, video_file: Path) -> Path:
+        """
+        Get the cached PCM file for an episode, decoding it on first use.
+
+        Concurrent requests for the same episode share a single decode.
+
+        Args:
+            video_file: Source video file
+
+        Returns:
+            Path to the raw float32 PCM file
+
+        Raises:
+            AudioCacheError: If ffmpeg fails or is not installed
+        """
+        pcm_path = self.pcm_path(video_file)
+
+        async with self._lock_for(pcm_path.name):
+            if pcm_path.exists():
+                self._touch(pcm_path)
+                logger.debug("Episode audio cache hit", video=video_file.name)
+                return pcm_path
+
+            logger.info("Episode audio cache miss, decoding episode", video=video_file.name)
+            await asyncio.to_thread(self._decode_episode, video_file, pcm_path)
+            await asyncio.to_thread(self.enforce_quota, pcm_path)
+            return pcm_path
+
+    async def get_chunk(self, video_file: Path, start_time: float, end_time: float) -> np.ndarray:
+        """
+        Get chunk audio as a zero-copy memory-mapped float32 slice.
+
+        Args:
+            video_file: Source video file
+            start_time: Chunk start in seconds
+            end_time: Chunk end in seconds
+
+        Returns:
+            Read-only float32 array of 16 kHz mono samples
+
+        Raises:
+            AudioCacheError: If the episode cannot be decoded or the range holds no audio
+        """
+        import numpy as np
+
+        pcm_path = await self.get_episode_pcm(video_file)
+
+        episode = np.memmap(pcm_path, dtype=np.float32, mode="r")
+        first = max(0, int(start_time * self.sample_rate))
+        last = min(len(episode), int(end_time * self.sample_rate))
+        if last <= first:
+            raise AudioCacheError(
+                f"No audio in range {start_time}-{end_time}s of {video_file.name} "
+                f"(episode audio is {len(episode) / self.sample_rate:.1f}s long)"
+            )
+        return episode[first:last]
+
+    def enforce_quota(self, keep: Path | None = None) -> None:
+        """
+        Evict least-recently-used episodes until the cache fits its quota.
+
+        Args:
+            keep: File that must survive eviction (the one just added)
+        """
+        entries = []
+        for path in self.cache_dir.glob(f"*{PCM_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if keep is not None and path == keep:
+                continue
+            try:
+                path.unlink()
+                total -= size
+                logger.debug("Evicted cached episode audio", path=path.name, size=size)
+            except OSError as e:
+                # Still memory-mapped by a running transcription (Windows) - retry next time
+                logger.warning("Failed to evict cached audio", path=path.name, error=str(e))
+
+    def _decode_episode(self, video_file: Path, pcm_path: Path) -> None:
+        """Decode the whole audio track to raw float32 PCM (runs in a worker thread)"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(suffix=".partial", dir=self.cache_dir)
+        os.close(fd)
+
+        cmd = [
+            "ffmpeg",
+            "-i",
+            str(video_file),
+            "-vn",  # No video
+            "-f",
+            "f32le",  # Raw float32 little-endian, directly mappable by NumPy
+            "-acodec",
+            "pcm_f32le",
+            "-ar",
+            str(self.sample_rate),
+            "-ac",
+            "1",  # Mono channel
+            "-y",
+            tmp_name,
+        ]
+
+        try:
+            result = subprocess.run(cmd, check=False, capture_output=True, timeout=1800)
+            if result.returncode != 0:
+                error_msg = result.stderr.decode("utf-8", errors="replace") if result.stderr else "Unknown ffmpeg error"
+                raise AudioCacheError(f"FFmpeg failed to decode audio of {video_file.name}: {error_msg}")
+            if Path(tmp_name).stat().st_size == 0:
+                raise AudioCacheError(f"No audio track found in {video_file.name}")
+            Path(tmp_name).replace(pcm_path)
+        except FileNotFoundError as e:
+            raise AudioCacheError("FFmpeg is not installed or not in PATH") from e
+        except subprocess.TimeoutExpired as e:
+            raise AudioCacheError(f"Decoding audio of {video_file.name} timed out") from e
+        finally:
+            Path(tmp_name).unlink(missing_ok=True)
+
+        logger.info("Cached episode audio", video=video_file.name, size=pcm_path.stat().st_size)
+
+    def _lock_for(self, key: str) -> asyncio.Lock:
+        with self._locks_guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = asyncio.Lock()
+            return lock
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        """Mark an entry as recently used (LRU order is based on mtime)"""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+
+_episode_audio_cache: EpisodeAudioCache | None = None
+
+
+def get_episode_audio_cache() -> EpisodeAudioCache:
+    """
+    Get the process-wide episode audio cache.
+
+    Configured by LANGPLUG_AUDIO_CACHE_DIR (default: <temp>/langplug/audio_cache)
+    and LANGPLUG_AUDIO_CACHE_MAX_MB.
+    """
+    global _episode_audio_cache
+    if _episode_audio_cache is None:
+        from core.config import settings
+
+        cache_dir = (
+            Path(settings.audio_cache_dir)
+            if settings.audio_cache_dir
+            else Path(tempfile.gettempdir()) / "langplug" / "audio_cache"
+        )
+        _episode_audio_cache = EpisodeAudioCache(cache_dir, settings.audio_cache_max_mb * 1024 * 1024)
+    return _episode_audio_cache
@@ -1,24 +1,52 @@
 """
 Audio extraction utilities for video files.
 
-Provides centralized video-to-audio conversion using MoviePy
-to eliminate code duplication across transcription services.
+Provides centralized video-to-audio conversion for all transcription services.
+Audio is decoded by an ffmpeg subprocess that streams PCM straight to a WAV
+file or into memory, so full episodes are never loaded as a clip object.
+
+Key Components:
+    - extract_audio_from_video: Decode (a range of) the audio track to a WAV file
+    - extract_audio_array: Decode (a range of) the audio track to a float32 array
+
+Performance Notes:
+    - Time ranges use ffmpeg input seeking; only the requested range is decoded
+    - Memory use is bounded by the output, not by the size of the video
+    - The ffmpeg binary on PATH is preferred; the imageio-ffmpeg binary bundled
+      with moviepy is used when none is installed
 """
 
 from __future__ import annotations
 
+import shutil
+import subprocess
 import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from core.config.logging_config import get_logger
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = get_logger(__name__)
 
+NO_AUDIO_MARKERS = ("matches no streams", "does not contain any stream")
+
+
+class AudioExtractionError(Exception):
+    """Exception for ffmpeg audio extraction errors"""
+
+    pass
+
 
 def extract_audio_from_video(
     video_path: str | Path,
     output_path: str | Path | None = None,
     sample_rate: int = 16000,
+    *,
+    start_time: float | None = None,
+    end_time: float | None = None,
 ) -> str:
     """
     Extract audio track from video file.
@@ -27,48 +55,136 @@ def extract_audio_from_video(
         video_path: Path to input video file
         output_path: Path for output audio file (auto-generated if None)
         sample_rate: Audio sample rate in Hz (16000 for most ML models)
+        start_time: Start of the range to extract in seconds (default: beginning)
+        end_time: End of the range to extract in seconds (default: end of file)
 
     Returns:
-        Path to extracted audio file
+        Path to extracted audio file (16-bit mono WAV)
 
     Raises:
         ValueError: If video has no audio track
-        ImportError: If moviepy is not installed
+        AudioExtractionError: If ffmpeg is missing or fails
     """
-    try:
-        from moviepy.editor import VideoFileClip
-    except ImportError:
-        # Fallback for older moviepy versions
-        try:
-            from moviepy import VideoFileClip
-        except ImportError as e:
-            raise ImportError(
-                "moviepy is required for video audio extraction. Install with: pip install moviepy"
-            ) from e
-
     # Generate output path if not provided
     if output_path is None:
-        output_path = tempfile.NamedTemporaryFile(suffix=".wav", delete=False).name
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+            output_path = tmp.name
     else:
         output_path = str(output_path)
 
     video_path_str = str(video_path)
-    logger.debug("Extracting audio", video=video_path_str)
+    logger.debug("Extracting audio", video=video_path_str, start=start_time, end=end_time)
+
+    output_args = ["-acodec", "pcm_s16le", "-y", output_path]
+    _run_ffmpeg(video_path_str, sample_rate, start_time, end_time, output_args)
+
+    logger.debug("Audio extracted", output=output_path)
+    return output_path
 
-    # Load video and extract audio
-    video = VideoFileClip(video_path_str)
-    audio = video.audio
 
-    if audio is None:
-        video.close()
-        raise ValueError(f"No audio track found in {video_path_str}")
+def extract_audio_array(
+    video_path: str | Path,
+    sample_rate: int = 16000,
+    *,
+    start_time: float | None = None,
+    end_time: float | None = None,
+) -> np.ndarray:
+    """
+    Extract audio track from video file into memory.
 
-    # Write audio file with specified sample rate
-    # logger=None suppresses moviepy's verbose output
-    audio.write_audiofile(output_path, fps=sample_rate, logger=None)
+    Args:
+        video_path: Path to input video file
+        sample_rate: Audio sample rate in Hz (16000 for most ML models)
+        start_time: Start of the range to extract in seconds (default: beginning)
+        end_time: End of the range to extract in seconds (default: end of file)
 
-    # Clean up resources
-    video.close()
+    Returns:
+        Float32 array of mono samples in [-1.0, 1.0]
 
-    logger.debug("Audio extracted", output=output_path)
-    return output_path
+    Raises:
+        ValueError: If video has no audio track
+        AudioExtractionError: If ffmpeg is missing or fails
+    """
+    import numpy as np
+
+    video_path_str = str(video_path)
+    logger.debug("Extracting audio to memory", video=video_path_str, start=start_time, end=end_time)
+
+    output_args = ["-f", "f32le", "-acodec", "pcm_f32le", "pipe:1"]
+    pcm = _run_ffmpeg(video_path_str, sample_rate, start_time, end_time, output_args)
+
+    audio = np.frombuffer(pcm, dtype="<f4")
+    logger.debug("Audio extracted to memory", samples=len(audio))
+    return audio
+
+
+def get_ffmpeg_binary() -> str:
+    """
+    Locate the ffmpeg executable.
+
+    Raises:
+        AudioExtractionError: If neither a system nor a bundled ffmpeg is available
+    """
+    system_ffmpeg = shutil.which("ffmpeg")
+    if system_ffmpeg:
+        return system_ffmpeg
+
+    try:
+        import imageio_ffmpeg
+
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except (ImportError, RuntimeError) as e:
+        raise AudioExtractionError(
+            "FFmpeg is required for audio extraction. Install ffmpeg or: pip install imageio-ffmpeg"
+        ) from e
+
+
+def build_ffmpeg_command(
+    ffmpeg: str,
+    video_path: str,
+    sample_rate: int,
+    start_time: float | None,
+    end_time: float | None,
+    output_args: list[str],
+) -> list[str]:
+    """Build an ffmpeg command decoding the first audio stream to mono PCM"""
+    cmd = [ffmpeg, "-nostdin", "-loglevel", "error"]
+    if start_time:
+        cmd += ["-ss", str(start_time)]  # Input seeking: skip straight to the range
+    cmd += ["-i", video_path]
+    if end_time is not None:
+        cmd += ["-t", str(max(0.0, end_time - (start_time or 0.0)))]
+    cmd += [
+        "-map",
+        "0:a:0",  # First audio stream only
+        "-vn",
+        "-ar",
+        str(sample_rate),
+        "-ac",
+        "1",  # Mono channel
+    ]
+    return cmd + output_args
+
+
+def _run_ffmpeg(
+    video_path: str,
+    sample_rate: int,
+    start_time: float | None,
+    end_time: float | None,
+    output_args: list[str],
+) -> bytes:
+    """Run ffmpeg and return its stdout, mapping failures to extractor errors"""
+    cmd = build_ffmpeg_command(get_ffmpeg_binary(), video_path, sample_rate, start_time, end_time, output_args)
+
+    try:
+        result = subprocess.run(cmd, check=False, capture_output=True)
+    except FileNotFoundError as e:
+        raise AudioExtractionError("FFmpeg is not installed or not in PATH") from e
+
+    if result.returncode != 0:
+        error_msg = result.stderr.decode("utf-8", errors="replace").strip() if result.stderr else "Unknown error"
+        if any(marker in error_msg for marker in NO_AUDIO_MARKERS):
+            raise ValueError(f"No audio track found in {video_path}")
+        raise AudioExtractionError(f"FFmpeg failed to extract audio from {video_path}: {error_msg}")
+
+    return result.stdout
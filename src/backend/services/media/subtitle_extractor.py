@@ -0,0 +1,208 @@
+"""
+Embedded subtitle extraction for video files.
+
+Many MKV/MP4 episodes carry text subtitle streams. Extracting such a stream
+to SRT takes one demux pass with ffmpeg; afterwards every chunk of the
+episode can be served from the SRT instead of running speech recognition.
+
+Key Components:
+    - probe_subtitle_streams: List the subtitle streams of a video
+    - select_subtitle_stream: Pick the text stream for a spoken language
+    - extract_subtitle_stream: Convert one stream to an SRT file
+    - extract_embedded_subtitles: Probe, select and extract, cached per video
+
+Usage Example:
+    ```python
+    srt_path = extract_embedded_subtitles(video_file, "de", video_file.with_suffix(".embedded.de.srt"))
+    if srt_path is None:
+        ...  # No German text subtitles embedded - transcribe instead
+    ```
+
+Performance Notes:
+    - Probing only reads the container header (milliseconds)
+    - Probe results are memoized per (path, size, mtime) in-process
+    - Extraction happens once per video; an existing SRT newer than the video is reused
+    - Bitmap subtitles (PGS, VobSub, DVB) need OCR and are ignored
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from core.config.logging_config import get_logger
+from services.media.audio_extractor import get_ffmpeg_binary
+
+logger = get_logger(__name__)
+
+# Codecs ffmpeg can convert to SRT without OCR
+TEXT_SUBTITLE_CODECS = frozenset({"subrip", "srt", "ass", "ssa", "mov_text", "webvtt", "text"})
+
+# ISO 639-1 (user preferences) -> ISO 639-2 tags used in containers
+LANGUAGE_TAGS: dict[str, tuple[str, ...]] = {
+    "de": ("ger", "deu"),
+    "en": ("eng",),
+    "es": ("spa",),
+    "fr": ("fre", "fra"),
+    "zh": ("chi", "zho"),
+}
+
+UNTAGGED_LANGUAGES = frozenset({"", "und"})
+
+# e.g. "  Stream #0:2[0x3](ger): Subtitle: subrip (default) (forced)"
+_STREAM_PATTERN = re.compile(r"Stream #\d+:(\d+)(?:\[\w+\])?(?:\((\w+)\))?: Subtitle: (\w+)(.*)$")
+
+
+class SubtitleExtractionError(Exception):
+    """Exception for ffmpeg subtitle extraction errors"""
+
+    pass
+
+
+@dataclass(frozen=True)
+class SubtitleStream:
+    """A subtitle stream of a video container"""
+
+    index: int  # Absolute stream index in the container
+    codec: str
+    language: str  # Container tag ("ger", "eng", ...), "" if untagged
+    forced: bool = False
+
+    @property
+    def is_text(self) -> bool:
+        return self.codec in TEXT_SUBTITLE_CODECS
+
+
+def probe_subtitle_streams(video_path: str | Path) -> tuple[SubtitleStream, ...]:
+    """
+    List the subtitle streams of a video.
+
+    Returns:
+        Subtitle streams in container order (empty if there are none or probing failed)
+    """
+    path = Path(video_path)
+    stat = path.stat()
+    return _probe_subtitle_streams(str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _probe_subtitle_streams(video_path: str, size: int, mtime_ns: int) -> tuple[SubtitleStream, ...]:
+    """Parse the stream listing ffmpeg prints for an input (size/mtime only key the cache)"""
+    cmd = [get_ffmpeg_binary(), "-hide_banner", "-nostdin", "-i", video_path]
+    try:
+        # Without an output ffmpeg exits non-zero after printing the input description
+        result = subprocess.run(cmd, check=False, capture_output=True, timeout=60)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.warning("Could not probe subtitle streams", video=video_path, error=str(e))
+        return ()
+
+    streams = []
+    for line in result.stderr.decode("utf-8", errors="replace").splitlines():
+        match = _STREAM_PATTERN.search(line)
+        if match:
+            index, language, codec, flags = match.groups()
+            streams.append(
+                SubtitleStream(index=int(index), codec=codec, language=language or "", forced="(forced)" in flags)
+            )
+    return tuple(streams)
+
+
+def select_subtitle_stream(streams: tuple[SubtitleStream, ...], language: str) -> SubtitleStream | None:
+    """
+    Pick the text subtitle stream for a spoken language.
+
+    Forced streams (only foreign-language dialogue) are skipped. A stream tagged
+    with the language wins over an untagged one; streams tagged with another
+    language are never used.
+    """
+    tags = LANGUAGE_TAGS.get(language, (language,))
+    candidates = [stream for stream in streams if stream.is_text and not stream.forced]
+
+    for stream in candidates:
+        if stream.language in tags or stream.language == language:
+            return stream
+    for stream in candidates:
+        if stream.language in UNTAGGED_LANGUAGES:
+            return stream
+    return None
+
+
+def extract_subtitle_stream(video_path: str | Path, stream_index: int, output_path: str | Path) -> Path:
+    """
+    Convert one subtitle stream of a video to an SRT file.
+
+    The file is written atomically, so concurrent extractions of the same video are safe.
+
+    Raises:
+        SubtitleExtractionError: If ffmpeg is missing or fails
+    """
+    output_path = Path(output_path)
+    fd, tmp_name = tempfile.mkstemp(suffix=".srt", dir=output_path.parent)
+    os.close(fd)
+    cmd = [
+        get_ffmpeg_binary(),
+        "-nostdin",
+        "-loglevel",
+        "error",
+        "-i",
+        str(video_path),
+        "-map",
+        f"0:{stream_index}",
+        "-c:s",
+        "srt",
+        "-f",
+        "srt",
+        "-y",
+        tmp_name,
+    ]
+
+    try:
+        # Subtitle packets are spread over the whole container, so ffmpeg has to demux all of it
+        result = subprocess.run(cmd, check=False, capture_output=True, timeout=600)
+        if result.returncode != 0:
+            error_msg = result.stderr.decode("utf-8", errors="replace").strip() or "Unknown error"
+            raise SubtitleExtractionError(f"FFmpeg failed to extract subtitles from {video_path}: {error_msg}")
+        Path(tmp_name).replace(output_path)
+    except FileNotFoundError as e:
+        raise SubtitleExtractionError("FFmpeg is not installed or not in PATH") from e
+    except subprocess.TimeoutExpired as e:
+        raise SubtitleExtractionError(f"Extracting subtitles from {video_path} timed out") from e
+    finally:
+        Path(tmp_name).unlink(missing_ok=True)
+
+    return output_path
+
+
+def extract_embedded_subtitles(video_path: str | Path, language: str, output_path: str | Path) -> Path | None:
+    """
+    Extract the embedded subtitles of a video for a spoken language, once.
+
+    Args:
+        video_path: Video container (MKV, MP4, ...)
+        language: Spoken language as ISO 639-1 code
+        output_path: Cached SRT location; reused while it is newer than the video
+
+    Returns:
+        Path to the SRT, or None if the video has no matching text subtitle stream
+
+    Raises:
+        SubtitleExtractionError: If ffmpeg fails to extract a stream that exists
+    """
+    video_path = Path(video_path)
+    output_path = Path(output_path)
+    if output_path.is_file() and output_path.stat().st_mtime_ns >= video_path.stat().st_mtime_ns:
+        return output_path
+
+    stream = select_subtitle_stream(probe_subtitle_streams(video_path), language)
+    if stream is None:
+        return None
+
+    logger.info(
+        "Extracting embedded subtitles", video=video_path.name, stream=stream.index, codec=stream.codec, lang=language
+    )
+    return extract_subtitle_stream(video_path, stream.index, output_path)
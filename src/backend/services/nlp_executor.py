@@ -0,0 +1,116 @@
+"""
+Process-pool executor for spaCy analysis.
+
+spaCy holds the GIL while it tags, so analyzing the subtitles of a file in a
+worker thread keeps the event loop responsive but uses one core at most. With
+LANGPLUG_SPACY_WORKER_PROCESSES > 0 the texts are split across a persistent
+pool of worker processes instead. Each worker loads its own model on first
+use and keeps it for the lifetime of the pool.
+
+Usage Example:
+    ```python
+    # Per subtitle text: lowercased token text -> TokenAnalysis
+    analyses = await analyze_texts_async([subtitle.original_text for subtitle in subtitles], "de")
+    ```
+
+Performance Notes:
+    - Every worker holds a full copy of the model (hundreds of MB for *_lg models)
+    - Files with fewer than MIN_TEXTS_PER_TASK texts per worker use fewer workers
+    - Workers are started with "spawn", which is safe in a process running threads
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from core.config.logging_config import get_logger
+from services.lemma_cache import TokenAnalysis
+from services.lemma_resolver import analyze_texts
+
+logger = get_logger(__name__)
+
+# Smallest share of a file worth sending to a separate worker process
+MIN_TEXTS_PER_TASK = 64
+
+_executor: ProcessPoolExecutor | None = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def get_nlp_executor() -> ProcessPoolExecutor | None:
+    """
+    Get the process-wide spaCy worker pool.
+
+    Returns:
+        Shared ProcessPoolExecutor (created lazily), or None if
+        LANGPLUG_SPACY_WORKER_PROCESSES is 0
+    """
+    global _executor, _executor_workers
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                from core.config import settings
+
+                workers = settings.spacy_worker_processes
+                if workers <= 0:
+                    return None
+                _executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+                _executor_workers = workers
+                logger.info("Created spaCy worker pool", workers=workers)
+    return _executor
+
+
+def shutdown_nlp_executor() -> None:
+    """Shut down the spaCy worker pool (used on application shutdown and in tests)"""
+    global _executor, _executor_workers
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+            _executor_workers = 0
+
+
+def _split(texts: list[str], parts: int) -> list[list[str]]:
+    """Split texts into at most `parts` contiguous slices of similar size"""
+    parts = max(1, min(parts, len(texts) // MIN_TEXTS_PER_TASK))
+    size, remainder = divmod(len(texts), parts)
+    slices, start = [], 0
+    for index in range(parts):
+        end = start + size + (1 if index < remainder else 0)
+        slices.append(texts[start:end])
+        start = end
+    return slices
+
+
+async def analyze_texts_async(texts: list[str], language_code: str) -> list[dict[str, TokenAnalysis]]:
+    """
+    Run analyze_texts off the event loop, across worker processes if configured.
+
+    Args:
+        texts: Subtitle texts (original casing)
+        language_code: Language of the texts
+
+    Returns:
+        Per text, a mapping of lowercased token text to its analysis
+
+    Raises:
+        RuntimeError: If the spaCy model is unavailable
+    """
+    executor = get_nlp_executor()
+    if executor is None or not texts:
+        return await asyncio.to_thread(analyze_texts, texts, language_code)
+
+    loop = asyncio.get_running_loop()
+    slices = _split(texts, _executor_workers)
+    results = await asyncio.gather(
+        *(loop.run_in_executor(executor, partial(analyze_texts, part, language_code, n_process=1)) for part in slices)
+    )
+    logger.debug("Analyzed texts in spaCy workers", texts=len(texts), tasks=len(slices))
+    return [analysis for part in results for analysis in part]
+
+
+__all__ = ["analyze_texts_async", "get_nlp_executor", "shutdown_nlp_executor"]
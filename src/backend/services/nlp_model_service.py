@@ -0,0 +1,250 @@
+"""
+Shared NLP Model Service
+
+Single owner of the spaCy pipelines in the process. Vocabulary filtering
+(lemma_resolver) and vocabulary lookups (LemmatizationService) both get their
+models and word analyses here, so a worker holds one pipeline per language and
+both paths produce the same lemmas.
+
+Key Components:
+    - NLPModelService: Model resolution and loading, batched word analysis
+    - get_nlp_model_service: Process-wide service instance
+
+Usage Example:
+    ```python
+    nlp_service = get_nlp_model_service()
+
+    lemmas = nlp_service.lemmatize_batch(["ging", "Häuser"], "de")  # ["gehen", "haus"]
+    nlp = nlp_service.get_model("de")  # The same pipeline every caller uses
+    ```
+
+Configuration:
+    LANGPLUG_SPACY_MODEL_DE / LANGPLUG_SPACY_MODEL_EN choose the model per
+    language. LANGPLUG_SPACY_MODEL_SIZE (sm, md, lg) overrides the size of every
+    model, e.g. "sm" on memory-constrained workers (de_core_news_sm needs about
+    a tenth of the RAM of de_core_news_lg, at slightly lower tagging accuracy).
+    LANGPLUG_SPACY_PIPELINE_PROFILE "vocabulary" (default) leaves out components
+    vocabulary filtering does not use, such as the dependency parser; "full"
+    loads every component.
+
+Thread Safety:
+    Yes. Model loading is serialized by a lock; analyses go through the
+    thread-safe lemma cache.
+
+Performance Notes:
+    - Each model is loaded once per process
+    - analyze_words answers cached words without spaCy and runs one nlp.pipe pass over the rest
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from typing import Any
+
+from core.config.logging_config import get_logger
+from core.language_preferences import SPACY_MODEL_MAP
+from services.lemma_cache import LemmaCache, TokenAnalysis, get_lemma_cache
+
+logger = get_logger(__name__)
+
+SPACY_MODEL_SIZES = ("sm", "md", "lg")
+
+# Components left out of the loaded pipeline per profile. Vocabulary filtering only
+# needs tokenizer, tok2vec, tagger/morphologizer, attribute_ruler, lemmatizer and NER.
+SPACY_PIPELINE_PROFILES: dict[str, tuple[str, ...]] = {
+    "full": (),
+    "vocabulary": ("parser", "senter", "textcat", "textcat_multilabel", "spancat", "entity_linker"),
+}
+
+_SIZE_SUFFIX = re.compile(r"_(sm|md|lg|trf)$")
+
+
+class NLPModelService:
+    """
+    Loads and shares spaCy pipelines and analyzes isolated words with them.
+
+    Attributes:
+        model_size: Size that overrides every configured model, or None to use the names as configured
+        pipeline_profile: Name of the SPACY_PIPELINE_PROFILES entry applied when loading models
+    """
+
+    def __init__(
+        self,
+        model_size: str | None = None,
+        lemma_cache: LemmaCache | None = None,
+        pipeline_profile: str = "vocabulary",
+    ):
+        if model_size is not None and model_size not in SPACY_MODEL_SIZES:
+            raise ValueError(f"Unsupported spaCy model size '{model_size}'. Use one of: {', '.join(SPACY_MODEL_SIZES)}")
+        if pipeline_profile not in SPACY_PIPELINE_PROFILES:
+            raise ValueError(
+                f"Unsupported spaCy pipeline profile '{pipeline_profile}'. "
+                f"Use one of: {', '.join(SPACY_PIPELINE_PROFILES)}"
+            )
+
+        self.model_size = model_size
+        self.pipeline_profile = pipeline_profile
+        self._lemma_cache = lemma_cache
+        self._models: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def lemma_cache(self) -> LemmaCache:
+        """Cache of word analyses (default: process-wide lemma cache)"""
+        return self._lemma_cache if self._lemma_cache is not None else get_lemma_cache()
+
+    def resolve_model_name(self, language_code: str) -> str:
+        """
+        Resolve the spaCy model name for a language.
+
+        Reads settings on every call so that debug-time overrides
+        (e.g. switching to de_core_news_sm) are honored.
+        """
+        from core.config import settings
+
+        language_code = (language_code or "").lower()
+        language_to_model = {
+            "de": settings.spacy_model_de or SPACY_MODEL_MAP.get("de", SPACY_MODEL_MAP["default"]),
+            "en": settings.spacy_model_en or SPACY_MODEL_MAP.get("en", SPACY_MODEL_MAP["default"]),
+        }
+        model_name = language_to_model.get(
+            language_code, SPACY_MODEL_MAP.get(language_code, SPACY_MODEL_MAP["default"])
+        )
+
+        if self.model_size and _SIZE_SUFFIX.search(model_name):
+            model_name = _SIZE_SUFFIX.sub(f"_{self.model_size}", model_name)
+        return model_name
+
+    def load_model(self, model_name: str) -> Any:
+        """
+        Load a spaCy model once per process.
+
+        Raises:
+            RuntimeError: If spaCy or the model is unavailable
+        """
+        with self._lock:
+            if model_name in self._models:
+                return self._models[model_name]
+
+            try:
+                import spacy
+
+                # Excluded components are not loaded at all, which also saves their memory
+                nlp = spacy.load(model_name, exclude=list(SPACY_PIPELINE_PROFILES[self.pipeline_profile]))
+                logger.info(
+                    "Loaded spaCy model successfully",
+                    model=model_name,
+                    profile=self.pipeline_profile,
+                    components=nlp.pipe_names,
+                )
+            except ImportError as exc:
+                raise RuntimeError("spaCy is required for lemmatization. Install it with: pip install spacy") from exc
+            except OSError as exc:
+                logger.error(
+                    "[SPACY MODEL ERROR] Cannot load model - vocabulary filtering disabled",
+                    model=model_name,
+                    fix=f"python -m spacy download {model_name}",
+                    error=str(exc),
+                )
+                raise RuntimeError(
+                    f"Failed to load spaCy model '{model_name}'. Install it with: python -m spacy download {model_name}"
+                ) from exc
+            except Exception as exc:
+                logger.error(
+                    "[SPACY ERROR] Unexpected error loading model",
+                    model=model_name,
+                    error=str(exc),
+                )
+                raise RuntimeError(
+                    f"Failed to load spaCy model '{model_name}'. Install it with: python -m spacy download {model_name}"
+                ) from exc
+
+            self._models[model_name] = nlp
+            return nlp
+
+    def get_model(self, language_code: str) -> Any:
+        """Get the shared spaCy pipeline for a language (raises RuntimeError if unavailable)"""
+        return self.load_model(self.resolve_model_name(language_code))
+
+    def loaded_models(self) -> list[str]:
+        """Names of the models loaded in this process"""
+        with self._lock:
+            return list(self._models)
+
+    def analyze_words(self, words: list[str], language_code: str) -> list[TokenAnalysis | None]:
+        """
+        Analyze isolated words, using the lemma cache.
+
+        Uncached words are analyzed in a single nlp.pipe pass; the model is only
+        loaded if there are any.
+
+        Args:
+            words: Words as they appear in the text
+            language_code: Language of the words
+
+        Returns:
+            Per word, its analysis, or None if spaCy produced no tokens
+
+        Raises:
+            RuntimeError: If the spaCy model is needed but unavailable
+        """
+        cache = self.lemma_cache
+        analyses: dict[str, TokenAnalysis | None] = {}
+        for word in words:
+            if word not in analyses:
+                analyses[word] = cache.get(language_code, word)
+
+        missing = [word for word, analysis in analyses.items() if analysis is None]
+        if missing:
+            nlp = self.get_model(language_code)
+            computed = {}
+            for word, doc in zip(missing, nlp.pipe(missing), strict=True):
+                if len(doc) == 0:
+                    continue
+                token = doc[0]
+                # Common NER labels: PER (person), ORG (organization), LOC (location), GPE (geopolitical entity)
+                is_entity = any(ent.start <= token.i < ent.end for ent in doc.ents)
+                computed[word] = TokenAnalysis(lemma=token.lemma_.strip().lower(), pos=token.pos_, is_entity=is_entity)
+            cache.put_many(language_code, computed)
+            analyses.update(computed)
+
+        return [analyses[word] for word in words]
+
+    def lemmatize_batch(self, words: list[str], language_code: str) -> list[str | None]:
+        """
+        Lemmatize isolated words.
+
+        Returns:
+            Per word, its lowercase lemma, or None if spaCy could not produce one
+
+        Raises:
+            RuntimeError: If the spaCy model is needed but unavailable
+        """
+        return [
+            analysis.lemma if analysis and analysis.lemma else None
+            for analysis in self.analyze_words(words, language_code)
+        ]
+
+
+_nlp_model_service: NLPModelService | None = None
+
+
+def get_nlp_model_service() -> NLPModelService:
+    """
+    Get the process-wide NLP model service.
+
+    Configured by LANGPLUG_SPACY_MODEL_DE, LANGPLUG_SPACY_MODEL_EN, LANGPLUG_SPACY_MODEL_SIZE
+    and LANGPLUG_SPACY_PIPELINE_PROFILE.
+    """
+    global _nlp_model_service
+    if _nlp_model_service is None:
+        from core.config import settings
+
+        _nlp_model_service = NLPModelService(
+            model_size=settings.spacy_model_size, pipeline_profile=settings.spacy_pipeline_profile
+        )
+    return _nlp_model_service
+
+
+__all__ = ["SPACY_MODEL_SIZES", "SPACY_PIPELINE_PROFILES", "NLPModelService", "get_nlp_model_service"]
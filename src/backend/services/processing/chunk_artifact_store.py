@@ -0,0 +1,182 @@
+"""
+Chunk Artifact Store
+
+Shares the user-independent results of chunk processing across users.
+Audio extraction, transcription and full-segment translation only depend on
+the episode, the time range, the language pair and the models - not on who is
+watching. The store computes each artifact once and hands it to every later
+request, so only vocabulary filtering and subtitle highlighting run per user.
+
+Key Components:
+    - ChunkArtifactStore: In-process LRU of artifacts with single-flight computation
+    - get_chunk_artifact_store: Process-wide store instance
+
+Usage Example:
+    ```python
+    store = get_chunk_artifact_store()
+    key = store.make_key("transcript", video_file, 0.0, 300.0, "de", "faster-whisper-turbo")
+
+    # Concurrent callers with the same key share one computation
+    srt_content = await store.get_or_compute(key, transcribe_chunk)
+    ```
+
+Thread Safety:
+    Single event loop only. In-flight computations are tracked with asyncio futures.
+
+Performance Notes:
+    - Hit: O(1) dictionary lookup, no ffmpeg/ASR/MT work
+    - Concurrent misses for the same key wait for the first computation instead of repeating it
+    - Failed computations are not stored; the next request recomputes
+    - A cancelled computation is taken over by the first waiting request
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from core.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+ArtifactKey = tuple[Any, ...]
+
+# Result of an in-flight computation whose owner was cancelled; waiters retry
+_ABANDONED = object()
+
+
+class ChunkArtifactStore:
+    """
+    LRU store of user-independent chunk artifacts.
+
+    Attributes:
+        max_entries: Maximum number of artifacts kept in memory
+        stats: Counters for hits, misses, shared in-flight computations and evictions
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0, "shared": 0, "evictions": 0}
+        self._entries: OrderedDict[ArtifactKey, Any] = OrderedDict()
+        self._pending: dict[ArtifactKey, asyncio.Future] = {}
+
+    @staticmethod
+    def make_key(kind: str, video_file: Path, start_time: float, end_time: float, *parts: Any) -> ArtifactKey:
+        """
+        Build an artifact key.
+
+        Args:
+            kind: Artifact type (e.g. "transcript", "translation")
+            video_file: Source video; its size and mtime are part of the key
+            start_time: Chunk start in seconds
+            end_time: Chunk end in seconds
+            *parts: Everything else the artifact depends on (languages, models, options)
+        """
+        stat = video_file.stat()
+        return (
+            kind,
+            str(video_file.resolve()),
+            stat.st_size,
+            stat.st_mtime_ns,
+            round(start_time, 3),
+            round(end_time, 3),
+            *parts,
+        )
+
+    async def get_or_compute(self, key: ArtifactKey, compute: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return the artifact for key, computing it at most once.
+
+        Args:
+            key: Artifact key from make_key()
+            compute: Coroutine factory producing the artifact on a miss
+
+        Returns:
+            The stored or freshly computed artifact
+
+        Raises:
+            Whatever compute() raised, for the computing request and every request waiting on it.
+            If the computing request is cancelled, the first waiter takes over the computation.
+        """
+        while True:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                logger.debug("Shared chunk artifact hit", kind=key[0])
+                return self._entries[key]
+
+            pending = self._pending.get(key)
+            if pending is None:
+                break
+
+            self.stats["shared"] += 1
+            logger.debug("Waiting for in-flight chunk artifact", kind=key[0])
+            value = await asyncio.shield(pending)
+            if value is not _ABANDONED:
+                return value
+            logger.debug("In-flight chunk artifact was cancelled, taking over", kind=key[0])
+
+        self.stats["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            value = await compute()
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Waiters (if any) re-raise it; don't warn when there are none
+            raise
+        except BaseException:
+            # Cancelled (e.g. by the prefetcher): another user may be waiting, so hand over instead of failing
+            future.set_result(_ABANDONED)
+            raise
+        finally:
+            self._pending.pop(key, None)
+
+        future.set_result(value)
+        self._store(key, value)
+        return value
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with hits, misses, shared computations, evictions and hit ratio
+        """
+        reused = self.stats["hits"] + self.stats["shared"]
+        total = reused + self.stats["misses"]
+        hit_ratio = (reused / total * 100) if total > 0 else 0
+
+        return {**self.stats, "entries": len(self._entries), "total": total, "hit_ratio": f"{hit_ratio:.1f}%"}
+
+    def clear(self) -> None:
+        """Drop all stored artifacts (in-flight computations are unaffected)"""
+        self._entries.clear()
+
+    def _store(self, key: ArtifactKey, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+            logger.debug("Evicted shared chunk artifact", kind=evicted[0])
+
+
+_chunk_artifact_store: ChunkArtifactStore | None = None
+
+
+def get_chunk_artifact_store() -> ChunkArtifactStore:
+    """
+    Get the process-wide chunk artifact store.
+
+    Sized by LANGPLUG_CHUNK_ARTIFACT_CACHE_SIZE.
+    """
+    global _chunk_artifact_store
+    if _chunk_artifact_store is None:
+        from core.config import settings
+
+        _chunk_artifact_store = ChunkArtifactStore(settings.chunk_artifact_cache_size)
+    return _chunk_artifact_store
@@ -0,0 +1,206 @@
+"""
+Chunk Prefetcher
+
+Speculatively prepares the next chunk of an episode while the user plays the
+vocabulary game for the current one. Users work through an episode chunk
+after chunk, so once chunk N is done the user-independent work for chunk N+1
+(audio extraction, transcription, full translation) is started in the
+background and stored in the shared chunk artifact store. When the user
+requests chunk N+1, process_chunk finds the artifacts ready - or joins the
+computation still in flight.
+
+Key Components:
+    - ChunkPrefetcher: Tracks one prefetch task per user and the interactive load
+    - get_chunk_prefetcher: Process-wide prefetcher instance
+
+Scheduling Rules:
+    - At most one prefetch per user; scheduling a new one cancels the previous one
+    - An interactive request for a different chunk cancels the user's prefetch
+    - Prefetch work only starts while no interactive request is running
+    - An interactive request preempts running prefetches: they are cancelled, which
+      stops their decode loop (see decoding_bridge) and frees the decoding and
+      translation workers, and restart once no interactive request is running.
+      Shared artifacts they completed before are reused from the artifact store.
+    - A prefetch of the chunk the interactive request wants is not preempted, so
+      the request can join it
+
+Usage Example:
+    ```python
+    prefetcher = get_chunk_prefetcher()
+
+    async with prefetcher.interactive(keep=(str(video_file), 0.0, 1200.0)):
+        await process_current_chunk()
+
+    prefetcher.schedule(user_id, (str(video_file), 1200.0, 2400.0), prepare_next_chunk)
+    ```
+
+Thread Safety:
+    Single event loop only.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from core.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# (video path, start time, end time)
+PrefetchTarget = tuple[str, float, float]
+
+
+class ChunkPrefetcher:
+    """
+    Low-priority background preparation of upcoming chunks.
+
+    Attributes:
+        stats: Counters for scheduled, completed, cancelled, failed and preempted prefetches
+    """
+
+    def __init__(self):
+        self.stats = {"scheduled": 0, "completed": 0, "cancelled": 0, "failed": 0, "preempted": 0}
+        self._tasks: dict[int, tuple[PrefetchTarget, asyncio.Task]] = {}
+        # Running prefetch attempts and their targets; cancelled when an interactive request starts
+        self._attempts: dict[asyncio.Task, PrefetchTarget] = {}
+        self._interactive_requests = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    @asynccontextmanager
+    async def interactive(self, keep: PrefetchTarget | None = None) -> AsyncIterator[None]:
+        """Mark an interactive request as running; prefetches yield until none are"""
+        self.begin_interactive(keep)
+        try:
+            yield
+        finally:
+            self.end_interactive()
+
+    def begin_interactive(self, keep: PrefetchTarget | None = None) -> None:
+        """
+        Register the start of an interactive request (prefer interactive() where possible).
+
+        Running prefetches are preempted and restart once no interactive request is running.
+
+        Args:
+            keep: Chunk the request is for; a prefetch of it keeps running so the request can join it
+        """
+        self._interactive_requests += 1
+        self._idle.clear()
+        for attempt, target in self._attempts.items():
+            if target != keep and not attempt.done():
+                attempt.cancel()
+                self.stats["preempted"] += 1
+
+    def end_interactive(self) -> None:
+        """Register the end of an interactive request"""
+        self._interactive_requests -= 1
+        if self._interactive_requests == 0:
+            self._idle.set()
+
+    async def wait_for_idle(self) -> None:
+        """Block a prefetch until no interactive request is running"""
+        await self._idle.wait()
+
+    def schedule(
+        self, user_id: int, target: PrefetchTarget, prefetch: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Task | None:
+        """
+        Start prefetching a chunk for a user, replacing any previous prefetch.
+
+        Args:
+            user_id: User the chunk is prefetched for
+            target: (video path, start time, end time) of the chunk
+            prefetch: Coroutine factory doing the work; it is restarted from the beginning when
+                preempted, so it should reuse whatever it stored in the artifact store
+
+        Returns:
+            The background task, or None if the same chunk is already being prefetched
+        """
+        current = self._tasks.get(user_id)
+        if current is not None and current[0] == target and not current[1].done():
+            return None
+        self.cancel_for_user(user_id)
+
+        async def run() -> None:
+            try:
+                while True:
+                    await self.wait_for_idle()
+                    attempt = asyncio.create_task(prefetch())
+                    self._attempts[attempt] = target
+                    try:
+                        await attempt
+                        break
+                    except asyncio.CancelledError:
+                        if asyncio.current_task().cancelling() or not attempt.cancelled():
+                            raise
+                        # Preempted by an interactive request: start over once it is done
+                        logger.debug("Prefetch preempted", user_id=user_id, start=target[1])
+                    finally:
+                        self._attempts.pop(attempt, None)
+                self.stats["completed"] += 1
+                logger.info("Prefetched chunk", user_id=user_id, video=target[0], start=target[1], end=target[2])
+            except asyncio.CancelledError:
+                self.stats["cancelled"] += 1
+                logger.debug("Prefetch cancelled", user_id=user_id, start=target[1])
+                raise
+            except Exception as e:
+                # Speculative work: the interactive request will simply compute it again
+                self.stats["failed"] += 1
+                logger.warning("Prefetch failed", user_id=user_id, video=target[0], start=target[1], error=str(e))
+            finally:
+                entry = self._tasks.get(user_id)
+                if entry is not None and entry[1] is asyncio.current_task():
+                    del self._tasks[user_id]
+
+        task = asyncio.create_task(run(), name=f"prefetch-{user_id}-{target[1]:.0f}")
+        self._tasks[user_id] = (target, task)
+        self.stats["scheduled"] += 1
+        logger.debug("Scheduled chunk prefetch", user_id=user_id, video=target[0], start=target[1], end=target[2])
+        return task
+
+    def cancel_for_user(self, user_id: int, keep: PrefetchTarget | None = None) -> bool:
+        """
+        Cancel the user's prefetch unless it targets the chunk in keep.
+
+        Args:
+            user_id: User whose prefetch should be cancelled
+            keep: Chunk the user is requesting now; its prefetch keeps running so the request can join it
+
+        Returns:
+            True if a prefetch was cancelled
+        """
+        entry = self._tasks.get(user_id)
+        if entry is None:
+            return False
+
+        target, task = entry
+        if keep is not None and target == keep:
+            return False
+
+        del self._tasks[user_id]
+        if task.done():
+            return False
+        task.cancel()
+        return True
+
+    def cancel_all(self) -> None:
+        """Cancel every pending prefetch (e.g. on shutdown)"""
+        for user_id in list(self._tasks):
+            self.cancel_for_user(user_id)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get prefetch statistics including the number of running prefetches"""
+        return {**self.stats, "running": len(self._tasks), "interactive": self._interactive_requests}
+
+
+_chunk_prefetcher: ChunkPrefetcher | None = None
+
+
+def get_chunk_prefetcher() -> ChunkPrefetcher:
+    """Get the process-wide chunk prefetcher"""
+    global _chunk_prefetcher
+    if _chunk_prefetcher is None:
+        _chunk_prefetcher = ChunkPrefetcher()
+    return _chunk_prefetcher
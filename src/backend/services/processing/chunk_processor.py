@@ -46,6 +46,13 @@ Performance Notes:
     - Transcription: ~5-10 seconds per 30s chunk (depends on model)
     - Translation: ~2-5 seconds for 10-20 segments
     - Total: ~10-20 seconds per 30s chunk
+    - Artifact sharing (LANGPLUG_CHUNK_ARTIFACT_SHARING_ENABLED): transcript and full translation
+      are computed once per (video, range, language pair, model); later users only pay for
+      vocabulary filtering and subtitle generation (sub-second)
+    - Prefetch (LANGPLUG_CHUNK_PREFETCH_ENABLED): chunk N+1 is prepared in the background
+      after chunk N, yielding to interactive requests and cancelled when the user jumps elsewhere
+    - Sidecar subtitles (subtitle source policy prefer_sidecar): steps 1-2 are replaced by slicing
+      the video's existing subtitles to the chunk range
 
 Architecture Notes:
     - Database operations are handled by delegated services using their own sessions
@@ -53,14 +60,20 @@ Architecture Notes:
     - Each service manages its own transactional boundaries for atomicity
 """
 
+import hashlib
+import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.config import settings
 from core.config.logging_config import get_logger
 from services.interfaces.handler_interface import IChunkHandler
 
+from .chunk_artifact_store import ChunkArtifactStore, get_chunk_artifact_store
+from .chunk_prefetcher import ChunkPrefetcher, get_chunk_prefetcher
 from .chunk_transcription_service import ChunkTranscriptionService
 from .chunk_translation_service import ChunkTranslationService
 from .chunk_utilities import ChunkUtilities
@@ -70,6 +83,8 @@ from .vocabulary_filter_service import get_vocabulary_filter_service
 
 logger = get_logger(__name__)
 
+DEFAULT_CHUNK_DURATION_MINUTES = 20
+
 
 class ChunkProcessingError(Exception):
     """Base exception for chunk processing errors"""
@@ -92,6 +107,8 @@ class ChunkProcessingService(IChunkHandler):
         vocabulary_filter: Service for filtering vocabulary from subtitles
         subtitle_generator: Service for generating filtered subtitle files
         translation_manager: Service for managing translations
+        artifact_store (ChunkArtifactStore | None): Shared user-independent artifacts (None = disabled)
+        prefetcher (ChunkPrefetcher | None): Background preparation of the next chunk (None = disabled)
 
     Example:
         ```python
@@ -125,6 +142,8 @@ class ChunkProcessingService(IChunkHandler):
         vocabulary_filter=None,
         subtitle_generator=None,
         translation_manager=None,
+        artifact_store: ChunkArtifactStore | None = None,
+        prefetcher: ChunkPrefetcher | None = None,
     ):
         """Initialize with optional dependency injection.
 
@@ -136,6 +155,10 @@ class ChunkProcessingService(IChunkHandler):
             vocabulary_filter: Service for filtering vocabulary from subtitles
             subtitle_generator: Service for generating filtered subtitle files
             translation_manager: Service for managing translations
+            artifact_store: Store sharing transcripts and translations across users.
+                Defaults to the shared store when LANGPLUG_CHUNK_ARTIFACT_SHARING_ENABLED is set.
+            prefetcher: Prefetcher preparing the next chunk into the artifact store.
+                Defaults to the shared prefetcher when LANGPLUG_CHUNK_PREFETCH_ENABLED is set.
 
         Note:
             If services are not provided, defaults are created.
@@ -153,6 +176,14 @@ class ChunkProcessingService(IChunkHandler):
         self.subtitle_generator = subtitle_generator or get_subtitle_generation_service()
         self.translation_manager = translation_manager or get_translation_management_service()
 
+        if artifact_store is None and settings.chunk_artifact_sharing_enabled:
+            artifact_store = get_chunk_artifact_store()
+        self.artifact_store = artifact_store
+
+        if prefetcher is None and settings.chunk_prefetch_enabled and artifact_store is not None:
+            prefetcher = get_chunk_prefetcher()
+        self.prefetcher = prefetcher
+
     async def process_chunk(
         self,
         video_path: str,
@@ -181,24 +212,43 @@ class ChunkProcessingService(IChunkHandler):
             Database operations are handled by delegated services using their own sessions.
             This orchestration layer coordinates file I/O and ML inference without transaction overhead.
         """
+        audio_file = None
+        interactive = False
         try:
             # Resolve video path and initialize progress
             video_file = self.utilities.resolve_video_path(video_path)
+            if self.prefetcher is not None:
+                # Interactive work takes precedence: running prefetches yield the workers until it is done.
+                # A prefetch of exactly this chunk keeps running so we can join it.
+                target = (str(video_file), start_time, end_time)
+                self.prefetcher.begin_interactive(keep=target)
+                interactive = True
+                self.prefetcher.cancel_for_user(user_id, keep=target)
             self.utilities.initialize_progress(task_id, task_progress, video_file, start_time, end_time, user_id)
 
             # Authenticate user
             user = await self.utilities.get_authenticated_user(user_id, session_token)
             language_preferences = self.utilities.load_user_language_preferences(user)
 
-            # Step 1: Extract audio chunk (0-20% progress)
-            audio_file = await self.transcription_service.extract_audio_chunk(
-                task_id, task_progress, video_file, start_time, end_time
-            )
-
-            # Step 2: Transcribe chunk (5-35% progress)
-            srt_file = await self.transcription_service.transcribe_chunk(
-                task_id, task_progress, video_file, audio_file, language_preferences, start_time, end_time
+            # Steps 1-2 replaced by existing subtitles when the video's policy prefers them
+            srt_file = await self.transcription_service.load_sidecar_chunk(
+                task_id, task_progress, video_file, start_time, end_time, language_preferences
             )
+            if srt_file is None and self.artifact_store is not None:
+                # Steps 1-2 shared across users: reuse or compute the chunk transcript
+                srt_file = await self._get_shared_transcript(
+                    task_id, task_progress, video_file, start_time, end_time, language_preferences
+                )
+            elif srt_file is None:
+                # Step 1: Extract audio chunk (0-20% progress)
+                audio_file = await self.transcription_service.extract_audio_chunk(
+                    task_id, task_progress, video_file, start_time, end_time
+                )
+
+                # Step 2: Transcribe chunk (5-35% progress)
+                srt_file = await self.transcription_service.transcribe_chunk(
+                    task_id, task_progress, video_file, audio_file, language_preferences, start_time, end_time
+                )
 
             # Step 3: Filter vocabulary (35-65% progress)
             vocabulary = await self._filter_vocabulary(task_id, task_progress, srt_file, user, language_preferences)
@@ -210,12 +260,8 @@ class ChunkProcessingService(IChunkHandler):
             )
 
             # Step 5: Build translation segments (95-100% progress)
-            translation_segments = await self.translation_service.build_translation_segments(
-                task_id,
-                task_progress,
-                srt_file,
-                vocabulary,
-                language_preferences,
+            translation_segments = await self._build_translation_segments(
+                task_id, task_progress, video_file, start_time, end_time, srt_file, vocabulary, language_preferences
             )
 
             # Step 6: Write translation segments to file
@@ -245,18 +291,205 @@ class ChunkProcessingService(IChunkHandler):
             )
 
             # Cleanup temporary audio file if it was created
-            self.transcription_service.cleanup_temp_audio_file(audio_file, video_file)
+            if audio_file is not None:
+                self.transcription_service.cleanup_temp_audio_file(audio_file, video_file)
 
             # Cleanup old chunk files
             self.utilities.cleanup_old_chunk_files(video_file, start_time, end_time)
 
+            # Prepare the next chunk while the user plays the vocabulary game
+            self._schedule_prefetch(user, user_id, video_file, end_time, language_preferences)
+
         except Exception as e:
             logger.error("Chunk processing failed", task_id=task_id, error=str(e), exc_info=True)
             # Cleanup temporary audio file on error
-            if "audio_file" in locals():
+            if audio_file is not None:
                 self.transcription_service.cleanup_temp_audio_file(audio_file, video_file)
             self.utilities.handle_error(task_id, task_progress, e)
             raise
+        finally:
+            if interactive:
+                self.prefetcher.end_interactive()
+
+    async def _get_shared_transcript(
+        self,
+        task_id: str,
+        task_progress: dict[str, Any],
+        video_file: Path,
+        start_time: float,
+        end_time: float,
+        language_preferences: dict[str, Any],
+    ) -> str:
+        """
+        Get the chunk transcript from the artifact store and write it as the chunk SRT
+
+        The SRT is (re)written for this request so downstream per-user steps read it
+        from the usual location.
+
+        Returns:
+            Path to the chunk SRT file
+        """
+        srt_content = await self._get_shared_transcript_text(
+            task_id, task_progress, video_file, start_time, end_time, language_preferences
+        )
+
+        srt_file = video_file.with_suffix(".srt")
+        srt_file.write_text(srt_content, encoding="utf-8")
+
+        task_progress[task_id].progress = 35
+        task_progress[task_id].message = "Transcription complete"
+        return str(srt_file)
+
+    async def _get_shared_transcript_text(
+        self,
+        task_id: str,
+        task_progress: dict[str, Any],
+        video_file: Path,
+        start_time: float,
+        end_time: float,
+        language_preferences: dict[str, Any],
+    ) -> str:
+        """
+        Get the chunk transcript (SRT content), extracting and transcribing on a miss
+
+        The transcript is user-independent: it depends on the video, the range, the spoken
+        language and the ASR model/options only.
+        """
+        source_lang = language_preferences.get("target") or settings.default_language
+        key = self.artifact_store.make_key(
+            "transcript",
+            video_file,
+            start_time,
+            end_time,
+            source_lang,
+            settings.transcription_service,
+            tuple(sorted(self.transcription_service.decoding_options().items())),
+        )
+
+        async def extract_and_transcribe() -> str:
+            audio_file = await self.transcription_service.extract_audio_chunk(
+                task_id, task_progress, video_file, start_time, end_time
+            )
+            try:
+                # Private output file: a prefetch must not overwrite the SRT of the chunk in use
+                with tempfile.TemporaryDirectory(prefix="langplug_chunk_") as tmp_dir:
+                    srt_file = await self.transcription_service.transcribe_chunk(
+                        task_id,
+                        task_progress,
+                        video_file,
+                        audio_file,
+                        language_preferences,
+                        start_time,
+                        end_time,
+                        srt_output=Path(tmp_dir) / "chunk.srt",
+                    )
+                    return Path(srt_file).read_text(encoding="utf-8")
+            finally:
+                self.transcription_service.cleanup_temp_audio_file(audio_file, video_file)
+
+        return await self.artifact_store.get_or_compute(key, extract_and_transcribe)
+
+    async def _build_translation_segments(
+        self,
+        task_id: str,
+        task_progress: dict[str, Any],
+        video_file: Path,
+        start_time: float,
+        end_time: float,
+        srt_file: str,
+        vocabulary: list,
+        language_preferences: dict[str, Any],
+    ) -> list:
+        """
+        Build translation segments - shared across users when the artifact store is enabled
+
+        Users without vocabulary get no translation file, exactly as without sharing.
+        """
+        if self.artifact_store is None or not vocabulary:
+            return await self.translation_service.build_translation_segments(
+                task_id, task_progress, srt_file, vocabulary, language_preferences
+            )
+
+        srt_content = Path(srt_file).read_text(encoding="utf-8")
+        return await self._get_shared_translation(
+            task_id, task_progress, video_file, start_time, end_time, srt_content, language_preferences
+        )
+
+    async def _get_shared_translation(
+        self,
+        task_id: str,
+        task_progress: dict[str, Any],
+        video_file: Path,
+        start_time: float,
+        end_time: float,
+        srt_content: str,
+        language_preferences: dict[str, Any],
+    ) -> list:
+        """
+        Get the full-segment translation of a chunk, translating on a miss
+
+        All subtitle segments are translated regardless of the user's vocabulary, so the
+        result only depends on the subtitles (ASR transcript or sidecar) and the language pair.
+        """
+        source_lang = language_preferences.get("target", "de")
+        target_lang = language_preferences.get("native", "en")
+        key = self.artifact_store.make_key(
+            "translation",
+            video_file,
+            start_time,
+            end_time,
+            source_lang,
+            target_lang,
+            hashlib.sha256(srt_content.encode("utf-8")).hexdigest(),
+            self.translation_service.get_model_name(source_lang, target_lang),
+        )
+
+        async def translate() -> tuple:
+            from utils.srt_parser import SRTParser
+
+            subtitle_segments = SRTParser.parse_content(srt_content)
+            segments = await self.translation_service.translate_all_segments(
+                task_id, task_progress, subtitle_segments, language_preferences
+            )
+            return tuple(segments)
+
+        segments = await self.artifact_store.get_or_compute(key, translate)
+        return list(segments)
+
+    def _schedule_prefetch(
+        self, user, user_id: int, video_file: Path, end_time: float, language_preferences: dict[str, Any]
+    ) -> None:
+        """
+        Speculatively prepare the chunk following [.., end_time) for this user
+
+        Uses the user's chunk_duration_minutes. The final chunk of an episode is clamped to
+        the video length by the client, so its range (and key) may differ and simply miss.
+        """
+        if self.prefetcher is None or self.artifact_store is None:
+            return
+
+        chunk_minutes = getattr(user, "chunk_duration_minutes", None)
+        if not isinstance(chunk_minutes, int | float) or chunk_minutes <= 0:
+            chunk_minutes = DEFAULT_CHUNK_DURATION_MINUTES
+        next_start = end_time
+        next_end = end_time + chunk_minutes * 60
+
+        async def prefetch() -> None:
+            task_id = f"prefetch_{user_id}"
+            task_progress = {task_id: SimpleNamespace(progress=0.0, current_step="", message="")}
+            srt_content = await self.transcription_service.get_sidecar_chunk_text(
+                video_file, next_start, next_end, language_preferences
+            )
+            if srt_content is None:
+                srt_content = await self._get_shared_transcript_text(
+                    task_id, task_progress, video_file, next_start, next_end, language_preferences
+                )
+            await self.prefetcher.wait_for_idle()
+            await self._get_shared_translation(
+                task_id, task_progress, video_file, next_start, next_end, srt_content, language_preferences
+            )
+
+        self.prefetcher.schedule(user_id, (str(video_file), next_start, next_end), prefetch)
 
     async def _filter_vocabulary(
         self,
@@ -11,7 +11,7 @@ Key Components:
     - SRT file generation from transcription segments
 
 Processing Steps:
-    1. Extract audio chunk using FFmpeg (PCM 16kHz mono)
+    1. Extract audio chunk using FFmpeg (PCM 16kHz mono), or slice it from the episode audio cache
     2. Transcribe using Whisper model (language-specific)
     3. Convert segments to SRT format
     4. Cleanup temporary audio files
@@ -55,7 +55,14 @@ Thread Safety:
 
 Performance Notes:
     - Audio extraction: ~2-5 seconds per 30s chunk (I/O bound)
+    - Fast seek (LANGPLUG_AUDIO_FAST_SEEK): extraction time independent of chunk offset
+    - Streaming (LANGPLUG_AUDIO_STREAM_TO_MEMORY): PCM piped from ffmpeg, no temp WAV write/read
     - Transcription: ~5-10 seconds per 30s chunk (GPU accelerated if available)
+    - Batched decoding (LANGPLUG_TRANSCRIPTION_BATCH_SIZE > 0): multi-x faster on long chunks
+    - Result cache (LANGPLUG_TRANSCRIPTION_CACHE_ENABLED): reprocessed chunks skip ASR entirely
+    - Sidecar subtitles (LANGPLUG_SUBTITLE_SOURCE_POLICY=prefer_sidecar): existing subtitles are
+      sliced to the chunk range, skipping audio extraction and ASR (milliseconds instead of minutes)
+    - Embedded text subtitle streams are extracted once per video and used like a sidecar file
     - FFmpeg timeout: 600 seconds (10 minutes)
     - Audio format: PCM 16-bit 16kHz mono (optimized for speech recognition)
 
@@ -67,15 +74,30 @@ Error Handling:
 
 import asyncio
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Union
 
 # Lazy import to avoid circular dependencies
 from core.config import settings
 from core.config.logging_config import get_logger
 from services.interfaces.transcription_interface import IChunkTranscriptionService
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from services.media.audio_cache import EpisodeAudioCache
+    from services.processing.subtitle_source_policy import SubtitleSourcePolicyStore
+    from services.transcriptionservice.result_cache import TranscriptionResultCache
+
 logger = get_logger(__name__)
 
+# Extracted chunk audio: temporary WAV file or in-memory 16kHz mono float32 samples
+ChunkAudio = Union[Path, "np.ndarray"]
+
+
+def is_in_memory_audio(audio: Any) -> bool:
+    """Check whether chunk audio is an in-memory sample array rather than a file path"""
+    return not isinstance(audio, str | Path)
+
 
 class ChunkTranscriptionError(Exception):
     """Exception for chunk transcription errors"""
@@ -94,11 +116,11 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
         ```python
         service = ChunkTranscriptionService()
 
-        # Extract audio (creates .wav file)
+        # Extract audio (float32 samples in memory; .wav file when streaming is disabled)
         audio = await service.extract_audio_chunk(
             "task_1", progress, Path("video.mp4"), 0.0, 30.0
         )
-        # Creates: video_chunk_0s_30s.wav
+        # File mode creates: video_chunk_0s_30s.wav
 
         # Transcribe (creates .srt file)
         srt = await service.transcribe_chunk(
@@ -118,14 +140,126 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
         Automatically handles temporary file cleanup on success and error.
     """
 
+    def __init__(
+        self,
+        batch_size: int | None = None,
+        fast_seek: bool | None = None,
+        seek_preroll: float | None = None,
+        audio_cache: "EpisodeAudioCache | None" = None,
+        stream_to_memory: bool | None = None,
+        result_cache: "TranscriptionResultCache | None" = None,
+        subtitle_policy: "SubtitleSourcePolicyStore | None" = None,
+    ):
+        """
+        Initialize chunk transcription service
+
+        Args:
+            batch_size: Batch size for batched decoding (0 = sequential).
+                Defaults to LANGPLUG_TRANSCRIPTION_BATCH_SIZE.
+            fast_seek: Use ffmpeg input seeking (-ss before -i) so late chunks don't decode
+                the file from the start. Defaults to LANGPLUG_AUDIO_FAST_SEEK.
+            seek_preroll: Seconds before start_time to input-seek to, followed by an accurate
+                output seek over the pre-roll only. Defaults to LANGPLUG_AUDIO_SEEK_PREROLL_SECONDS.
+            audio_cache: Episode audio cache serving chunks as memory-mapped slices.
+                Defaults to the shared cache when LANGPLUG_AUDIO_CACHE_ENABLED is set.
+            stream_to_memory: Pipe PCM from ffmpeg's stdout into memory instead of writing a
+                temporary WAV file. Defaults to LANGPLUG_AUDIO_STREAM_TO_MEMORY.
+            result_cache: Transcription result cache short-circuiting repeated transcriptions.
+                Defaults to the shared cache when LANGPLUG_TRANSCRIPTION_CACHE_ENABLED is set.
+            subtitle_policy: Per-video choice between sidecar subtitles and ASR.
+                Defaults to the shared store (default policy: LANGPLUG_SUBTITLE_SOURCE_POLICY).
+        """
+        self.batch_size = settings.transcription_batch_size if batch_size is None else batch_size
+        self.fast_seek = settings.audio_fast_seek if fast_seek is None else fast_seek
+        self.seek_preroll = settings.audio_seek_preroll_seconds if seek_preroll is None else seek_preroll
+        self.stream_to_memory = settings.audio_stream_to_memory if stream_to_memory is None else stream_to_memory
+
+        if audio_cache is None and settings.audio_cache_enabled:
+            from services.media.audio_cache import get_episode_audio_cache
+
+            audio_cache = get_episode_audio_cache()
+        self.audio_cache = audio_cache
+
+        if result_cache is None and settings.transcription_cache_enabled:
+            from services.transcriptionservice.result_cache import get_transcription_result_cache
+
+            result_cache = get_transcription_result_cache()
+        self.result_cache = result_cache
+
+        if subtitle_policy is None:
+            from services.processing.subtitle_source_policy import get_subtitle_source_policy_store
+
+            subtitle_policy = get_subtitle_source_policy_store()
+        self.subtitle_policy = subtitle_policy
+
+    def _build_ffmpeg_command(
+        self, video_file: Path, start_time: float, duration: float, output: Path | None
+    ) -> list[str]:
+        """
+        Build the ffmpeg command extracting [start_time, start_time + duration) as 16kHz mono PCM
+
+        Output seeking (-i video -ss start) decodes everything from 0 to start, so its cost grows
+        with the chunk offset. Input seeking (-ss start -i video) jumps to the nearest keyframe
+        first and keeps extraction time flat regardless of where the chunk starts.
+
+        Args:
+            video_file: Source video file
+            start_time: Chunk start in seconds
+            duration: Chunk duration in seconds
+            output: Output WAV path, or None to write raw PCM to stdout
+
+        Returns:
+            ffmpeg argument list
+        """
+        if self.fast_seek:
+            preroll = max(0.0, min(self.seek_preroll, start_time))
+            seek_args = ["-ss", str(start_time - preroll), "-i", str(video_file)]
+            if preroll > 0:
+                # Accurate output seek, but only across the short pre-roll window
+                seek_args += ["-ss", str(preroll)]
+        else:
+            seek_args = ["-i", str(video_file), "-ss", str(start_time)]
+
+        if output is None:
+            # Raw samples on stdout, no container
+            output_args = ["-f", "s16le", "pipe:1"]
+        else:
+            output_args = ["-y", str(output)]  # Overwrite output file
+
+        return [
+            "ffmpeg",
+            *seek_args,
+            "-t",
+            str(duration),
+            "-vn",  # No video
+            "-acodec",
+            "pcm_s16le",  # PCM 16-bit little-endian
+            "-ar",
+            "16000",  # 16kHz sample rate for speech recognition
+            "-ac",
+            "1",  # Mono channel
+            *output_args,
+        ]
+
     async def extract_audio_chunk(
         self, task_id: str, task_progress: dict[str, Any], video_file: Path, start_time: float, end_time: float
-    ) -> Path:
-        """Extract audio chunk from video using ffmpeg"""
+    ) -> ChunkAudio:
+        """
+        Extract audio chunk from video using ffmpeg
+
+        Returns a memory-mapped sample array when the episode audio cache is enabled,
+        an in-memory sample array when streaming to memory, or a temporary WAV file.
+        """
         task_progress[task_id].progress = 5
         task_progress[task_id].current_step = "Extracting audio chunk..."
         task_progress[task_id].message = "Isolating audio for this segment"
 
+        if self.audio_cache is not None:
+            return await self._load_cached_chunk(video_file, start_time, end_time)
+
+        if self.stream_to_memory:
+            return await self._extract_to_memory(video_file, start_time, end_time)
+
         # Create output audio file path
         duration = end_time - start_time
         audio_output = video_file.parent / f"{video_file.stem}_chunk_{start_time}s_{end_time}s.wav"
@@ -134,64 +268,11 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
 
         try:
             # Build ffmpeg command for audio extraction
-            cmd = [
-                "ffmpeg",
-                "-i",
-                str(video_file),
-                "-ss",
-                str(start_time),
-                "-t",
-                str(duration),
-                "-vn",  # No video
-                "-acodec",
-                "pcm_s16le",  # PCM 16-bit little-endian
-                "-ar",
-                "16000",  # 16kHz sample rate for speech recognition
-                "-ac",
-                "1",  # Mono channel
-                "-y",  # Overwrite output file
-                str(audio_output),
-            ]
-
-            # On Windows, check if we can use async subprocess or need workaround
-            import sys
-
-            process = None
-            if sys.platform == "win32":
-                loop = asyncio.get_running_loop()
-                if not isinstance(loop, asyncio.ProactorEventLoop):
-                    # SelectorEventLoop doesn't support subprocesses - use sync fallback
-                    logger.debug("Using sync subprocess fallback for Windows")
-                    import concurrent.futures
-                    import subprocess
-
-                    def run_ffmpeg_sync():
-                        result = subprocess.run(cmd, check=False, capture_output=True, timeout=600)
-                        return result.returncode, result.stdout, result.stderr
-
-                    with concurrent.futures.ThreadPoolExecutor() as pool:
-                        returncode, _stdout, stderr = await loop.run_in_executor(pool, run_ffmpeg_sync)
-
-                    # Create a fake process object for compatibility
-                    class FakeProcess:
-                        def __init__(self, rc):
-                            self.returncode = rc
+            cmd = self._build_ffmpeg_command(video_file, start_time, duration, audio_output)
 
-                    process = FakeProcess(returncode)
-                else:
-                    # ProactorEventLoop supports async subprocesses
-                    process = await asyncio.create_subprocess_exec(
-                        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-                    )
-                    _stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=600)
-            else:
-                # Unix systems support async subprocesses normally
-                process = await asyncio.create_subprocess_exec(
-                    *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-                )
-                _stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=600)
+            returncode, _stdout, stderr = await self._run_ffmpeg(cmd)
 
-            if process.returncode != 0:
+            if returncode != 0:
                 error_msg = stderr.decode("utf-8", errors="replace") if stderr else "Unknown ffmpeg error"
                 logger.error("FFmpeg failed", video=str(video_file), error=error_msg)
                 # Clean up partial output file if it exists
@@ -244,15 +325,6 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
 
         except TimeoutError as e:
             logger.error("FFmpeg timed out", video=str(video_file))
-            # Kill the process if it exists and has a kill method
-            if process is not None and hasattr(process, "kill"):
-                try:
-                    process.kill()
-                    if hasattr(process, "wait"):
-                        await process.wait()
-                    logger.debug("Killed timed-out FFmpeg process")
-                except Exception as kill_error:
-                    logger.warning("Failed to kill process", error=str(kill_error))
             # Clean up partial output file
             if audio_output.exists():
                 try:
@@ -277,21 +349,141 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
             logger.error("Audio extraction error", error=str(e), exc_info=True)
             raise ChunkTranscriptionError(f"Audio extraction failed: {e}") from e
 
+    async def _extract_to_memory(self, video_file: Path, start_time: float, end_time: float) -> "np.ndarray":
+        """
+        Extract chunk audio by piping raw PCM from ffmpeg's stdout into a float32 array
+
+        Avoids writing a WAV next to the video and reading it back for transcription.
+        """
+        import numpy as np
+
+        duration = end_time - start_time
+        logger.debug("Extracting audio to memory", video=str(video_file), start=start_time, end=end_time)
+
+        cmd = self._build_ffmpeg_command(video_file, start_time, duration, output=None)
+
+        try:
+            returncode, stdout, stderr = await self._run_ffmpeg(cmd)
+        except FileNotFoundError as e:
+            logger.error("FFmpeg not found - cannot extract audio chunk")
+            raise ChunkTranscriptionError(
+                "FFmpeg is not installed or not in PATH. "
+                "Please install FFmpeg to enable video chunk processing. "
+                "See: https://ffmpeg.org/download.html"
+            ) from e
+        except TimeoutError as e:
+            logger.error("FFmpeg timed out", video=str(video_file))
+            raise ChunkTranscriptionError(f"Audio extraction timed out for {video_file.name}") from e
+        except Exception as e:
+            logger.error("Audio extraction error", error=str(e), exc_info=True)
+            raise ChunkTranscriptionError(f"Audio extraction failed: {e}") from e
+
+        if returncode != 0:
+            error_msg = stderr.decode("utf-8", errors="replace") if stderr else "Unknown ffmpeg error"
+            logger.error("FFmpeg failed", video=str(video_file), error=error_msg)
+            raise ChunkTranscriptionError(
+                f"FFmpeg audio extraction failed for {video_file.name}. "
+                f"Video path: {video_file}. Error: {error_msg}"
+            )
+
+        if not stdout:
+            logger.error("FFmpeg produced no audio", video=str(video_file))
+            raise ChunkTranscriptionError(
+                f"Audio extraction failed: FFmpeg produced no audio samples. "
+                f"The video segment {start_time}-{end_time}s may not contain audio. "
+                f"Video: {video_file.name}"
+            )
+
+        # s16le -> float32 in [-1, 1), the format Whisper models expect
+        usable = len(stdout) - (len(stdout) % 2)
+        audio = np.frombuffer(stdout[:usable], dtype=np.int16).astype(np.float32) / 32768.0
+
+        logger.debug("Audio extracted to memory", video=video_file.name, samples=len(audio))
+        return audio
+
+    async def _run_ffmpeg(self, cmd: list[str]) -> tuple[int, bytes, bytes]:
+        """
+        Run ffmpeg and collect its output
+
+        Kills the process if it exceeds the 600 second timeout or the caller is cancelled.
+
+        Returns:
+            Tuple of (returncode, stdout, stderr)
+
+        Raises:
+            FileNotFoundError: If ffmpeg is not installed
+            TimeoutError: If ffmpeg timed out
+        """
+        # On Windows, check if we can use async subprocess or need workaround
+        import sys
+
+        if sys.platform == "win32":
+            loop = asyncio.get_running_loop()
+            if not isinstance(loop, asyncio.ProactorEventLoop):
+                # SelectorEventLoop doesn't support subprocesses - use sync fallback
+                logger.debug("Using sync subprocess fallback for Windows")
+                import concurrent.futures
+                import subprocess
+
+                def run_ffmpeg_sync():
+                    try:
+                        result = subprocess.run(cmd, check=False, capture_output=True, timeout=600)
+                    except subprocess.TimeoutExpired as e:
+                        raise TimeoutError(str(e)) from e
+                    return result.returncode, result.stdout, result.stderr
+
+                with concurrent.futures.ThreadPoolExecutor() as pool:
+                    return await loop.run_in_executor(pool, run_ffmpeg_sync)
+
+        # Unix and ProactorEventLoop support async subprocesses normally
+        process = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=600)
+        except (TimeoutError, asyncio.CancelledError):
+            # Kill the process so it doesn't linger (also when the request/prefetch is cancelled)
+            try:
+                process.kill()
+                await process.wait()
+                logger.debug("Killed timed-out FFmpeg process")
+            except Exception as kill_error:
+                logger.warning("Failed to kill process", error=str(kill_error))
+            raise
+        return process.returncode, stdout, stderr
+
+    async def _load_cached_chunk(self, video_file: Path, start_time: float, end_time: float) -> "np.ndarray":
+        """Serve chunk audio from the episode cache (decodes the episode on first use)"""
+        from services.media.audio_cache import AudioCacheError
+
+        try:
+            audio = await self.audio_cache.get_chunk(video_file, start_time, end_time)
+        except AudioCacheError as e:
+            logger.error("Episode audio cache failed", video=str(video_file), error=str(e))
+            raise ChunkTranscriptionError(f"Audio extraction failed: {e}") from e
+
+        logger.debug("Audio chunk served from episode cache", video=video_file.name, samples=len(audio))
+        return audio
+
     async def transcribe_chunk(
         self,
         task_id: str,
         task_progress: dict[str, Any],
         video_file: Path,
-        audio_file: Path,
+        audio_file: ChunkAudio,
         language_preferences: dict[str, Any] | None = None,
         start_time: float = 0,
         end_time: float = 30,
+        srt_output: Path | None = None,
     ) -> str:
         """
         Transcribe the audio chunk to text with REAL progress tracking.
 
         Uses transcribe_with_progress() for actual progress updates based on
-        transcribed audio duration, not time-based estimates.
+        transcribed audio duration, not time-based estimates. When the result cache
+        holds this (video, range, model, language, options), ASR is skipped entirely.
+
+        The SRT is written to srt_output, or next to the video (video.srt) by default.
         """
         task_progress[task_id].progress = 5
         target_language = language_preferences.get("target") if language_preferences else settings.default_language
@@ -306,9 +498,23 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
             raise ChunkTranscriptionError("Transcription service is not available. Please check server configuration.")
 
         try:
+            srt_output = srt_output or video_file.with_suffix(".srt")
+
+            cache_key = self._result_cache_key(transcription_service, video_file, start_time, end_time, target_language)
+            if cache_key is not None:
+                cached_result = self.result_cache.get(cache_key)
+                if cached_result is not None:
+                    self._create_srt_from_segments(cached_result.segments, srt_output)
+                    task_progress[task_id].progress = 35
+                    task_progress[task_id].message = "Transcription loaded from cache"
+                    logger.info("Transcription cache hit", video=video_file.name, segments=len(cached_result.segments))
+                    return str(srt_output)
+
             # Transcribe the audio chunk
-            if audio_file != video_file:  # We have an actual audio file
-                logger.info("Transcribing audio chunk", path=str(audio_file))
+            in_memory = is_in_memory_audio(audio_file)
+            if in_memory or audio_file != video_file:  # We have actual audio
+                audio_input = audio_file if in_memory else str(audio_file)
+                logger.info("Transcribing audio chunk", path="<memory>" if in_memory else str(audio_file))
 
                 # Create progress callback that maps 0-1 fraction to 5-35% range
                 # This provides REAL progress based on actual transcription, not estimates
@@ -320,15 +526,22 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
                     task_progress[task_id].message = message
                     logger.debug("Transcription progress", percent=progress, message=message)
 
-                # Use transcribe_with_progress for REAL progress tracking
+                # Use *_with_progress for REAL progress tracking
                 # This yields actual progress as audio is transcribed, not estimates
-                transcription_result = await transcription_service.transcribe_with_progress(
-                    str(audio_file), language=target_language, progress_callback=transcription_progress_callback
-                )
+                if self.batch_size > 0:
+                    # Batched decoding: VAD windows decoded batch_size at a time (faster on long chunks)
+                    transcription_result = await transcription_service.transcribe_batched_with_progress(
+                        audio_input,
+                        language=target_language,
+                        progress_callback=transcription_progress_callback,
+                        batch_size=self.batch_size,
+                    )
+                else:
+                    transcription_result = await transcription_service.transcribe_with_progress(
+                        audio_input, language=target_language, progress_callback=transcription_progress_callback
+                    )
 
                 # Extract transcribed segments from result
-                srt_output = video_file.with_suffix(".srt")
-
                 if hasattr(transcription_result, "segments") and transcription_result.segments:
                     # Create SRT from Whisper segments with proper timestamps
                     self._create_srt_from_segments(transcription_result.segments, srt_output)
@@ -337,6 +550,8 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
                         segments=len(transcription_result.segments),
                         chars=len(transcription_result.full_text),
                     )
+                    if cache_key is not None:
+                        self.result_cache.put(cache_key, transcription_result)
                 elif hasattr(transcription_result, "full_text"):
                     # Fallback: single segment SRT
                     transcribed_text = transcription_result.full_text
@@ -367,6 +582,48 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
             logger.error("Transcription error", error=str(e), exc_info=True)
             raise ChunkTranscriptionError(f"Chunk transcription failed: {e}") from e
 
+    def decoding_options(self) -> dict[str, Any]:
+        """
+        Options of this service that change the transcribed segments for a chunk
+
+        Covers batched decoding and how the chunk audio is cut from the video.
+        """
+        options: dict[str, Any] = {"batch_size": self.batch_size}
+        if self.audio_cache is None:
+            options["fast_seek"] = self.fast_seek
+            options["seek_preroll"] = self.seek_preroll if self.fast_seek else None
+        return options
+
+    def _result_cache_key(
+        self,
+        transcription_service: Any,
+        video_file: Path,
+        start_time: float,
+        end_time: float,
+        language: str | None,
+    ) -> str | None:
+        """
+        Build the transcription result cache key, or None when caching is disabled
+
+        Combines the decoding options with the VAD settings used by batched decoding.
+        """
+        if self.result_cache is None:
+            return None
+
+        from services.transcriptionservice.result_cache import model_fingerprint
+
+        options = self.decoding_options()
+        if self.batch_size > 0:
+            options["vad"] = getattr(transcription_service, "VAD_PARAMETERS", None)
+
+        try:
+            return self.result_cache.make_key(
+                video_file, start_time, end_time, model_fingerprint(transcription_service), language, options
+            )
+        except OSError as e:
+            logger.warning("Transcription cache disabled for chunk", video=str(video_file), error=str(e))
+            return None
+
     def _create_srt_from_segments(self, segments: list, output_path: Path) -> None:
         """
         Create SRT file from transcription segments
@@ -458,14 +715,157 @@ class ChunkTranscriptionService(IChunkTranscriptionService):
         logger.debug("No existing SRT found", default=str(default_srt))
         return str(default_srt)
 
-    def cleanup_temp_audio_file(self, audio_file: Path, video_file: Path) -> None:
+    def find_sidecar_subtitles(self, video_file: Path, language: str | None = None) -> Path | None:
+        """
+        Find existing subtitles for the whole video
+
+        The plain video.srt is not considered: chunk processing overwrites it with
+        chunk-relative transcripts. Uploaded subtitles are kept as video.sidecar.srt.
+
+        Args:
+            video_file: Path to the video file
+            language: Spoken language; video.<language>.srt is preferred over other names
+
+        Returns:
+            Path to the subtitle file, or None if the video has none
+        """
+        candidates = [video_file.with_suffix(".sidecar.srt")]
+        if language:
+            candidates.append(video_file.with_suffix(f".{language}.srt"))
+        candidates.append(video_file.with_name(f"{video_file.stem}_subtitles.srt"))
+
+        for srt_path in candidates:
+            if srt_path.is_file():
+                return srt_path
+        return None
+
+    def slice_sidecar_subtitles(self, sidecar_file: Path, start_time: float, end_time: float) -> str | None:
+        """
+        Cut the cues of [start_time, end_time) out of a full-video subtitle file
+
+        Cues overlapping the range are clipped to it and shifted to chunk-relative times,
+        matching the timing of a chunk transcript.
+
+        Returns:
+            SRT content of the chunk, or None if no cue falls into the range
+        """
+        from dataclasses import replace
+
+        from utils.srt_parser import SRTParser
+
+        segments = []
+        for segment in SRTParser.parse_file(str(sidecar_file)):
+            if segment.end_time <= start_time or segment.start_time >= end_time or not segment.text.strip():
+                continue
+            segments.append(
+                replace(
+                    segment,
+                    index=len(segments) + 1,
+                    start_time=max(segment.start_time, start_time) - start_time,
+                    end_time=min(segment.end_time, end_time) - start_time,
+                )
+            )
+
+        if not segments:
+            return None
+        return SRTParser.segments_to_srt(segments)
+
+    async def extract_embedded_subtitles(self, video_file: Path, language: str) -> Path | None:
+        """
+        Extract the video's embedded text subtitles for the language to video.embedded.<language>.srt
+
+        Extraction runs once per video; later chunks reuse the cached SRT.
+
+        Returns:
+            Path to the cached SRT, or None if the video has no usable subtitle stream
+        """
+        from services.media.audio_extractor import AudioExtractionError
+        from services.media.subtitle_extractor import SubtitleExtractionError, extract_embedded_subtitles
+
+        output_path = video_file.with_suffix(f".embedded.{language}.srt")
+        try:
+            return await asyncio.to_thread(extract_embedded_subtitles, video_file, language, output_path)
+        except (SubtitleExtractionError, AudioExtractionError, OSError) as e:
+            logger.warning("Could not extract embedded subtitles, using ASR", video=video_file.name, error=str(e))
+            return None
+
+    async def get_sidecar_chunk_text(
+        self,
+        video_file: Path,
+        start_time: float,
+        end_time: float,
+        language_preferences: dict[str, Any] | None = None,
+    ) -> str | None:
+        """
+        Get the chunk subtitles from a sidecar file if the video's policy allows it
+
+        Sidecar files take precedence over subtitle streams embedded in the video.
+
+        Returns:
+            Chunk SRT content, or None when ASR is forced, no sidecar or embedded subtitles
+            exist, the subtitles are unreadable or they have no cues in the range
+        """
+        from services.processing.subtitle_source_policy import SubtitleSourcePolicy
+
+        if self.subtitle_policy.get_policy(video_file) != SubtitleSourcePolicy.PREFER_SIDECAR:
+            return None
+
+        language = language_preferences.get("target") if language_preferences else settings.default_language
+        sidecar_file = self.find_sidecar_subtitles(video_file, language)
+        if sidecar_file is None:
+            sidecar_file = await self.extract_embedded_subtitles(video_file, language)
+        if sidecar_file is None:
+            return None
+
+        try:
+            srt_content = await asyncio.to_thread(self.slice_sidecar_subtitles, sidecar_file, start_time, end_time)
+        except (OSError, ValueError) as e:
+            logger.warning("Could not read sidecar subtitles, using ASR", path=str(sidecar_file), error=str(e))
+            return None
+
+        if srt_content is None:
+            logger.info("Sidecar subtitles have no cues in chunk, using ASR", path=str(sidecar_file), start=start_time)
+        return srt_content
+
+    async def load_sidecar_chunk(
+        self,
+        task_id: str,
+        task_progress: dict[str, Any],
+        video_file: Path,
+        start_time: float,
+        end_time: float,
+        language_preferences: dict[str, Any] | None = None,
+    ) -> str | None:
+        """
+        Write the chunk SRT from sidecar subtitles, replacing extraction and transcription
+
+        Returns:
+            Path to the chunk SRT (video.srt), or None if ASR has to run
+        """
+        srt_content = await self.get_sidecar_chunk_text(video_file, start_time, end_time, language_preferences)
+        if srt_content is None:
+            return None
+
+        srt_file = video_file.with_suffix(".srt")
+        srt_file.write_text(srt_content, encoding="utf-8")
+
+        task_progress[task_id].progress = 35
+        task_progress[task_id].current_step = "Loading subtitles..."
+        task_progress[task_id].message = "Using existing subtitles"
+        logger.info("Using sidecar subtitles instead of ASR", video=video_file.name, start=start_time, end=end_time)
+        return str(srt_file)
+
+    def cleanup_temp_audio_file(self, audio_file: ChunkAudio, video_file: Path) -> None:
         """
         Clean up temporary audio file after transcription
 
         Args:
-            audio_file: Path to temporary audio file
+            audio_file: Path to temporary audio file (in-memory audio needs no cleanup)
             video_file: Original video file (won't be deleted)
         """
+        if is_in_memory_audio(audio_file):
+            return
+
         # Only delete if it's a generated audio file (not the original video)
         if audio_file != video_file and audio_file.exists():
             try:
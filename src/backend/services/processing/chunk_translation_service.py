@@ -34,14 +34,23 @@ Dependencies:
     - tqdm: Progress bar for translation batches
 
 Thread Safety:
-    No. Service caches translation models in instance dict (_translation_services).
-    Use separate instances per request or add locking for concurrent access.
+    Yes for translation models: they are owned by the process-wide, lock-protected
+    TranslationModelRegistry and shared by all instances.
 
 Performance Notes:
-    - Translation service caching: O(1) lookup per language pair
-    - Translation: ~200ms per segment (model dependent)
-    - Batch processing: Yields to event loop every 5 segments
-    - Progress updates: Every segment (65% -> 95% range)
+    - Translation models: one instance per language pair in the process; idle models are unloaded
+      (LRU) when loaded models exceed LANGPLUG_TRANSLATION_MODEL_MEMORY_BUDGET_MB
+    - Translation: segments go through translate_batch in batches of LANGPLUG_TRANSLATION_BATCH_SIZE
+      (one batched model call instead of one call per subtitle)
+    - Batches run on the bounded translation executor (LANGPLUG_TRANSLATION_WORKERS), keeping the
+      event loop free for other requests while a chunk translates
+    - Micro-batching (LANGPLUG_TRANSLATION_MICRO_BATCHING_ENABLED): batches of concurrent requests
+      for the same model are merged into one model call
+    - Deduplication: each distinct (normalized) line of a chunk is translated once and the result
+      is reused for every repetition
+    - Translation memory (LANGPLUG_TRANSLATION_MEMORY_ENABLED): repeated lines are served from
+      the memory (in-process LRU, then SQLite) and never reach the model again
+    - Progress updates: Every batch (65% -> 95% range)
 
 Translation Models:
     Uses Helsinki-NLP OPUS-MT models: opus-mt-{source}-{target}
@@ -53,10 +62,19 @@ from typing import Any
 
 from tqdm import tqdm
 
+from core.config import settings
 from core.config.logging_config import get_logger
 from services.interfaces.translation_interface import IChunkTranslationService
+from services.translationservice.executor import run_in_translation_thread
 from services.translationservice.factory import TranslationServiceFactory
 from services.translationservice.interface import ITranslationService
+from services.translationservice.micro_batcher import get_translation_micro_batcher
+from services.translationservice.model_registry import TranslationModelRegistry, get_translation_model_registry
+from services.translationservice.translation_memory import (
+    TranslationMemory,
+    get_translation_memory,
+    normalize_segment_text,
+)
 from utils.srt_parser import SRTParser, SRTSegment
 
 logger = get_logger(__name__)
@@ -76,7 +94,7 @@ class ChunkTranslationService(IChunkTranslationService):
     subtitle segments with progress tracking.
 
     Attributes:
-        _translation_services (dict): Cache of translation services keyed by (source, target, quality)
+        model_registry (TranslationModelRegistry): Process-wide owner of the loaded translation models
 
     Example:
         ```python
@@ -93,13 +111,36 @@ class ChunkTranslationService(IChunkTranslationService):
         ```
 
     Note:
-        Service instances are cached per language pair for performance.
+        Service instances are shared process-wide per language pair (see TranslationModelRegistry).
         Implements IChunkTranslationService interface.
         Translates ALL segments, not just vocabulary segments (for complete subtitles).
     """
 
-    def __init__(self):
-        self._translation_services: dict[tuple[str, str, str], ITranslationService] = {}
+    def __init__(
+        self,
+        batch_size: int | None = None,
+        micro_batching: bool | None = None,
+        translation_memory: TranslationMemory | None = None,
+        model_registry: TranslationModelRegistry | None = None,
+    ):
+        """
+        Initialize chunk translation service
+
+        Args:
+            batch_size: Segments per translate_batch call. Defaults to LANGPLUG_TRANSLATION_BATCH_SIZE.
+            micro_batching: Coalesce batches with concurrent requests for the same model.
+                Defaults to LANGPLUG_TRANSLATION_MICRO_BATCHING_ENABLED.
+            translation_memory: Memory of translated segments consulted before the model.
+                Defaults to the shared memory when LANGPLUG_TRANSLATION_MEMORY_ENABLED is set.
+            model_registry: Registry owning the translation models. Defaults to the process-wide registry.
+        """
+        self.model_registry = model_registry or get_translation_model_registry()
+        self.batch_size = max(1, settings.translation_batch_size if batch_size is None else batch_size)
+        self.micro_batching = settings.translation_micro_batching_enabled if micro_batching is None else micro_batching
+
+        if translation_memory is None and settings.translation_memory_enabled:
+            translation_memory = get_translation_memory()
+        self.translation_memory = translation_memory
 
     def get_translation_service(
         self, source_lang: str, target_lang: str, quality: str = "standard"
@@ -107,6 +148,9 @@ class ChunkTranslationService(IChunkTranslationService):
         """
         Get or create a translation service for the specified language pair
 
+        The service is acquired from the process-wide model registry; release it with
+        release_translation_service so the model can be unloaded when memory is needed.
+
         Args:
             source_lang: Source language code
             target_lang: Target language code
@@ -115,21 +159,32 @@ class ChunkTranslationService(IChunkTranslationService):
         Returns:
             Translation service instance
         """
-        service_key = (source_lang, target_lang, quality)
-
-        if service_key not in self._translation_services:
-            # Calculate the correct OPUS model for this language pair
-            # OPUS models follow pattern: Helsinki-NLP/opus-mt-{source}-{target}
-            model_name = f"Helsinki-NLP/opus-mt-{source_lang}-{target_lang}"
+        model_name = self.get_model_name(source_lang, target_lang)
 
+        def create_service() -> ITranslationService:
             logger.info("Creating translation service", source=source_lang, target=target_lang, model=model_name)
-
-            self._translation_services[service_key] = TranslationServiceFactory.create_service(
+            # Uncached: the registry owns the instance and unloads it on eviction
+            return TranslationServiceFactory.create_uncached_service(
                 service_name="opus",  # Use OPUS service type
                 model_name=model_name,  # Explicitly set model for language pair
             )
 
-        return self._translation_services[service_key]
+        return self.model_registry.acquire(self._registry_key(source_lang, target_lang, quality), create_service)
+
+    def release_translation_service(self, source_lang: str, target_lang: str, quality: str = "standard") -> None:
+        """Release a service obtained from get_translation_service"""
+        self.model_registry.release(self._registry_key(source_lang, target_lang, quality))
+
+    def _registry_key(self, source_lang: str, target_lang: str, quality: str) -> tuple[str, str, str]:
+        return ("opus", self.get_model_name(source_lang, target_lang), quality)
+
+    def get_model_name(self, source_lang: str, target_lang: str) -> str:
+        """
+        Get the translation model used for a language pair
+
+        OPUS models follow pattern: Helsinki-NLP/opus-mt-{source}-{target}
+        """
+        return f"Helsinki-NLP/opus-mt-{source_lang}-{target_lang}"
 
     async def build_translation_segments(
         self,
@@ -170,13 +225,39 @@ class ChunkTranslationService(IChunkTranslationService):
 
         # Translate ALL segments (not just vocabulary segments)
         # The Frontend needs complete translations for all subtitles
-        translation_segments = await self._build_translation_texts(
+        translation_segments = await self.translate_all_segments(
             task_id, task_progress, subtitle_segments, language_preferences
         )
 
         logger.debug("Built translation segments", count=len(translation_segments))
         return translation_segments
 
+    async def translate_all_segments(
+        self,
+        task_id: str,
+        task_progress: dict[str, Any],
+        subtitle_segments: list[SRTSegment],
+        language_preferences: dict[str, Any],
+    ) -> list[SRTSegment]:
+        """
+        Translate every subtitle segment of a chunk
+
+        Unlike build_translation_segments this does not depend on the user's vocabulary,
+        so the result can be shared between users of the same chunk.
+
+        Args:
+            task_id: Processing task ID
+            task_progress: Progress tracking dictionary
+            subtitle_segments: Parsed chunk subtitle segments
+            language_preferences: Language pair ("target" = spoken, "native" = translation)
+
+        Returns:
+            List of translated SRT segments
+        """
+        if not subtitle_segments:
+            return []
+        return await self._build_translation_texts(task_id, task_progress, subtitle_segments, language_preferences)
+
     def _map_active_words_to_segments(
         self, vocabulary: list, subtitle_segments: list[SRTSegment]
     ) -> list[tuple[dict, SRTSegment]]:
@@ -237,52 +318,152 @@ class ChunkTranslationService(IChunkTranslationService):
         )
 
         translation_service = self.get_translation_service(source_lang, target_lang)
+        try:
+            translated_texts = await self._translate_segment_texts(
+                task_id, task_progress, translation_service, subtitle_segments, source_lang, target_lang
+            )
+        finally:
+            self.release_translation_service(source_lang, target_lang)
+
+        translation_segments = []
+        for segment, translated_text in zip(subtitle_segments, translated_texts, strict=True):
+            if translated_text is None:
+                continue  # Translation failed for this segment
+            translation_segments.append(
+                SRTSegment(
+                    index=segment.index,
+                    start_time=segment.start_time,
+                    end_time=segment.end_time,
+                    text=translated_text,
+                )
+            )
 
-        async def translate_with_progress(task_id=None, task_progress_dict=None):
-            """Translate segments with progress tracking"""
-            translation_segments = []
-            batch_size = 5  # Process in small batches to yield to event loop
-
-            for i, segment in enumerate(tqdm(subtitle_segments, desc="Translating segments", disable=False)):
-                try:
-                    # Update progress every segment to ensure smooth updates (65% -> 95%)
-                    if task_id and task_progress_dict:
-                        # Map translation progress (0-100%) to overall range (65-95%)
-                        translation_pct = (i + 1) / len(subtitle_segments)
-                        progress = int(65 + (30 * translation_pct))
-                        task_progress_dict[task_id].progress = progress
-                        task_progress_dict[task_id].current_step = "Building translations..."
-                        task_progress_dict[task_id].message = f"Translating segment {i + 1}/{len(subtitle_segments)}"
-
-                    # Create translation segment
-                    translation_result = translation_service.translate(segment.text, source_lang, target_lang)
-
-                    translation_segment = SRTSegment(
-                        index=segment.index,
-                        start_time=segment.start_time,
-                        end_time=segment.end_time,
-                        text=translation_result.translated_text,
-                    )
-
-                    translation_segments.append(translation_segment)
-
-                    # Yield to event loop every batch to allow FastAPI to respond to requests
-                    if (i + 1) % batch_size == 0:
-                        await asyncio.sleep(0.01)  # 10ms yield to event loop
-
-                except Exception as e:
-                    logger.error("Translation failed for segment", index=segment.index, error=str(e))
-                    continue
-
-            # Update progress one final time before returning
-            if task_id and task_progress_dict:
-                task_progress_dict[task_id].progress = 95
-                task_progress_dict[task_id].current_step = "Building translations..."
-                task_progress_dict[task_id].message = "Translation completed"
-
-            return translation_segments
-
-        return await translate_with_progress(task_id, task_progress)
+        # Update progress one final time before returning
+        if task_id and task_progress:
+            task_progress[task_id].progress = 95
+            task_progress[task_id].current_step = "Building translations..."
+            task_progress[task_id].message = "Translation completed"
+
+        return translation_segments
+
+    async def _translate_segment_texts(
+        self,
+        task_id: str,
+        task_progress: dict[str, Any],
+        translation_service: ITranslationService,
+        subtitle_segments: list[SRTSegment],
+        source_lang: str,
+        target_lang: str,
+    ) -> list[str | None]:
+        """
+        Translate the text of every segment, updating progress per batch
+
+        Returns:
+            Translated text per segment (None where translation failed)
+        """
+        model_name = self.get_model_name(source_lang, target_lang)
+
+        # Identical lines (after normalization) are translated once and fanned out to every segment
+        keys = [normalize_segment_text(segment.text) for segment in subtitle_segments]
+        occurrences: dict[str, list[int]] = {}
+        for position, key in enumerate(keys):
+            occurrences.setdefault(key, []).append(position)
+        logger.debug("Deduplicated chunk segments", segments=len(keys), distinct=len(occurrences))
+
+        # Segments already in the translation memory skip the model
+        translations = await self._recall_translations(model_name, source_lang, target_lang, subtitle_segments)
+        pending = [
+            (key, subtitle_segments[positions[0]]) for key, positions in occurrences.items() if key not in translations
+        ]
+        total = len(subtitle_segments)
+        done = total - sum(len(occurrences[key]) for key, _ in pending)
+
+        with tqdm(total=len(pending), desc="Translating segments", disable=False) as progress_bar:
+            for batch_start in range(0, len(pending), self.batch_size):
+                batch = pending[batch_start : batch_start + self.batch_size]
+                translated_texts = await self._translate_segment_batch(
+                    translation_service, [segment for _, segment in batch], source_lang, target_lang
+                )
+
+                new_translations = {}
+                for (key, segment), translated_text in zip(batch, translated_texts, strict=True):
+                    if translated_text is not None:
+                        translations[key] = translated_text
+                        new_translations[segment.text] = translated_text
+                await self._memorize_translations(model_name, source_lang, target_lang, new_translations)
+
+                done += sum(len(occurrences[key]) for key, _ in batch)
+                progress_bar.update(len(batch))
+
+                # Map translation progress (0-100%) to overall range (65-95%)
+                if task_id and task_progress:
+                    task_progress[task_id].progress = int(65 + (30 * done / total))
+                    task_progress[task_id].current_step = "Building translations..."
+                    task_progress[task_id].message = f"Translated {done}/{total} segments"
+
+        return [translations.get(key) for key in keys]
+
+    async def _recall_translations(
+        self, model_name: str, source_lang: str, target_lang: str, segments: list[SRTSegment]
+    ) -> dict[str, str]:
+        """Look up segments in the translation memory (normalized text -> translation)"""
+        if self.translation_memory is None:
+            return {}
+
+        remembered = await asyncio.to_thread(
+            self.translation_memory.get_many, model_name, source_lang, target_lang, [s.text for s in segments]
+        )
+        logger.debug("Translation memory lookup", segments=len(segments), hits=len(remembered))
+        return remembered
+
+    async def _memorize_translations(
+        self, model_name: str, source_lang: str, target_lang: str, translations: dict[str, str]
+    ) -> None:
+        """Store fresh model translations in the translation memory"""
+        if self.translation_memory is None or not translations:
+            return
+        await asyncio.to_thread(self.translation_memory.put_many, model_name, source_lang, target_lang, translations)
+
+    async def _translate_segment_batch(
+        self,
+        translation_service: ITranslationService,
+        batch: list[SRTSegment],
+        source_lang: str,
+        target_lang: str,
+    ) -> list[str | None]:
+        """
+        Translate a batch of segments with one translate_batch call on the translation executor
+
+        If the batched call fails, the batch is retried segment by segment so one bad
+        segment only loses its own translation.
+
+        Returns:
+            Translated text per segment (None where translation failed)
+        """
+        texts = [segment.text for segment in batch]
+        try:
+            if self.micro_batching:
+                batcher = get_translation_micro_batcher(translation_service)
+                results = await batcher.translate_batch(texts, source_lang, target_lang)
+            else:
+                results = await translation_service.translate_batch_async(texts, source_lang, target_lang)
+            if len(results) != len(texts):
+                raise ChunkTranslationError(f"Expected {len(texts)} translations, got {len(results)}")
+            return [result.translated_text for result in results]
+        except Exception as e:
+            logger.warning("Batch translation failed, translating segments individually", size=len(batch), error=str(e))
+
+        translated_texts: list[str | None] = []
+        for segment in batch:
+            try:
+                result = await run_in_translation_thread(
+                    translation_service.translate, segment.text, source_lang, target_lang
+                )
+                translated_texts.append(result.translated_text)
+            except Exception as e:
+                logger.error("Translation failed for segment", index=segment.index, error=str(e))
+                translated_texts.append(None)
+        return translated_texts
 
     def segments_overlap(
         self, seg1_start: float, seg1_end: float, seg2_start: float, seg2_end: float, threshold: float = 0.5
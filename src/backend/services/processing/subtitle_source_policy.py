@@ -0,0 +1,134 @@
+"""
+Subtitle Source Policy
+
+Decides per video whether chunk subtitles come from existing subtitle files
+(sidecar or uploaded) or from speech recognition.
+
+Key Components:
+    - SubtitleSourcePolicy: prefer_sidecar / force_asr
+    - SubtitleSourcePolicyStore: Per-video overrides persisted as JSON in the data directory
+    - get_subtitle_source_policy_store: Process-wide store instance
+
+Usage Example:
+    ```python
+    store = get_subtitle_source_policy_store()
+    store.set_policy(video_file, SubtitleSourcePolicy.FORCE_ASR)  # sidecar has bad timing
+
+    if store.get_policy(video_file) == SubtitleSourcePolicy.PREFER_SIDECAR:
+        ...
+    ```
+
+Thread Safety:
+    Yes. Reads and writes of the policy file are serialized with a lock.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from enum import Enum
+from pathlib import Path
+
+from core.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class SubtitleSourcePolicy(str, Enum):
+    """Where chunk subtitles come from"""
+
+    PREFER_SIDECAR = "prefer_sidecar"  # Use existing subtitles when available, ASR otherwise
+    FORCE_ASR = "force_asr"  # Always transcribe
+
+
+class SubtitleSourcePolicyStore:
+    """
+    Per-video subtitle source policy with a global default.
+
+    Attributes:
+        policy_file: JSON file mapping resolved video paths to policies
+        default_policy: Policy for videos without an override
+    """
+
+    def __init__(self, policy_file: Path, default_policy: SubtitleSourcePolicy):
+        self.policy_file = Path(policy_file)
+        self.default_policy = default_policy
+        self._lock = threading.Lock()
+        self._overrides: dict[str, str] | None = None
+
+    def get_policy(self, video_file: Path) -> SubtitleSourcePolicy:
+        """Get the policy for a video (its override, or the default)"""
+        with self._lock:
+            value = self._load().get(self._key(video_file))
+        if value is None:
+            return self.default_policy
+        try:
+            return SubtitleSourcePolicy(value)
+        except ValueError:
+            logger.warning("Ignoring unknown subtitle source policy", video=str(video_file), policy=value)
+            return self.default_policy
+
+    def set_policy(self, video_file: Path, policy: SubtitleSourcePolicy | None) -> None:
+        """
+        Set or clear the policy override for a video
+
+        Args:
+            video_file: Video the policy applies to
+            policy: New policy, or None to fall back to the default
+        """
+        with self._lock:
+            overrides = dict(self._load())
+            if policy is None:
+                overrides.pop(self._key(video_file), None)
+            else:
+                overrides[self._key(video_file)] = SubtitleSourcePolicy(policy).value
+            self._save(overrides)
+            self._overrides = overrides
+
+        logger.info("Subtitle source policy updated", video=str(video_file), policy=policy)
+
+    @staticmethod
+    def _key(video_file: Path) -> str:
+        return str(Path(video_file).resolve())
+
+    def _load(self) -> dict[str, str]:
+        if self._overrides is None:
+            try:
+                self._overrides = json.loads(self.policy_file.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                self._overrides = {}
+            except (OSError, ValueError) as e:
+                logger.warning("Could not read subtitle source policies", path=str(self.policy_file), error=str(e))
+                self._overrides = {}
+        return self._overrides
+
+    def _save(self, overrides: dict[str, str]) -> None:
+        self.policy_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(suffix=".partial", dir=self.policy_file.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(overrides, f, indent=2, sort_keys=True)
+            Path(tmp_name).replace(self.policy_file)
+        finally:
+            Path(tmp_name).unlink(missing_ok=True)
+
+
+_subtitle_source_policy_store: SubtitleSourcePolicyStore | None = None
+
+
+def get_subtitle_source_policy_store() -> SubtitleSourcePolicyStore:
+    """
+    Get the process-wide subtitle source policy store.
+
+    Default policy from LANGPLUG_SUBTITLE_SOURCE_POLICY; overrides are kept in
+    <data path>/subtitle_source_policies.json.
+    """
+    global _subtitle_source_policy_store
+    if _subtitle_source_policy_store is None:
+        from core.config import settings
+
+        _subtitle_source_policy_store = SubtitleSourcePolicyStore(
+            settings.get_data_path() / "subtitle_source_policies.json",
+            SubtitleSourcePolicy(settings.subtitle_source_policy),
+        )
+    return _subtitle_source_policy_store
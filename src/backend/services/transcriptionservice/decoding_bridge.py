@@ -0,0 +1,207 @@
+"""
+Worker-thread decoding bridge for transcription backends.
+
+ASR decoders (faster-whisper, OpenAI Whisper, NeMo) are synchronous and keep the
+CPU/GPU busy for seconds at a time. Iterating them on the asyncio thread blocks
+every other request served by the process (auth, polling, WebSockets).
+
+This module runs decoding on a dedicated, bounded thread pool and hands results
+back to the calling coroutine through an asyncio.Queue, so progress callbacks and
+unrelated requests keep being served while a chunk is transcribed.
+
+Usage Example:
+    ```python
+    def decode():
+        segments, info = model.transcribe(audio_path)
+        yield info
+        yield from segments
+
+    stream = stream_in_decoding_thread(decode)
+    info = await anext(stream)
+    async for segment in stream:
+        ...
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from core.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Sentinel marking the end of a decoding stream
+_END_OF_STREAM = object()
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_decoding_executor() -> ThreadPoolExecutor:
+    """
+    Get the process-wide executor used for ASR decoding.
+
+    The pool is bounded by LANGPLUG_TRANSCRIPTION_DECODE_WORKERS so that concurrent
+    chunk requests queue up instead of oversubscribing the CPU/GPU.
+
+    Returns:
+        Shared ThreadPoolExecutor (created lazily)
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                from core.config import settings
+
+                workers = max(1, settings.transcription_decode_workers)
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="asr-decode")
+                logger.debug("Created decoding executor", workers=workers)
+    return _executor
+
+
+def shutdown_decoding_executor() -> None:
+    """Shut down the shared decoding executor (used on application shutdown and in tests)"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+async def run_in_decoding_thread(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking decode call on the shared decoding executor.
+
+    Args:
+        func: Synchronous callable (e.g. a backend's transcribe method)
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Return value of func
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_decoding_executor(), lambda: func(*args, **kwargs))
+
+
+async def stream_in_decoding_thread(
+    produce: Callable[[], Iterator[T]],
+    max_buffered: int = 0,
+) -> AsyncIterator[T]:
+    """
+    Iterate a blocking generator on the decoding executor and yield its items asynchronously.
+
+    The producer runs entirely on the worker thread; every item is pushed to an
+    asyncio.Queue via call_soon_threadsafe. Exceptions raised by the producer are
+    re-raised in the consuming coroutine. If the consumer stops early (break,
+    cancellation), the producer is asked to stop before decoding its next item.
+
+    Args:
+        produce: Zero-argument callable returning the blocking iterator to drain
+        max_buffered: Maximum number of undelivered items (0 = unbounded)
+
+    Yields:
+        Items produced by the iterator, in order
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[Any] = asyncio.Queue()
+    stop_requested = threading.Event()
+    # Bounds how far the worker can run ahead of the consumer
+    slots = threading.Semaphore(max_buffered) if max_buffered > 0 else None
+
+    def push(item: Any) -> None:
+        _push_threadsafe(loop, queue, stop_requested, item)
+
+    loop.run_in_executor(get_decoding_executor(), _drain, produce, push, slots, stop_requested)
+
+    try:
+        while (item := await queue.get()) is not _END_OF_STREAM:
+            yield _deliver(item, slots)
+    finally:
+        stop_requested.set()
+        if slots is not None:
+            # Unblock a worker waiting for a free slot
+            slots.release()
+
+
+def _push_threadsafe(
+    loop: asyncio.AbstractEventLoop,
+    queue: asyncio.Queue[Any],
+    stop_requested: threading.Event,
+    item: Any,
+) -> None:
+    """Hand an item from the worker thread to the consuming coroutine"""
+    try:
+        loop.call_soon_threadsafe(queue.put_nowait, item)
+    except RuntimeError:
+        # Event loop already closed - nobody is listening anymore
+        stop_requested.set()
+
+
+def _wait_for_slot(slots: threading.Semaphore | None, stop_requested: threading.Event) -> bool:
+    """Block the worker until the consumer has room for another item; False once it stopped listening"""
+    if slots is not None:
+        while not slots.acquire(timeout=0.1):
+            if stop_requested.is_set():
+                return False
+    return not stop_requested.is_set()
+
+
+def _drain(
+    produce: Callable[[], Iterator[Any]],
+    push: Callable[[Any], None],
+    slots: threading.Semaphore | None,
+    stop_requested: threading.Event,
+) -> None:
+    """Worker-thread side: run the producer and push every item (or its failure) to the consumer"""
+    try:
+        for item in produce():
+            if not _wait_for_slot(slots, stop_requested):
+                return
+            push(item)
+    except BaseException as exc:  # forwarded to the consumer
+        push(_DecodingFailure(exc))
+    finally:
+        push(_END_OF_STREAM)
+
+
+def _deliver(item: Any, slots: threading.Semaphore | None) -> Any:
+    """Consumer side: re-raise a forwarded producer failure, otherwise free the item's slot and return it"""
+    if isinstance(item, _DecodingFailure):
+        raise item.error
+    if slots is not None:
+        slots.release()
+    return item
+
+
+async def stream_inline(produce: Callable[[], Iterator[T]]) -> AsyncIterator[T]:
+    """
+    Iterate a blocking generator on the event loop thread.
+
+    Same interface as stream_in_decoding_thread, for backends configured to
+    decode inline (e.g. when the model object must stay on the loop thread).
+
+    Args:
+        produce: Zero-argument callable returning the iterator to drain
+
+    Yields:
+        Items produced by the iterator, in order
+    """
+    for item in produce():
+        yield item
+
+
+class _DecodingFailure:
+    """Wrapper carrying a producer exception across the thread boundary"""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
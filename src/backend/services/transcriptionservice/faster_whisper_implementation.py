@@ -10,7 +10,8 @@ from typing import Any
 
 from core.config.logging_config import get_logger
 
-from .interface import ITranscriptionService, ProgressCallback, TranscriptionResult, TranscriptionSegment
+from .decoding_bridge import stream_in_decoding_thread, stream_inline
+from .interface import AudioInput, ITranscriptionService, ProgressCallback, TranscriptionResult, TranscriptionSegment
 
 logger = get_logger(__name__)
 
@@ -59,6 +60,12 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
         "int8_float16",  # GPU only, best for large models
     ]
 
+    # Silero VAD options shared by sequential and batched decoding
+    VAD_PARAMETERS = {
+        "min_silence_duration_ms": 500,
+        "speech_pad_ms": 200,
+    }
+
     def __init__(
         self,
         model_size: str = "large-v3-turbo",
@@ -67,6 +74,7 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
         download_root: str | None = None,
         num_workers: int = 1,
         cpu_threads: int = 4,
+        decode_in_thread: bool = True,
     ):
         """
         Initialize Faster-Whisper transcription service.
@@ -78,6 +86,7 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
             download_root: Directory to download model to
             num_workers: Number of workers for parallel processing
             cpu_threads: Number of CPU threads to use
+            decode_in_thread: Decode on the shared decoding executor instead of the event loop
         """
         # Map turbo alias
         if model_size == "turbo":
@@ -88,6 +97,7 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
         self.download_root = download_root
         self.num_workers = num_workers
         self.cpu_threads = cpu_threads
+        self.decode_in_thread = decode_in_thread
         self._model = None
         self._batched_model = None
 
@@ -139,12 +149,12 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
                 logger.error("Failed to load model", error=str(e))
                 raise
 
-    def transcribe(self, audio_path: str, language: str | None = None) -> TranscriptionResult:
+    def transcribe(self, audio_path: AudioInput, language: str | None = None) -> TranscriptionResult:
         """
         Transcribe an audio file using Faster-Whisper (synchronous, no progress).
 
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, or 16kHz mono float32 samples
             language: Optional language hint (e.g., 'en', 'de')
 
         Returns:
@@ -152,7 +162,7 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
         """
         self.initialize()
 
-        logger.debug("Transcribing", audio_path=audio_path)
+        logger.debug("Transcribing", audio_path=audio_path if isinstance(audio_path, str) else "<memory>")
 
         # Transcribe with VAD filter for better results
         segments_generator, info = self._model.transcribe(
@@ -160,10 +170,7 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
             language=language,
             beam_size=5,
             vad_filter=True,
-            vad_parameters=dict(
-                min_silence_duration_ms=500,
-                speech_pad_ms=200,
-            ),
+            vad_parameters=dict(self.VAD_PARAMETERS),
         )
 
         # Collect segments (this triggers the actual transcription)
@@ -203,7 +210,7 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
 
     async def transcribe_with_progress(
         self,
-        audio_path: str,
+        audio_path: AudioInput,
         language: str | None = None,
         progress_callback: ProgressCallback | None = None,
     ) -> TranscriptionResult:
@@ -212,48 +219,136 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
 
         Unlike the synchronous transcribe(), this method:
         - Reports actual progress based on transcribed audio duration
-        - Yields to the event loop between segments for responsive updates
+        - Decodes on the shared decoding executor (see decoding_bridge) so the
+          event loop keeps serving other requests while segments are decoded
         - Provides detailed per-segment status messages
 
         Args:
-            audio_path: Path to audio file
+            audio_path: Path to audio file, or 16kHz mono float32 samples
             language: Optional language hint (e.g., 'en', 'de')
             progress_callback: Async callback receiving (fraction: 0-1, message: str)
 
         Returns:
             TranscriptionResult with transcription
         """
-        import asyncio
+        logger.debug(
+            "Transcribing with progress", in_memory=not isinstance(audio_path, str), threaded=self.decode_in_thread
+        )
 
-        self.initialize()
+        def decode():
+            # Model loading, VAD and language detection are blocking too - keep them off the loop
+            self.initialize()
+            segments_generator, info = self._model.transcribe(
+                audio_path,
+                language=language,
+                beam_size=5,
+                vad_filter=True,
+                vad_parameters=dict(self.VAD_PARAMETERS),
+            )
+            yield info
+            yield from segments_generator
+
+        return await self._collect_with_progress(decode, audio_path, progress_callback)
+
+    async def transcribe_batched_with_progress(
+        self,
+        audio_path: AudioInput,
+        language: str | None = None,
+        progress_callback: ProgressCallback | None = None,
+        batch_size: int = 16,
+    ) -> TranscriptionResult:
+        """
+        Transcribe using BatchedInferencePipeline with progress tracking.
+
+        VAD splits the audio into speech windows which are decoded batch_size at a
+        time. Gives a multi-x throughput gain on long chunks, especially on CPU.
+        Falls back to sequential decoding if the pipeline is not available.
 
-        logger.debug("Transcribing with progress", audio_path=audio_path)
+        Args:
+            audio_path: Path to audio file, or 16kHz mono float32 samples
+            language: Optional language hint (e.g., 'en', 'de')
+            progress_callback: Async callback receiving (fraction: 0-1, message: str)
+            batch_size: Number of speech windows decoded per batch
+
+        Returns:
+            TranscriptionResult with transcription
+        """
+        logger.debug(
+            "Batched transcription with progress", in_memory=not isinstance(audio_path, str), batch_size=batch_size
+        )
+
+        def decode():
+            self.initialize()
+            batched_model = self._get_batched_model()
+            if batched_model is None:
+                segments_generator, info = self._model.transcribe(
+                    audio_path,
+                    language=language,
+                    beam_size=5,
+                    vad_filter=True,
+                    vad_parameters=dict(self.VAD_PARAMETERS),
+                )
+            else:
+                segments_generator, info = batched_model.transcribe(
+                    audio_path,
+                    language=language,
+                    beam_size=5,
+                    batch_size=batch_size,
+                    vad_filter=True,
+                    vad_parameters=dict(self.VAD_PARAMETERS),
+                )
+            yield info
+            yield from segments_generator
+
+        return await self._collect_with_progress(
+            decode, audio_path, progress_callback, extra_metadata={"batch_size": batch_size, "batched": True}
+        )
+
+    async def _collect_with_progress(
+        self,
+        decode,
+        audio_path: AudioInput,
+        progress_callback: ProgressCallback | None,
+        extra_metadata: dict[str, Any] | None = None,
+    ) -> TranscriptionResult:
+        """
+        Drain a decode generator (info first, then segments) and report progress per segment.
+
+        Args:
+            decode: Zero-argument generator function yielding TranscriptionInfo, then segments
+            audio_path: Path to audio file (used for duration fallback)
+            progress_callback: Async callback receiving (fraction: 0-1, message: str)
+            extra_metadata: Additional entries for the result metadata
+
+        Returns:
+            TranscriptionResult with transcription
+        """
+        import asyncio
 
         # Report starting
         if progress_callback:
             await progress_callback(0.0, "Initializing transcription...")
 
-        # Transcribe with VAD filter for better results
-        segments_generator, info = self._model.transcribe(
-            audio_path,
-            language=language,
-            beam_size=5,
-            vad_filter=True,
-            vad_parameters=dict(
-                min_silence_duration_ms=500,
-                speech_pad_ms=200,
-            ),
-        )
+        if self.decode_in_thread:
+            stream = stream_in_decoding_thread(decode)
+        else:
+            stream = stream_inline(decode)
+
+        info = await anext(stream)
 
         # Get total duration for progress calculation
         total_duration = info.duration if hasattr(info, "duration") else 0
         if total_duration <= 0:
-            # Fallback: estimate from file size (rough approximation)
-            import os
+            if isinstance(audio_path, str):
+                # Fallback: estimate from file size (rough approximation)
+                import os
 
-            file_size = os.path.getsize(audio_path)
-            # 16kHz mono 16-bit = 32000 bytes/second
-            total_duration = file_size / 32000
+                file_size = os.path.getsize(audio_path)
+                # 16kHz mono 16-bit = 32000 bytes/second
+                total_duration = file_size / 32000
+            else:
+                # In-memory audio: 16kHz samples
+                total_duration = len(audio_path) / 16000
             logger.warning("No duration in info, estimated", duration=total_duration)
 
         logger.debug("Total audio duration", duration=total_duration)
@@ -263,7 +358,7 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
         full_text_parts = []
         segment_count = 0
 
-        for seg in segments_generator:
+        async for seg in stream:
             segment_count += 1
 
             segments.append(
@@ -280,21 +375,12 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
             )
             full_text_parts.append(seg.text)
 
-            # Calculate REAL progress based on transcribed duration
-            if total_duration > 0:
-                fraction = min(seg.end / total_duration, 1.0)
-            else:
-                # Fallback: count-based (less accurate but better than nothing)
-                fraction = min(segment_count / 100, 0.99)  # Assume ~100 segments max
-
-            # Report progress
             if progress_callback:
-                message = f"Transcribed {seg.end:.1f}s / {total_duration:.1f}s"
-                await progress_callback(fraction, message)
+                await self._report_segment_progress(progress_callback, seg.end, segment_count, total_duration)
 
-            # Yield to event loop to allow other async operations
-            # This is crucial for responsive WebSocket updates
-            await asyncio.sleep(0)  # Zero-sleep yields to event loop
+            if not self.decode_in_thread:
+                # Inline decoding: yield to event loop between segments
+                await asyncio.sleep(0)
 
         full_text = "".join(full_text_parts).strip()
 
@@ -307,19 +393,48 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
             f"{len(full_text)} chars, language: {info.language}"
         )
 
+        metadata = {
+            "model": self.model_size,
+            "compute_type": self.compute_type,
+            "language_probability": info.language_probability,
+            "segment_count": segment_count,
+        }
+        if extra_metadata:
+            metadata.update(extra_metadata)
+
         return TranscriptionResult(
             full_text=full_text,
             segments=segments,
             language=info.language,
             duration=total_duration,
-            metadata={
-                "model": self.model_size,
-                "compute_type": self.compute_type,
-                "language_probability": info.language_probability,
-                "segment_count": segment_count,
-            },
+            metadata=metadata,
         )
 
+    @staticmethod
+    async def _report_segment_progress(
+        progress_callback: ProgressCallback, segment_end: float, segment_count: int, total_duration: float
+    ) -> None:
+        """Report progress after a decoded segment, based on how much audio has been transcribed"""
+        # Calculate REAL progress based on transcribed duration
+        if total_duration > 0:
+            fraction = min(segment_end / total_duration, 1.0)
+        else:
+            # Fallback: count-based (less accurate but better than nothing)
+            fraction = min(segment_count / 100, 0.99)  # Assume ~100 segments max
+
+        await progress_callback(fraction, f"Transcribed {segment_end:.1f}s / {total_duration:.1f}s")
+
+    def _get_batched_model(self):
+        """Get (lazily create) the BatchedInferencePipeline, or None if unavailable"""
+        if self._batched_model is None:
+            try:
+                from faster_whisper import BatchedInferencePipeline
+            except ImportError:
+                logger.warning("[FASTER-WHISPER] BatchedInferencePipeline not available, using standard transcription")
+                return None
+            self._batched_model = BatchedInferencePipeline(model=self._model)
+        return self._batched_model
+
     def transcribe_batched(
         self,
         audio_path: str,
@@ -339,22 +454,18 @@ class FasterWhisperTranscriptionService(ITranscriptionService):
         """
         self.initialize()
 
-        try:
-            from faster_whisper import BatchedInferencePipeline
-        except ImportError:
-            logger.warning("[FASTER-WHISPER] BatchedInferencePipeline not available, using standard transcription")
+        batched_model = self._get_batched_model()
+        if batched_model is None:
             return self.transcribe(audio_path, language)
 
-        # Create batched model if not exists
-        if self._batched_model is None:
-            self._batched_model = BatchedInferencePipeline(model=self._model)
-
         logger.debug("Batched transcription", batch_size=batch_size)
 
-        segments_generator, info = self._batched_model.transcribe(
+        segments_generator, info = batched_model.transcribe(
             audio_path,
             language=language,
             batch_size=batch_size,
+            vad_filter=True,
+            vad_parameters=dict(self.VAD_PARAMETERS),
         )
 
         # Collect segments
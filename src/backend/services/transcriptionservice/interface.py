@@ -6,13 +6,19 @@ Defines the contract that all transcription services must implement
 from abc import abstractmethod
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any, Union
 
 from services.base_service import IAIService
 
+if TYPE_CHECKING:
+    import numpy as np
+
 # Type alias for progress callback: (fraction: float, message: str) -> None
 ProgressCallback = Callable[[float, str], Awaitable[None]]
 
+# Type alias for audio input: file path or in-memory 16kHz mono float32 samples
+AudioInput = Union[str, "np.ndarray"]
+
 
 @dataclass
 class TranscriptionSegment:
@@ -44,12 +50,12 @@ class ITranscriptionService(IAIService):
     """
 
     @abstractmethod
-    def transcribe(self, audio_path: str, language: str | None = None) -> TranscriptionResult:
+    def transcribe(self, audio_path: AudioInput, language: str | None = None) -> TranscriptionResult:
         """
         Transcribe an audio file
 
         Args:
-            audio_path: Path to the audio file
+            audio_path: Path to the audio file, or 16kHz mono float32 samples
             language: Optional language hint (e.g., 'en', 'de')
 
         Returns:
@@ -74,7 +80,7 @@ class ITranscriptionService(IAIService):
     @abstractmethod
     async def transcribe_with_progress(
         self,
-        audio_path: str,
+        audio_path: AudioInput,
         language: str | None = None,
         progress_callback: ProgressCallback | None = None,
     ) -> TranscriptionResult:
@@ -85,7 +91,7 @@ class ITranscriptionService(IAIService):
         provides actual progress based on transcription completion, not estimates.
 
         Args:
-            audio_path: Path to the audio file
+            audio_path: Path to the audio file, or 16kHz mono float32 samples
             language: Optional language hint (e.g., 'en', 'de')
             progress_callback: Async callback receiving (fraction: 0-1, message: str)
 
@@ -106,6 +112,30 @@ class ITranscriptionService(IAIService):
         """
         pass
 
+    async def transcribe_batched_with_progress(
+        self,
+        audio_path: AudioInput,
+        language: str | None = None,
+        progress_callback: ProgressCallback | None = None,
+        batch_size: int = 16,
+    ) -> TranscriptionResult:
+        """
+        Transcribe an audio file with batched decoding and progress updates.
+
+        Backends with a batched pipeline (Faster-Whisper) override this.
+        The default falls back to sequential transcribe_with_progress().
+
+        Args:
+            audio_path: Path to the audio file, or 16kHz mono float32 samples
+            language: Optional language hint (e.g., 'en', 'de')
+            progress_callback: Async callback receiving (fraction: 0-1, message: str)
+            batch_size: Number of audio windows decoded per batch
+
+        Returns:
+            TranscriptionResult with transcription details
+        """
+        return await self.transcribe_with_progress(audio_path, language, progress_callback)
+
     @abstractmethod
     def transcribe_batch(self, audio_paths: list[str], language: str | None = None) -> list[TranscriptionResult]:
         """
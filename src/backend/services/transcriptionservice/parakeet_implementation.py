@@ -9,7 +9,8 @@ from typing import Any
 
 from core.config.logging_config import get_logger
 
-from .interface import ITranscriptionService, TranscriptionResult, TranscriptionSegment
+from .decoding_bridge import run_in_decoding_thread
+from .interface import AudioInput, ITranscriptionService, ProgressCallback, TranscriptionResult, TranscriptionSegment
 
 logger = get_logger(__name__)
 
@@ -77,13 +78,13 @@ class ParakeetTranscriptionService(ITranscriptionService):
             except ImportError as e:
                 raise ImportError("NeMo toolkit not installed. Install with: pip install nemo_toolkit[asr]") from e
 
-    def transcribe(self, audio_path: str, language: str | None = None) -> TranscriptionResult:
+    def transcribe(self, audio_path: AudioInput, language: str | None = None) -> TranscriptionResult:
         """Transcribe an audio file"""
         if not self.is_initialized:
             self.initialize()
 
-        # Handle video files
-        if self._is_video_file(audio_path):
+        # Handle video files (in-memory audio is already 16kHz mono samples)
+        if isinstance(audio_path, str) and self._is_video_file(audio_path):
             audio_path = self.extract_audio_from_video(audio_path)
             cleanup = True
         else:
@@ -124,6 +125,36 @@ class ParakeetTranscriptionService(ITranscriptionService):
         # Parakeet provides timestamps when available
         return self.transcribe(audio_path, language)
 
+    async def transcribe_with_progress(
+        self,
+        audio_path: AudioInput,
+        language: str | None = None,
+        progress_callback: ProgressCallback | None = None,
+    ) -> TranscriptionResult:
+        """
+        Transcribe an audio file with progress updates.
+
+        NeMo does not expose incremental results, so progress is reported at
+        start and completion. Decoding runs on the shared decoding executor.
+
+        Args:
+            audio_path: Path to the audio file, or 16kHz mono float32 samples
+            language: Optional language hint (ignored, Parakeet is English-only)
+            progress_callback: Async callback receiving (fraction: 0-1, message: str)
+
+        Returns:
+            TranscriptionResult with transcription details
+        """
+        if progress_callback:
+            await progress_callback(0.0, "Starting transcription (Parakeet)...")
+
+        result = await run_in_decoding_thread(self.transcribe, audio_path, language)
+
+        if progress_callback:
+            await progress_callback(1.0, f"Transcription complete: {len(result.segments)} segments")
+
+        return result
+
     def transcribe_batch(self, audio_paths: list[str], language: str | None = None) -> list[TranscriptionResult]:
         """Transcribe multiple audio files in batch"""
         if not self.is_initialized:
@@ -218,8 +249,11 @@ class ParakeetTranscriptionService(ITranscriptionService):
         except ImportError:
             return False
 
-    def _get_audio_duration(self, audio_path: str) -> float:
+    def _get_audio_duration(self, audio_path: AudioInput) -> float:
         """Get duration of audio file"""
+        if not isinstance(audio_path, str):
+            # In-memory audio: 16kHz samples
+            return len(audio_path) / 16000
         try:
             from moviepy.editor import AudioFileClip
 
@@ -0,0 +1,267 @@
+"""
+Content-addressed transcription result cache.
+
+Stores TranscriptionResult segments on disk keyed by what determines the
+output of a transcription run: the source video (path, size, mtime), the
+time range, the model, the language and the decoding options. Reprocessing
+a chunk after the vocabulary game, or a second user opening the same
+episode, then skips speech recognition entirely.
+
+Entries are gzip-compressed JSON with one [start, end, text] triple per
+segment. The cache directory is bounded by a disk quota; least-recently-used
+entries are evicted first.
+
+Usage Example:
+    ```python
+    cache = get_transcription_result_cache()
+    key = cache.make_key(video_file, 0.0, 300.0, model_fingerprint(service), "de", {"batch_size": 0})
+
+    result = cache.get(key)
+    if result is None:
+        result = await service.transcribe_with_progress(audio, language="de")
+        cache.put(key, result)
+
+    print(cache.get_stats())  # {"hits": 1, "misses": 1, "hit_ratio": "50.0%", ...}
+    ```
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+from core.config.logging_config import get_logger
+from services.transcriptionservice.interface import TranscriptionResult, TranscriptionSegment
+
+logger = get_logger(__name__)
+
+ENTRY_SUFFIX = ".json.gz"
+FORMAT_VERSION = 1
+
+
+def model_fingerprint(transcription_service: Any) -> str:
+    """
+    Describe the model behind a transcription service for use in cache keys.
+
+    Uses the service's model_info (name, size, compute type...) and ignores
+    runtime-only fields such as whether the model is currently loaded.
+    """
+    info = getattr(transcription_service, "model_info", None)
+    if not isinstance(info, dict):
+        return type(transcription_service).__name__
+
+    stable = {key: value for key, value in info.items() if key not in ("loaded", "device")}
+    return json.dumps(stable, sort_keys=True, default=str)
+
+
+class TranscriptionResultCache:
+    """
+    Disk cache of transcription results with hit/miss metrics and LRU eviction.
+
+    Attributes:
+        cache_dir: Directory holding one compressed entry per cached transcription
+        max_bytes: Disk quota for all entries
+        stats: Counters for hits, misses, stores, evictions and errors
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "errors": 0}
+        self._stats_lock = threading.Lock()
+
+    def make_key(
+        self,
+        video_file: Path,
+        start_time: float,
+        end_time: float,
+        model: str,
+        language: str | None,
+        options: dict[str, Any] | None = None,
+    ) -> str:
+        """
+        Build the cache key for transcribing a range of a video.
+
+        The key changes whenever the video file is replaced (size or mtime differ)
+        or any input that affects the recognized text changes.
+        """
+        stat = video_file.stat()
+        raw = json.dumps(
+            {
+                "video": str(video_file.resolve()),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "range": [round(start_time, 3), round(end_time, 3)],
+                "model": model,
+                "language": language,
+                "options": options or {},
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def entry_path(self, key: str) -> Path:
+        """Path of the cache entry for a key"""
+        return self.cache_dir / f"{key}{ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> TranscriptionResult | None:
+        """
+        Look up a cached transcription.
+
+        Returns:
+            The cached result, or None on a miss or unreadable entry
+        """
+        path = self.entry_path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+            if payload.get("version") != FORMAT_VERSION:
+                raise ValueError(f"unsupported cache entry version {payload.get('version')}")
+            segments = [
+                TranscriptionSegment(start_time=start, end_time=end, text=text)
+                for start, end, text in payload["segments"]
+            ]
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Discarding unreadable transcription cache entry", key=key, error=str(e))
+            self._count("errors")
+            self._count("misses")
+            path.unlink(missing_ok=True)
+            return None
+
+        self._touch(path)
+        self._count("hits")
+
+        return TranscriptionResult(
+            full_text=" ".join(segment.text for segment in segments),
+            segments=segments,
+            language=payload.get("language"),
+            duration=payload.get("duration"),
+            metadata={"cached": True},
+        )
+
+    def put(self, key: str, result: TranscriptionResult) -> None:
+        """
+        Store a transcription result and enforce the disk quota.
+
+        Failures are logged and counted, never raised: the cache must not break transcription.
+        """
+        payload = {
+            "version": FORMAT_VERSION,
+            "language": result.language,
+            "duration": result.duration,
+            "segments": [
+                [round(segment.start_time, 3), round(segment.end_time, 3), segment.text] for segment in result.segments
+            ],
+        }
+        path = self.entry_path(key)
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(suffix=".partial", dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                    f.write(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+                Path(tmp_name).replace(path)
+            finally:
+                Path(tmp_name).unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("Failed to store transcription in cache", key=key, error=str(e))
+            self._count("errors")
+            return
+
+        self._count("stores")
+        logger.debug("Cached transcription", key=key, segments=len(result.segments), size=path.stat().st_size)
+        self.enforce_quota(keep=path)
+
+    def enforce_quota(self, keep: Path | None = None) -> None:
+        """
+        Evict least-recently-used entries until the cache fits its quota.
+
+        Args:
+            keep: Entry that must survive eviction (the one just added)
+        """
+        entries = []
+        for path in self.cache_dir.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if keep is not None and path == keep:
+                continue
+            try:
+                path.unlink()
+                total -= size
+                self._count("evictions")
+            except OSError as e:
+                logger.warning("Failed to evict cached transcription", path=path.name, error=str(e))
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, hit ratio, stores, evictions and errors
+        """
+        with self._stats_lock:
+            stats = dict(self.stats)
+        total = stats["hits"] + stats["misses"]
+        hit_ratio = (stats["hits"] / total * 100) if total > 0 else 0
+
+        return {**stats, "total": total, "hit_ratio": f"{hit_ratio:.1f}%"}
+
+    def reset_stats(self) -> None:
+        """Reset statistics counters."""
+        with self._stats_lock:
+            self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "errors": 0}
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self.stats[name] += 1
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        """Mark an entry as recently used (LRU order is based on mtime)"""
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+
+_transcription_result_cache: TranscriptionResultCache | None = None
+
+
+def get_transcription_result_cache() -> TranscriptionResultCache:
+    """
+    Get the process-wide transcription result cache.
+
+    Configured by LANGPLUG_TRANSCRIPTION_CACHE_DIR (default: <temp>/langplug/transcription_cache)
+    and LANGPLUG_TRANSCRIPTION_CACHE_MAX_MB.
+    """
+    global _transcription_result_cache
+    if _transcription_result_cache is None:
+        from core.config import settings
+
+        cache_dir = (
+            Path(settings.transcription_cache_dir)
+            if settings.transcription_cache_dir
+            else Path(tempfile.gettempdir()) / "langplug" / "transcription_cache"
+        )
+        max_bytes = settings.transcription_cache_max_mb * 1024 * 1024
+        _transcription_result_cache = TranscriptionResultCache(cache_dir, max_bytes)
+    return _transcription_result_cache
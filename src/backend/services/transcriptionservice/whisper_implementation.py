@@ -11,7 +11,8 @@ import whisper
 
 from core.config.logging_config import get_logger
 
-from .interface import ITranscriptionService, ProgressCallback, TranscriptionResult, TranscriptionSegment
+from .decoding_bridge import run_in_decoding_thread
+from .interface import AudioInput, ITranscriptionService, ProgressCallback, TranscriptionResult, TranscriptionSegment
 
 logger = get_logger(__name__)
 
@@ -102,13 +103,13 @@ class WhisperTranscriptionService(ITranscriptionService):
             self._model = whisper.load_model(self.model_size, device=self.device, download_root=self.download_root)
             logger.info("Whisper model loaded", model=self.model_size)
 
-    def transcribe(self, audio_path: str, language: str | None = None) -> TranscriptionResult:
+    def transcribe(self, audio_path: AudioInput, language: str | None = None) -> TranscriptionResult:
         """Transcribe an audio file"""
         if not self.is_initialized:
             self.initialize()
 
-        # Handle video files
-        if self._is_video_file(audio_path):
+        # Handle video files (in-memory audio is already 16kHz mono samples)
+        if isinstance(audio_path, str) and self._is_video_file(audio_path):
             audio_path = self.extract_audio_from_video(audio_path)
             cleanup = True
         else:
@@ -148,7 +149,7 @@ class WhisperTranscriptionService(ITranscriptionService):
 
     async def transcribe_with_progress(
         self,
-        audio_path: str,
+        audio_path: AudioInput,
         language: str | None = None,
         progress_callback: ProgressCallback | None = None,
     ) -> TranscriptionResult:
@@ -160,22 +161,20 @@ class WhisperTranscriptionService(ITranscriptionService):
         For real progress tracking, use FasterWhisperTranscriptionService.
 
         Args:
-            audio_path: Path to the audio file
+            audio_path: Path to the audio file, or 16kHz mono float32 samples
             language: Optional language hint (e.g., 'en', 'de')
             progress_callback: Async callback receiving (fraction: 0-1, message: str)
 
         Returns:
             TranscriptionResult with transcription details
         """
-        import asyncio
-
         # Report starting
         if progress_callback:
             await progress_callback(0.0, "Starting transcription (OpenAI Whisper)...")
 
         # OpenAI Whisper's transcribe is synchronous and doesn't provide progress
-        # Run in executor to avoid blocking the event loop
-        result = await asyncio.to_thread(self.transcribe, audio_path, language)
+        # Run on the shared decoding executor to avoid blocking the event loop
+        result = await run_in_decoding_thread(self.transcribe, audio_path, language)
 
         # Report completion
         if progress_callback:
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Translation Model CLI Tool
+
+Command-line interface for preparing CTranslate2 translation models ahead of
+deployment. Prepared models (converted, quantized, tokenizer included) are
+loaded straight from LANGPLUG_TRANSLATION_MODELS_PATH at startup, so the first
+translation request never converts a model.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add backend directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from core.config.logging_config import get_logger
+from services.translationservice.factory import TranslationServiceFactory
+from services.translationservice.opus_ct2_implementation import (
+    is_prepared_model,
+    prepare_ct2_model,
+    prepared_model_dir,
+)
+
+logger = get_logger(__name__)
+
+QUANTIZATIONS = ["int8", "int8_float16", "int16", "float16", "float32"]
+
+
+def _models_dir(args) -> Path:
+    if args.output_dir:
+        return Path(args.output_dir)
+
+    from core.config import settings
+
+    return settings.get_translation_models_path()
+
+
+def _selected_models(args) -> list[str]:
+    """Models named on the command line, or every registered OPUS-CT2 model"""
+    models = list(args.model or [])
+    models += [f"Helsinki-NLP/opus-mt-{pair}" for pair in args.pair or []]
+    return models or TranslationServiceFactory.get_ct2_model_names()
+
+
+def prepare_models(args):
+    """Convert and quantize translation models into the models directory."""
+    models_dir = _models_dir(args)
+    failed = []
+
+    for model_name in _selected_models(args):
+        model_dir = prepared_model_dir(models_dir, model_name)
+        if is_prepared_model(model_dir) and not args.force:
+            logger.info("Model already prepared", model=model_name, path=str(model_dir))
+            continue
+
+        try:
+            prepare_ct2_model(model_name, model_dir, quantization=args.quantization, force=args.force)
+        except Exception as e:
+            logger.error("Failed to prepare model", model=model_name, error=str(e))
+            failed.append(model_name)
+
+    if failed:
+        logger.error("Some models could not be prepared", models=failed)
+        return 1
+    return 0
+
+
+def list_models(args):
+    """Show which translation models are prepared."""
+    models_dir = _models_dir(args)
+
+    for model_name in _selected_models(args):
+        model_dir = prepared_model_dir(models_dir, model_name)
+        logger.info("Translation model", model=model_name, prepared=is_prepared_model(model_dir), path=str(model_dir))
+
+    return 0
+
+
+def main(argv: list[str] | None = None):
+    """Main CLI entry point."""
+    # Model selection options, shared by every command
+    selection = argparse.ArgumentParser(add_help=False)
+    selection.add_argument("--output-dir", "-o", help="Models directory (default: LANGPLUG_TRANSLATION_MODELS_PATH)")
+    selection.add_argument("--pair", "-p", action="append", help="Language pair such as de-en (repeatable)")
+    selection.add_argument("--model", "-m", action="append", help="HuggingFace model name (repeatable)")
+
+    parser = argparse.ArgumentParser(
+        description="LangPlug Translation Model CLI",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s prepare                          # Convert every registered OPUS-CT2 model (int8)
+  %(prog)s prepare --pair de-en --pair de-es
+  %(prog)s prepare --quantization float16   # For GPU deployments
+  %(prog)s list                             # Show prepared models
+""",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # Prepare command
+    prepare_parser = subparsers.add_parser(
+        "prepare", parents=[selection], help="Convert and quantize models ahead of time"
+    )
+    prepare_parser.add_argument(
+        "--quantization", "-q", choices=QUANTIZATIONS, default="int8", help="Weight quantization (default: int8, CPU)"
+    )
+    prepare_parser.add_argument("--force", "-f", action="store_true", help="Convert again if already prepared")
+
+    # List command
+    subparsers.add_parser("list", parents=[selection], help="Show prepared models")
+
+    args = parser.parse_args(argv)
+
+    if not args.command:
+        parser.print_help()
+        return 1
+
+    # Command dispatch
+    commands = {
+        "prepare": prepare_models,
+        "list": list_models,
+    }
+
+    return commands[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Worker-thread executor for translation backends.
+
+Machine translation (CTranslate2, Transformers pipelines) is synchronous and
+keeps the CPU/GPU busy for the whole batch. Running it on the asyncio thread
+stalls every other request served by the process while a chunk translates.
+
+This module runs translation calls on a dedicated, bounded thread pool.
+CTranslate2 releases the GIL while translating, so the event loop keeps
+serving requests in the meantime.
+
+Usage Example:
+    ```python
+    results = await run_in_translation_thread(service.translate_batch, texts, "de", "en")
+
+    # Or through the service interface
+    results = await service.translate_batch_async(texts, "de", "en")
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from core.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_translation_executor() -> ThreadPoolExecutor:
+    """
+    Get the process-wide executor used for translation.
+
+    The pool is bounded by LANGPLUG_TRANSLATION_WORKERS so that concurrent chunk
+    requests queue up instead of oversubscribing the CPU/GPU.
+
+    Returns:
+        Shared ThreadPoolExecutor (created lazily)
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                from core.config import settings
+
+                workers = max(1, settings.translation_workers)
+                _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mt-translate")
+                logger.debug("Created translation executor", workers=workers)
+    return _executor
+
+
+def shutdown_translation_executor() -> None:
+    """Shut down the shared translation executor (used on application shutdown and in tests)"""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+async def run_in_translation_thread(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking translation call on the shared translation executor.
+
+    Args:
+        func: Synchronous callable (e.g. a service's translate_batch method)
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Return value of func
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_translation_executor(), lambda: func(*args, **kwargs))
@@ -125,6 +125,39 @@ class TranslationServiceFactory:
         Raises:
             ValueError: If service_name is not registered
         """
+        service_class, filtered_config = cls._resolve_service(service_name, kwargs)
+
+        # Check if we already have an instance
+        cache_key = f"{service_name.lower()}_{filtered_config!s}"
+        if cache_key in cls._instances:
+            return cls._instances[cache_key]
+
+        # Create new instance
+        instance = service_class(**filtered_config)
+
+        # Cache the instance
+        cls._instances[cache_key] = instance
+
+        return instance
+
+    @classmethod
+    def create_uncached_service(cls, service_name: str = "nllb", **kwargs) -> ITranslationService:
+        """
+        Create a new translation service instance that the factory does not cache
+
+        For owners that unload their instances themselves (the translation model
+        registry): a cached instance would still be handed out by create_service
+        after its model was unloaded.
+
+        Raises:
+            ValueError: If service_name is not registered
+        """
+        service_class, filtered_config = cls._resolve_service(service_name, kwargs)
+        return service_class(**filtered_config)
+
+    @classmethod
+    def _resolve_service(cls, service_name: str, kwargs: dict) -> tuple[type[ITranslationService], dict]:
+        """Resolve the service class and its constructor arguments"""
         service_name = service_name.lower()
 
         if service_name not in cls._services:
@@ -152,20 +185,7 @@ class TranslationServiceFactory:
         # Filter out parameters that are not constructor arguments
         # source_lang and target_lang are used at translation time, not init time
         filtered_config = {k: v for k, v in config.items() if k not in ("source_lang", "target_lang", "quality")}
-
-        # Check if we already have an instance
-        cache_key = f"{service_name}_{filtered_config!s}"
-        if cache_key in cls._instances:
-            return cls._instances[cache_key]
-
-        # Create new instance
-        service_class = cls._services[service_name]
-        instance = service_class(**filtered_config)
-
-        # Cache the instance
-        cls._instances[cache_key] = instance
-
-        return instance
+        return service_class, filtered_config
 
     @classmethod
     def get_available_services(cls) -> dict[str, str]:
@@ -201,6 +221,25 @@ class TranslationServiceFactory:
             "opus-hf": "OPUS-MT HuggingFace - Standard Transformers (slower)",
         }
 
+    @classmethod
+    def get_ct2_model_names(cls) -> list[str]:
+        """
+        Get the HuggingFace models behind the registered OPUS-CT2 services
+
+        Returns:
+            Unique model names in registration order
+        """
+        ct2_class_path = "services.translationservice.opus_ct2_implementation.OpusCT2TranslationService"
+        model_names = []
+        for service_name, cls_or_path in cls._services.items():
+            class_path = (
+                cls_or_path if isinstance(cls_or_path, str) else f"{cls_or_path.__module__}.{cls_or_path.__qualname__}"
+            )
+            model_name = cls._default_configs.get(service_name, {}).get("model_name")
+            if class_path == ct2_class_path and model_name and model_name not in model_names:
+                model_names.append(model_name)
+        return model_names
+
     @classmethod
     def cleanup_all(cls) -> None:
         """Clean up all cached service instances"""
@@ -58,6 +58,36 @@ class ITranslationService(IAIService):
         """
         pass
 
+    async def translate_batch_async(
+        self, texts: list[str], source_lang: str, target_lang: str
+    ) -> list[TranslationResult]:
+        """
+        Translate multiple texts in batch without blocking the event loop
+
+        Runs translate_batch on the shared, bounded translation executor.
+
+        Args:
+            texts: List of texts to translate
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Returns:
+            List of TranslationResult objects
+        """
+        from services.translationservice.executor import run_in_translation_thread
+
+        return await run_in_translation_thread(self.translate_batch, texts, source_lang, target_lang)
+
+    @property
+    def memory_footprint_mb(self) -> float | None:
+        """
+        Approximate memory held by the loaded model in MB
+
+        Returns:
+            0 when no model is loaded, None if the implementation cannot tell
+        """
+        return None if self.is_initialized else 0.0
+
     @abstractmethod
     def get_supported_languages(self) -> dict[str, str]:
         """
@@ -0,0 +1,189 @@
+"""
+Cross-request micro-batching for translation models.
+
+When several users process chunks at the same time, each request sends its own
+translate_batch calls to the same cached model. CTranslate2 reaches much
+higher throughput on one large batch than on several small ones, so this
+module coalesces the calls that arrive within a few milliseconds of each
+other into a single translate_batch call and hands every caller its slice of
+the results.
+
+Key Components:
+    - TranslationMicroBatcher: Per-model queue coalescing pending requests by language pair
+    - get_translation_micro_batcher: Process-wide batcher for a translation service
+    - discard_translation_micro_batcher: Drop the batcher of an unloaded service
+
+Usage Example:
+    ```python
+    batcher = get_translation_micro_batcher(translation_service)
+
+    # Concurrent callers share model calls
+    results = await batcher.translate_batch(["Hallo Welt"], "de", "en")
+    ```
+
+Thread Safety:
+    Single event loop only. Model calls run on the translation executor.
+
+Performance Notes:
+    - Adds at most max_wait_ms latency to a request that finds no partners
+    - A batch is dispatched immediately once max_batch_size texts are pending
+    - Requests for different language pairs are never mixed
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+
+from core.config.logging_config import get_logger
+from services.translationservice.interface import ITranslationService, TranslationResult
+
+logger = get_logger(__name__)
+
+LanguagePair = tuple[str, str]
+
+
+@dataclass
+class _PendingRequest:
+    """Texts of one caller waiting for the next batch"""
+
+    texts: list[str]
+    future: asyncio.Future
+
+
+class TranslationMicroBatcher:
+    """
+    Coalesces concurrent translation requests for one model.
+
+    Attributes:
+        service: Translation service the batches are sent to
+        max_batch_size: Number of pending texts that triggers an immediate dispatch
+        max_wait_ms: Time the first request of a batch waits for partners
+        stats: Counters for requests, dispatched batches and translated texts
+    """
+
+    def __init__(self, service: ITranslationService, max_batch_size: int = 64, max_wait_ms: float = 5.0):
+        self.service = service
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max_wait_ms
+        self.stats = {"requests": 0, "batches": 0, "texts": 0}
+        self._pending: dict[LanguagePair, list[_PendingRequest]] = {}
+        self._timers: dict[LanguagePair, asyncio.Task] = {}
+        self._batches: set[asyncio.Task] = set()
+
+    async def translate_batch(self, texts: list[str], source_lang: str, target_lang: str) -> list[TranslationResult]:
+        """
+        Translate texts as part of the next shared batch.
+
+        Args:
+            texts: Texts of this caller
+            source_lang: Source language code
+            target_lang: Target language code
+
+        Returns:
+            Translation results for exactly these texts, in order
+
+        Raises:
+            Whatever the model call raised for the batch containing these texts
+        """
+        if not texts:
+            return []
+
+        key = (source_lang, target_lang)
+        request = _PendingRequest(list(texts), asyncio.get_running_loop().create_future())
+        pending = self._pending.setdefault(key, [])
+        pending.append(request)
+        self.stats["requests"] += 1
+
+        if sum(len(item.texts) for item in pending) >= self.max_batch_size:
+            self._dispatch(key)
+        elif key not in self._timers:
+            self._timers[key] = asyncio.create_task(self._dispatch_after_wait(key))
+
+        return await request.future
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get batching statistics.
+
+        Returns:
+            Dictionary with requests, batches, texts and the average texts per batch
+        """
+        batches = self.stats["batches"]
+        texts_per_batch = self.stats["texts"] / batches if batches > 0 else 0
+        requests_per_batch = self.stats["requests"] / batches if batches > 0 else 0
+
+        return {
+            **self.stats,
+            "texts_per_batch": round(texts_per_batch, 1),
+            "requests_per_batch": round(requests_per_batch, 1),
+        }
+
+    async def _dispatch_after_wait(self, key: LanguagePair) -> None:
+        await asyncio.sleep(self.max_wait_ms / 1000)
+        self._dispatch(key)
+
+    def _dispatch(self, key: LanguagePair) -> None:
+        """Send everything pending for a language pair as one batch"""
+        timer = self._timers.pop(key, None)
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+
+        requests = self._pending.pop(key, [])
+        if not requests:
+            return
+
+        task = asyncio.create_task(self._run_batch(key, requests))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+
+    async def _run_batch(self, key: LanguagePair, requests: list[_PendingRequest]) -> None:
+        texts = [text for request in requests for text in request.texts]
+        self.stats["batches"] += 1
+        self.stats["texts"] += len(texts)
+        logger.debug("Dispatching translation micro-batch", pair=key, requests=len(requests), texts=len(texts))
+
+        try:
+            results = await self.service.translate_batch_async(texts, *key)
+            if len(results) != len(texts):
+                raise ValueError(f"Expected {len(texts)} translations, got {len(results)}")
+        except Exception as e:
+            for request in requests:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        offset = 0
+        for request in requests:
+            end = offset + len(request.texts)
+            if not request.future.done():  # The caller may have been cancelled meanwhile
+                request.future.set_result(results[offset:end])
+            offset = end
+
+
+_micro_batchers: dict[ITranslationService, TranslationMicroBatcher] = {}
+
+
+def get_translation_micro_batcher(service: ITranslationService) -> TranslationMicroBatcher:
+    """
+    Get the process-wide micro-batcher for a translation service (one per model instance).
+
+    Configured by LANGPLUG_TRANSLATION_MICRO_BATCH_MAX_SIZE and LANGPLUG_TRANSLATION_MICRO_BATCH_WAIT_MS.
+    """
+    batcher = _micro_batchers.get(service)
+    if batcher is None:
+        from core.config import settings
+
+        batcher = TranslationMicroBatcher(
+            service,
+            max_batch_size=settings.translation_micro_batch_max_size,
+            max_wait_ms=settings.translation_micro_batch_wait_ms,
+        )
+        _micro_batchers[service] = batcher
+    return batcher
+
+
+def discard_translation_micro_batcher(service: ITranslationService) -> None:
+    """Forget the micro-batcher of a translation service that is being unloaded"""
+    _micro_batchers.pop(service, None)
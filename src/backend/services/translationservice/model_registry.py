@@ -0,0 +1,247 @@
+"""
+Process-wide registry of loaded translation models.
+
+Every language pair needs its own OPUS-MT model, and each loaded model holds
+hundreds of megabytes. The registry is the single owner of translation service
+instances in the process: callers acquire a model for the duration of a
+translation and release it afterwards, and idle models are unloaded in
+least-recently-used order once the loaded models exceed a memory budget.
+Services registered here must not be cached anywhere else (create them with
+TranslationServiceFactory.create_uncached_service), or an unloaded model would
+be handed out again.
+
+Key Components:
+    - TranslationModelRegistry: Reference-counted, LRU-evicting model registry
+    - get_translation_model_registry: Process-wide registry instance
+
+Usage Example:
+    ```python
+    registry = get_translation_model_registry()
+
+    with registry.lease(("opus", "Helsinki-NLP/opus-mt-de-en"), create_service) as service:
+        results = await service.translate_batch_async(texts, "de", "en")
+    # The model stays loaded until memory is needed for another one
+    ```
+
+Thread Safety:
+    Yes. Registry state is guarded by a lock; models are created and unloaded
+    outside of it.
+
+Performance Notes:
+    - Acquiring a registered model: O(1)
+    - Models in use (reference count > 0) are never evicted; the budget may be
+      exceeded temporarily while they are
+    - Unloaded models are loaded again lazily on their next translation
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from core.config.logging_config import get_logger
+from services.translationservice.interface import ITranslationService
+from services.translationservice.micro_batcher import discard_translation_micro_batcher
+
+logger = get_logger(__name__)
+
+# Assumed footprint of a loaded model whose service cannot report its own size
+UNKNOWN_MODEL_MEMORY_MB = 500.0
+
+
+@dataclass
+class _RegisteredModel:
+    """A translation service and the number of callers currently using it"""
+
+    service: ITranslationService
+    references: int = 0
+
+
+@dataclass
+class _CreationLock:
+    """Serializes creation of one key; dropped once no acquire for the key is in progress"""
+
+    lock: threading.Lock
+    users: int = 0
+
+
+class TranslationModelRegistry:
+    """
+    Reference-counted registry of translation services with an LRU memory budget.
+
+    Attributes:
+        memory_budget_mb: Memory the loaded models may use before idle ones are unloaded
+        stats: Counters for hits, loads (new services) and evictions
+    """
+
+    def __init__(self, memory_budget_mb: float = 2048):
+        self.memory_budget_mb = memory_budget_mb
+        self.stats = {"hits": 0, "loads": 0, "evictions": 0}
+        self._models: OrderedDict[Hashable, _RegisteredModel] = OrderedDict()
+        self._creating: dict[Hashable, _CreationLock] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: Hashable, create: Callable[[], ITranslationService]) -> ITranslationService:
+        """
+        Get the service registered under key, creating it if needed, and take a reference.
+
+        Args:
+            key: Model identity (e.g. service type and model name)
+            create: Factory called once when the key is not registered
+
+        Returns:
+            Translation service; call release(key) when done with it
+        """
+        with self._lock:
+            creating = self._creating.get(key)
+            if creating is None:
+                creating = self._creating[key] = _CreationLock(threading.Lock())
+            creating.users += 1
+
+        try:
+            # Serializes creation per key without blocking other keys
+            with creating.lock:
+                with self._lock:
+                    entry = self._models.get(key)
+                    if entry is not None:
+                        entry.references += 1
+                        self._models.move_to_end(key)
+                        self.stats["hits"] += 1
+                        return entry.service
+
+                service = create()
+                with self._lock:
+                    self._models[key] = _RegisteredModel(service, references=1)
+                    self.stats["loads"] += 1
+                logger.info("Registered translation model", key=str(key), models=len(self._models))
+        finally:
+            with self._lock:
+                creating.users -= 1
+                if creating.users == 0:
+                    del self._creating[key]
+
+        self._evict_idle_models()
+        return service
+
+    def release(self, key: Hashable) -> None:
+        """
+        Drop a reference taken by acquire and unload idle models if over budget.
+
+        Args:
+            key: Key passed to acquire
+        """
+        with self._lock:
+            entry = self._models.get(key)
+            if entry is None or entry.references == 0:
+                logger.debug("Release of unreferenced translation model ignored", key=str(key))
+                return
+            entry.references -= 1
+
+        self._evict_idle_models()
+
+    @contextmanager
+    def lease(self, key: Hashable, create: Callable[[], ITranslationService]) -> Iterator[ITranslationService]:
+        """Acquire a service for the duration of a with-block"""
+        service = self.acquire(key, create)
+        try:
+            yield service
+        finally:
+            self.release(key)
+
+    def memory_usage_mb(self) -> float:
+        """Approximate memory held by all loaded models"""
+        with self._lock:
+            services = [entry.service for entry in self._models.values()]
+        return sum(self._footprint(service) for service in services)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get registry statistics.
+
+        Returns:
+            Dictionary with hits, loads, evictions, hit ratio, registered and in-use models and memory use
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            registered = len(self._models)
+            in_use = sum(1 for entry in self._models.values() if entry.references > 0)
+        total = stats["hits"] + stats["loads"]
+        hit_ratio = (stats["hits"] / total * 100) if total > 0 else 0
+
+        return {
+            **stats,
+            "hit_ratio": f"{hit_ratio:.1f}%",
+            "registered": registered,
+            "in_use": in_use,
+            "memory_mb": round(self.memory_usage_mb(), 1),
+            "memory_budget_mb": self.memory_budget_mb,
+        }
+
+    def reset_stats(self) -> None:
+        """Reset statistics counters."""
+        with self._lock:
+            self.stats = {"hits": 0, "loads": 0, "evictions": 0}
+
+    def clear(self) -> None:
+        """Unload and forget all idle models (models in use stay registered)"""
+        with self._lock:
+            idle = [key for key, entry in self._models.items() if entry.references == 0]
+            evicted = [(key, self._models.pop(key).service) for key in idle]
+        for key, service in evicted:
+            self._unload(key, service)
+
+    def _evict_idle_models(self) -> None:
+        """Unload least recently used idle models until the loaded models fit the budget"""
+        evicted: list[tuple[Hashable, ITranslationService]] = []
+        with self._lock:
+            usage = sum(self._footprint(entry.service) for entry in self._models.values())
+            for key in list(self._models):
+                if usage <= self.memory_budget_mb:
+                    break
+                entry = self._models[key]
+                if entry.references > 0:
+                    continue
+                usage -= self._footprint(entry.service)
+                del self._models[key]
+                evicted.append((key, entry.service))
+            self.stats["evictions"] += len(evicted)
+
+        for key, service in evicted:
+            logger.info("Evicting translation model", key=str(key), memory_budget_mb=self.memory_budget_mb)
+            self._unload(key, service)
+
+    @staticmethod
+    def _unload(key: Hashable, service: ITranslationService) -> None:
+        """Unload an unregistered model and drop the micro-batcher bound to it"""
+        discard_translation_micro_batcher(service)
+        try:
+            service.cleanup()
+        except Exception as e:
+            logger.warning("Translation model cleanup failed", key=str(key), error=str(e))
+
+    @staticmethod
+    def _footprint(service: ITranslationService) -> float:
+        # Registered third-party services may not implement memory_footprint_mb
+        footprint = getattr(service, "memory_footprint_mb", None)
+        return float(footprint) if isinstance(footprint, int | float) else UNKNOWN_MODEL_MEMORY_MB
+
+
+_registry: TranslationModelRegistry | None = None
+
+
+def get_translation_model_registry() -> TranslationModelRegistry:
+    """
+    Get the process-wide translation model registry.
+
+    Configured by LANGPLUG_TRANSLATION_MODEL_MEMORY_BUDGET_MB.
+    """
+    global _registry
+    if _registry is None:
+        from core.config import settings
+
+        _registry = TranslationModelRegistry(settings.translation_model_memory_budget_mb)
+    return _registry
@@ -10,6 +10,7 @@ from transformers import AutoModelForSeq2SeqLM, AutoTokenizer, pipeline
 
 from core.config.logging_config import get_logger
 
+from .batching import adaptive_decoding_length, length_buckets
 from .interface import ITranslationService, TranslationResult
 
 logger = get_logger(__name__)
@@ -134,17 +135,39 @@ class NLLBTranslationService(ITranslationService):
             metadata={"model": self.model_name, "device": self.device_str},
         )
 
-    def translate_batch(self, texts: list[str], source_lang: str, target_lang: str) -> list[TranslationResult]:
-        """Translate multiple texts in batch"""
+    def translate_batch(
+        self, texts: list[str], source_lang: str, target_lang: str, batch_size: int = 16
+    ) -> list[TranslationResult]:
+        """
+        Translate multiple texts in batch
+
+        Inputs are grouped into buckets of similar token length (batch_size each) so one long
+        subtitle does not pad a whole batch; each bucket is decoded with a max_length derived
+        from its longest input.
+        """
         if not self.is_initialized:
             self.initialize()
 
+        if not texts:
+            return []
+
         # Convert language codes to NLLB format
         src_lang = self.LANGUAGE_CODES.get(source_lang, source_lang)
         tgt_lang = self.LANGUAGE_CODES.get(target_lang, target_lang)
 
-        # Perform batch translation
-        results = self._translator(texts, src_lang=src_lang, tgt_lang=tgt_lang)
+        # Perform batch translation, bucketed by token length and restored to input order
+        lengths = [len(input_ids) for input_ids in self._tokenizer(texts)["input_ids"]]
+        results = [None] * len(texts)
+        for bucket in length_buckets(lengths, batch_size):
+            bucket_results = self._translator(
+                [texts[i] for i in bucket],
+                src_lang=src_lang,
+                tgt_lang=tgt_lang,
+                batch_size=len(bucket),
+                max_length=adaptive_decoding_length([lengths[i] for i in bucket], limit=self.max_length),
+            )
+            for position, result in zip(bucket, bucket_results, strict=True):
+                results[position] = result
 
         # Create TranslationResult objects
         translation_results = []
@@ -7,20 +7,80 @@ Uses CTranslate2 for significantly faster inference:
 - 75% less memory usage
 - INT8/FP16 quantization support
 
+Converted models live in LANGPLUG_TRANSLATION_MODELS_PATH. Prepare them ahead of
+deployment so cold start loads straight from disk:
+
+    python -m services.translationservice.cli prepare
+
 See: https://github.com/OpenNMT/CTranslate2
 """
 
-import tempfile
+import shutil
 from pathlib import Path
 from typing import Any
 
 from core.config.logging_config import get_logger
 
+from .batching import adaptive_decoding_length, length_buckets
 from .interface import ITranslationService, TranslationResult
 
 logger = get_logger(__name__)
 
 
+def prepared_model_dir(models_dir: Path, model_name: str) -> Path:
+    """Directory of the converted CTranslate2 model for a HuggingFace model name"""
+    model_safe_name = model_name.replace("/", "_").replace("-", "_")
+    return Path(models_dir) / f"{model_safe_name}_ct2"
+
+
+def is_prepared_model(model_dir: Path) -> bool:
+    """Check whether a converted CTranslate2 model exists in model_dir"""
+    return (Path(model_dir) / "model.bin").exists()
+
+
+def prepare_ct2_model(model_name: str, model_dir: Path, quantization: str = "int8", force: bool = False) -> Path:
+    """
+    Convert a HuggingFace OPUS-MT model to CTranslate2 and save its tokenizer alongside.
+
+    The model is converted into a temporary sibling directory and moved into place
+    afterwards, so an interrupted conversion never leaves a half-written model behind.
+
+    Args:
+        model_name: HuggingFace model name
+        model_dir: Target directory (see prepared_model_dir)
+        quantization: Weight quantization ('int8' for CPU, 'float16'/'int8_float16' for GPU)
+        force: Convert even if a prepared model already exists
+
+    Returns:
+        The model directory
+    """
+    import ctranslate2
+    from transformers import AutoTokenizer
+
+    model_dir = Path(model_dir)
+    if is_prepared_model(model_dir) and not force:
+        return model_dir
+
+    logger.info("Converting model to CTranslate2 format", source=model_name, quantization=quantization)
+    staging_dir = model_dir.with_name(f"{model_dir.name}.tmp")
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    staging_dir.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        converter = ctranslate2.converters.TransformersConverter(model_name)
+        converter.convert(str(staging_dir), quantization=quantization, force=True)
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(str(staging_dir))
+    except Exception as e:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        logger.error("CT2 conversion failed", model=model_name, error=str(e))
+        raise
+
+    shutil.rmtree(model_dir, ignore_errors=True)
+    staging_dir.rename(model_dir)
+    logger.info("Model converted to CT2 format", path=str(model_dir))
+    return model_dir
+
+
 class OpusCT2TranslationService(ITranslationService):
     """
     CTranslate2-optimized OPUS-MT implementation.
@@ -36,6 +96,8 @@ class OpusCT2TranslationService(ITranslationService):
     GPU_COMPUTE_TYPES = ["float16", "int8_float16", "int8", "float32"]
     # Compute types for CPU
     CPU_COMPUTE_TYPES = ["int8", "int16", "float32"]
+    # Upper bound for max_decoding_length (the actual limit adapts to the input length)
+    MAX_DECODING_LENGTH = 256
 
     def __init__(
         self,
@@ -44,6 +106,7 @@ class OpusCT2TranslationService(ITranslationService):
         compute_type: str | None = None,
         inter_threads: int = 1,
         intra_threads: int = 4,
+        models_dir: str | Path | None = None,
     ):
         """
         Initialize CTranslate2 OPUS-MT translation service.
@@ -54,12 +117,14 @@ class OpusCT2TranslationService(ITranslationService):
             compute_type: Quantization type ('float16', 'int8', 'int8_float16', etc.)
             inter_threads: Number of workers for parallel translations
             intra_threads: Number of threads per worker (CPU only)
+            models_dir: Directory of prepared CT2 models (default: LANGPLUG_TRANSLATION_MODELS_PATH)
         """
         self.model_name = model_name
         self.device = device or "auto"
         self._compute_type = compute_type
         self.inter_threads = inter_threads
         self.intra_threads = intra_threads
+        self.models_dir = models_dir
 
         self._translator = None
         self._tokenizer = None
@@ -76,37 +141,29 @@ class OpusCT2TranslationService(ITranslationService):
         return "int8"  # Best for CPU
 
     def _get_or_convert_model(self) -> str:
-        """Get converted CTranslate2 model path, converting if needed."""
-        import ctranslate2
-
-        # Cache directory for converted models
-        cache_dir = Path(tempfile.gettempdir()) / "ctranslate2_models"
-        cache_dir.mkdir(parents=True, exist_ok=True)
-
-        # Model-specific cache path
-        model_safe_name = self.model_name.replace("/", "_").replace("-", "_")
-        model_dir = cache_dir / f"{model_safe_name}_ct2"
+        """Get the prepared CTranslate2 model path, converting now if it was not prepared ahead of time."""
+        model_dir = prepared_model_dir(self._get_models_dir(), self.model_name)
 
-        if model_dir.exists() and (model_dir / "model.bin").exists():
-            logger.debug("Using cached CT2 model", path=str(model_dir))
+        if is_prepared_model(model_dir):
+            logger.debug("Using prepared CT2 model", path=str(model_dir))
             return str(model_dir)
 
-        logger.info("Converting model to CTranslate2 format", source=self.model_name)
+        logger.warning(
+            "CT2 model not prepared ahead of time, converting now",
+            model=self.model_name,
+            hint="python -m services.translationservice.cli prepare",
+        )
+        quantization = "float16" if self.device == "cuda" else "int8"
+        prepare_ct2_model(self.model_name, model_dir, quantization=quantization)
+        return str(model_dir)
 
-        # Convert the model
-        try:
-            ct2_converter = ctranslate2.converters.TransformersConverter(self.model_name)
-            ct2_converter.convert(
-                str(model_dir),
-                quantization="float16",  # Convert with FP16 for smaller size
-                force=True,
-            )
-            logger.info("Model converted to CT2 format")
-        except Exception as e:
-            logger.error("CT2 conversion failed", error=str(e))
-            raise
+    def _get_models_dir(self) -> Path:
+        if self.models_dir is not None:
+            return Path(self.models_dir)
 
-        return str(model_dir)
+        from core.config import settings
+
+        return settings.get_translation_models_path()
 
     def initialize(self) -> None:
         """Initialize the CTranslate2 translator"""
@@ -145,9 +202,10 @@ class OpusCT2TranslationService(ITranslationService):
         model_path = self._get_or_convert_model()
         self._model_path = model_path
 
-        # Load tokenizer from original model
-        logger.debug("Loading tokenizer", model=self.model_name)
-        self._tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        # Load tokenizer saved next to the prepared model (falls back to the original model)
+        tokenizer_source = model_path if (Path(model_path) / "tokenizer_config.json").exists() else self.model_name
+        logger.debug("Loading tokenizer", source=tokenizer_source)
+        self._tokenizer = AutoTokenizer.from_pretrained(tokenizer_source)
 
         # Create CTranslate2 translator
         device_index = 0 if self.device == "cuda" else -1
@@ -188,37 +246,36 @@ class OpusCT2TranslationService(ITranslationService):
             source_lang: Source language code
             target_lang: Target language code
             beam_size: Beam search size (higher = better quality, slower)
-            max_batch_size: Maximum batch size for parallel processing
+            max_batch_size: Maximum batch size; inputs are bucketed by token length into batches of this size
         """
         if not self.is_initialized:
             self.initialize()
 
-        # Tokenize using the proper method for Marian models
-        # Convert text to token IDs, then to token strings for CTranslate2
-        tokenized = []
-        for text in texts:
-            tokens = self._tokenizer.encode(text, add_special_tokens=True)
-            token_strs = self._tokenizer.convert_ids_to_tokens(tokens)
-            tokenized.append(token_strs)
-
-        # Translate with CTranslate2
-        results = self._translator.translate_batch(
-            tokenized,
-            beam_size=beam_size,
-            max_batch_size=max_batch_size,
-            return_scores=False,
-            max_decoding_length=256,
-        )
+        # Tokenize the whole batch at once (CTranslate2 expects token strings)
+        tokenized = self._encode_batch(texts)
+
+        # Translate with CTranslate2, one call per bucket of similar length so a long
+        # subtitle neither pads nor prolongs the decoding of short ones
+        lengths = [len(tokens) for tokens in tokenized]
+        results = [None] * len(tokenized)
+        for bucket in length_buckets(lengths, max_batch_size):
+            bucket_results = self._translator.translate_batch(
+                [tokenized[i] for i in bucket],
+                beam_size=beam_size,
+                max_batch_size=max_batch_size,
+                return_scores=False,
+                max_decoding_length=adaptive_decoding_length(
+                    [lengths[i] for i in bucket], limit=self.MAX_DECODING_LENGTH
+                ),
+            )
+            for position, result in zip(bucket, bucket_results, strict=True):
+                results[position] = result
 
-        # Decode and create results
-        translation_results = []
-        for text, result in zip(texts, results, strict=False):
-            # Decode tokens back to text
-            translated_tokens = result.hypotheses[0]
-            # Convert tokens to IDs then decode
-            token_ids = self._tokenizer.convert_tokens_to_ids(translated_tokens)
-            translated_text = self._tokenizer.decode(token_ids, skip_special_tokens=True)
+        # Decode all best hypotheses at once and create results
+        translated_texts = self._decode_batch([result.hypotheses[0] for result in results])
 
+        translation_results = []
+        for text, translated_text in zip(texts, translated_texts, strict=False):
             translation_results.append(
                 TranslationResult(
                     original_text=text,
@@ -236,6 +293,29 @@ class OpusCT2TranslationService(ITranslationService):
 
         return translation_results
 
+    def _encode_batch(self, texts: list[str]) -> list[list[str]]:
+        """
+        Tokenize texts into source token strings (including </s>) in one call.
+
+        Goes through the tokenizer's batched __call__ API rather than its SentencePiece
+        model, so Marian's preprocessing (Moses punctuation normalization, >>xx<<
+        target-language prefixes) is applied exactly as for single texts.
+        """
+        input_ids = self._tokenizer(texts, add_special_tokens=True)["input_ids"]
+        return [self._tokenizer.convert_ids_to_tokens(ids) for ids in input_ids]
+
+    def _decode_batch(self, hypotheses: list[list[str]]) -> list[str]:
+        """Detokenize target token strings in one call, dropping special tokens"""
+        special_tokens = set(self._tokenizer.all_special_tokens)
+        hypotheses = [[token for token in tokens if token not in special_tokens] for tokens in hypotheses]
+
+        spm_target = getattr(self._tokenizer, "spm_target", None)
+        if spm_target is not None:
+            return spm_target.decode(hypotheses) if hypotheses else []
+
+        token_ids = [self._tokenizer.convert_tokens_to_ids(tokens) for tokens in hypotheses]
+        return self._tokenizer.batch_decode(token_ids, skip_special_tokens=True)
+
     def get_supported_languages(self) -> dict[str, str]:
         """Get dictionary of supported languages"""
         return {
@@ -281,6 +361,14 @@ class OpusCT2TranslationService(ITranslationService):
         """Check if the service is initialized"""
         return self._translator is not None
 
+    @property
+    def memory_footprint_mb(self) -> float | None:
+        """Approximate memory of the loaded model (size of the converted weights)"""
+        if self._translator is None:
+            return 0.0
+        model_file = Path(self._model_path) / "model.bin"
+        return model_file.stat().st_size / (1024 * 1024) if model_file.exists() else None
+
     @property
     def model_info(self) -> dict[str, Any]:
         """Get information about the loaded model"""
@@ -0,0 +1,248 @@
+"""
+Persistent translation memory for subtitle segments.
+
+Subtitle lines repeat heavily within and across episodes ("Ja.", "Was?",
+"Komm schon!"). The translation memory remembers every translated segment
+keyed by (model, source language, target language, normalized text), so a
+repeated line is translated by the model only once.
+
+Entries live in a local SQLite file next to the application data; a bounded
+in-process LRU in front of it serves the most frequent lines without touching
+the disk.
+
+Key Components:
+    - normalize_segment_text: Normalization applied to memory keys
+    - TranslationMemory: SQLite store with LRU front and hit-rate metrics
+    - get_translation_memory: Process-wide memory instance
+
+Usage Example:
+    ```python
+    memory = get_translation_memory()
+
+    known = memory.get_many("Helsinki-NLP/opus-mt-de-en", "de", "en", ["Ja.", "Was?"])
+    # {"Ja.": "Yes."} - "Was?" has not been translated yet
+
+    memory.put_many("Helsinki-NLP/opus-mt-de-en", "de", "en", {"Was?": "What?"})
+    print(memory.get_stats())  # {"lru_hits": 1, "db_hits": 0, "misses": 1, "hit_ratio": "50.0%", ...}
+    ```
+
+Thread Safety:
+    Yes. The SQLite connection and the LRU are guarded by a lock; callers may use
+    the memory from worker threads.
+
+Performance Notes:
+    - LRU hit: O(1), no I/O
+    - Misses for a whole chunk are looked up with a few IN (...) queries
+    - SQLite and file system failures are logged and counted; the memory then behaves as empty
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from core.config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# SQLite limits host parameters per statement; keep IN (...) lists well below it
+QUERY_CHUNK_SIZE = 500
+
+_WHITESPACE = re.compile(r"\s+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translation_memory (
+    model TEXT NOT NULL,
+    source_lang TEXT NOT NULL,
+    target_lang TEXT NOT NULL,
+    normalized_text TEXT NOT NULL,
+    translated_text TEXT NOT NULL,
+    PRIMARY KEY (model, source_lang, target_lang, normalized_text)
+) WITHOUT ROWID
+"""
+
+MemoryKey = tuple[str, str, str, str]
+
+
+def normalize_segment_text(text: str) -> str:
+    """
+    Normalize subtitle text for memory lookups.
+
+    Applies Unicode NFC and collapses whitespace (including line breaks inside a
+    subtitle). Case and punctuation are kept: they change the translation.
+    """
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+class TranslationMemory:
+    """
+    Translation memory with an SQLite store and an in-process LRU front.
+
+    Attributes:
+        db_path: SQLite database file
+        lru_size: Maximum number of entries kept in memory
+        stats: Counters for LRU hits, database hits, misses, stores and errors
+    """
+
+    def __init__(self, db_path: Path, lru_size: int = 10000):
+        self.db_path = Path(db_path)
+        self.lru_size = lru_size
+        self.stats = {"lru_hits": 0, "db_hits": 0, "misses": 0, "stores": 0, "errors": 0}
+        self._lru: OrderedDict[MemoryKey, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    def get_many(self, model: str, source_lang: str, target_lang: str, texts: list[str]) -> dict[str, str]:
+        """
+        Look up translations of several segments.
+
+        Args:
+            model: Translation model name
+            source_lang: Source language code
+            target_lang: Target language code
+            texts: Segment texts (normalized internally)
+
+        Returns:
+            Mapping of normalized text to translation for every known segment
+        """
+        normalized = list(dict.fromkeys(normalize_segment_text(text) for text in texts))
+        found: dict[str, str] = {}
+
+        with self._lock:
+            missing = []
+            for text in normalized:
+                key = (model, source_lang, target_lang, text)
+                if key in self._lru:
+                    self._lru.move_to_end(key)
+                    found[text] = self._lru[key]
+                else:
+                    missing.append(text)
+            self.stats["lru_hits"] += len(found)
+
+            from_db = self._select(model, source_lang, target_lang, missing) if missing else {}
+            for text, translation in from_db.items():
+                self._remember((model, source_lang, target_lang, text), translation)
+            found.update(from_db)
+
+            self.stats["db_hits"] += len(from_db)
+            self.stats["misses"] += len(missing) - len(from_db)
+
+        return found
+
+    def put_many(self, model: str, source_lang: str, target_lang: str, translations: dict[str, str]) -> None:
+        """
+        Store translations of several segments.
+
+        Args:
+            model: Translation model name
+            source_lang: Source language code
+            target_lang: Target language code
+            translations: Mapping of segment text (normalized internally) to its translation
+        """
+        rows = [
+            (model, source_lang, target_lang, normalize_segment_text(text), translation)
+            for text, translation in translations.items()
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            for row in rows:
+                self._remember(row[:4], row[4])
+            try:
+                connection = self._connect()
+                with connection:
+                    connection.executemany("INSERT OR REPLACE INTO translation_memory VALUES (?, ?, ?, ?, ?)", rows)
+                self.stats["stores"] += len(rows)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning("Failed to store translations in memory", path=str(self.db_path), error=str(e))
+                self.stats["errors"] += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get memory statistics.
+
+        Returns:
+            Dictionary with LRU hits, database hits, misses, hit ratio, stores, errors and LRU size
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            lru_entries = len(self._lru)
+        hits = stats["lru_hits"] + stats["db_hits"]
+        total = hits + stats["misses"]
+        hit_ratio = (hits / total * 100) if total > 0 else 0
+
+        return {**stats, "total": total, "hit_ratio": f"{hit_ratio:.1f}%", "lru_entries": lru_entries}
+
+    def reset_stats(self) -> None:
+        """Reset statistics counters."""
+        with self._lock:
+            self.stats = {"lru_hits": 0, "db_hits": 0, "misses": 0, "stores": 0, "errors": 0}
+
+    def close(self) -> None:
+        """Close the database connection (the LRU is kept)"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def _select(self, model: str, source_lang: str, target_lang: str, texts: list[str]) -> dict[str, str]:
+        found: dict[str, str] = {}
+        try:
+            connection = self._connect()
+            for start in range(0, len(texts), QUERY_CHUNK_SIZE):
+                chunk = texts[start : start + QUERY_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = connection.execute(
+                    "SELECT normalized_text, translated_text FROM translation_memory "
+                    f"WHERE model = ? AND source_lang = ? AND target_lang = ? AND normalized_text IN ({placeholders})",
+                    (model, source_lang, target_lang, *chunk),
+                )
+                found.update(rows)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning("Failed to read translation memory", path=str(self.db_path), error=str(e))
+            self.stats["errors"] += 1
+        return found
+
+    def _remember(self, key: MemoryKey, translation: str) -> None:
+        self._lru[key] = translation
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+
+_translation_memory: TranslationMemory | None = None
+
+
+def get_translation_memory() -> TranslationMemory:
+    """
+    Get the process-wide translation memory.
+
+    Configured by LANGPLUG_TRANSLATION_MEMORY_PATH (default: <data path>/translation_memory.sqlite3)
+    and LANGPLUG_TRANSLATION_MEMORY_LRU_SIZE.
+    """
+    global _translation_memory
+    if _translation_memory is None:
+        from core.config import settings
+
+        db_path = (
+            Path(settings.translation_memory_path)
+            if settings.translation_memory_path
+            else settings.get_data_path() / "translation_memory.sqlite3"
+        )
+        _translation_memory = TranslationMemory(db_path, settings.translation_memory_lru_size)
+    return _translation_memory
@@ -70,6 +70,7 @@ from core.config.logging_config import get_logger
 from core.config.media_config import VIDEO_EXTENSIONS
 from core.exceptions import EpisodeNotFoundError, SeriesNotFoundError
 from core.file_security import FileSecurityValidator
+from services.processing.subtitle_source_policy import SubtitleSourcePolicy, get_subtitle_source_policy_store
 
 logger = get_logger(__name__)
 
@@ -197,36 +198,66 @@ class VideoService:
         """
         # Validate file extension
         allowed_extensions = {".srt", ".vtt", ".sub"}
-        await FileSecurityValidator.validate_file_upload(subtitle_file, allowed_extensions)
+        upload_name = await FileSecurityValidator.validate_file_upload(subtitle_file, allowed_extensions)
 
-        # Resolve video path
+        video_full_path = self._resolve_video_file(video_path)
+
+        # Determine subtitle path (same name as video, but .srt) - next to the already validated video
+        subtitle_path = video_full_path.with_suffix(".srt")
+
+        # Write file content
+        content = await subtitle_file.read()
+        with open(subtitle_path, "wb") as buffer:
+            buffer.write(content)
+
+        # Stable copy for chunk processing: video.srt is overwritten with chunk transcripts.
+        # Only SRT uploads qualify - the chunk slicer parses SRT, not VTT or MicroDVD.
+        sidecar_path = video_full_path.with_suffix(".sidecar.srt")
+        if upload_name.suffix.lower() == ".srt":
+            sidecar_path.write_bytes(content)
+        else:
+            # Don't keep serving a previous upload's cues for this video
+            sidecar_path.unlink(missing_ok=True)
+
+        logger.info("Subtitle uploaded", path=str(subtitle_path))
+        return subtitle_path
+
+    def set_subtitle_source_policy(self, video_path: str, policy: SubtitleSourcePolicy | None) -> Path:
+        """
+        Choose whether chunk processing uses existing subtitles or ASR for a video.
+
+        Args:
+            video_path: Relative path to the video file
+            policy: New policy, or None to use the configured default
+
+        Returns:
+            Resolved path of the video
+
+        Raises:
+            ValueError: If the path is invalid
+            FileNotFoundError: If video file does not exist
+        """
+        video_full_path = self._resolve_video_file(video_path)
+        get_subtitle_source_policy_store().set_policy(video_full_path, policy)
+        return video_full_path
+
+    def _resolve_video_file(self, video_path: str) -> Path:
+        """Resolve a relative video path inside the videos root, rejecting traversal"""
         videos_path = settings.get_videos_path()
         try:
+            # Validate the client-supplied relative path (the resolved path is always absolute)
+            FileSecurityValidator.validate_file_path(video_path)
             video_full_path = (videos_path / video_path).resolve()
             videos_root = videos_path.resolve()
             # Prevent path traversal - ensure path stays within videos root
             if not str(video_full_path).startswith(str(videos_root)):
                 raise ValueError("Path traversal detected: video path escapes root directory")
-            # Validate path security
-            FileSecurityValidator.validate_file_path(str(video_full_path))
         except ValueError as e:
             raise ValueError(f"Invalid video path: {e}") from e
 
         if not video_full_path.exists():
             raise FileNotFoundError(f"Video file not found: {video_path}")
-
-        # Determine subtitle path (same name as video, but .srt)
-        subtitle_path = video_full_path.with_suffix(".srt")
-        # Validate subtitle path security
-        FileSecurityValidator.validate_file_path(str(subtitle_path))
-
-        # Write file content
-        content = await subtitle_file.read()
-        with open(subtitle_path, "wb") as buffer:
-            buffer.write(content)
-
-        logger.info("Subtitle uploaded", path=str(subtitle_path))
-        return subtitle_path
+        return video_full_path
 
     def get_video_status(self, video_id: str, task_progress: dict[str, Any]) -> dict[str, Any]:
         """Get processing status for a video"""
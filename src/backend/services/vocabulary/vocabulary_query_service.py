@@ -2,6 +2,8 @@
 Vocabulary Query Service - Handles vocabulary lookups and searches
 """
 
+import asyncio
+from collections import Counter
 from typing import Any
 
 from sqlalchemy import and_, func, or_, select
@@ -13,6 +15,9 @@ from services.lemmatization_service import get_lemmatization_service
 
 logger = get_logger(__name__)
 
+# Distinct words per bulk lookup query; each query binds their lemmas and surface forms
+BULK_LOOKUP_CHUNK_SIZE = 400
+
 
 class VocabularyQueryService:
     """Handles vocabulary queries, searches, and library operations"""
@@ -171,6 +176,68 @@ class VocabularyQueryService:
             # Log the error but don't rollback - let the decorator handle it
             logger.warning("Failed to track unknown word", word=word, error=str(e))
 
+    async def _track_unknown_words(
+        self, lemmas: dict[str, str], occurrences: Counter, language: str, db: AsyncSession
+    ) -> None:
+        """
+        Track many words not in vocabulary database with one query per chunk
+
+        Same transaction handling as _track_unknown_word: flushes, the caller commits.
+        """
+        if not lemmas:
+            return
+
+        try:
+            words = list(lemmas)
+            for start in range(0, len(words), BULK_LOOKUP_CHUNK_SIZE):
+                chunk = words[start : start + BULK_LOOKUP_CHUNK_SIZE]
+                stmt = select(UnknownWord).where(and_(UnknownWord.word.in_(chunk), UnknownWord.language == language))
+                result = await db.execute(stmt)
+                existing = {unknown.word: unknown for unknown in result.scalars()}
+
+                for word in chunk:
+                    unknown = existing.get(word)
+                    if unknown:
+                        unknown.frequency_count += occurrences[word]
+                        unknown.last_encountered = func.now()
+                    else:
+                        db.add(
+                            UnknownWord(
+                                word=word, lemma=lemmas[word], language=language, frequency_count=occurrences[word]
+                            )
+                        )
+
+            await db.flush()
+        except Exception as e:
+            logger.warning("Failed to track unknown words", count=len(lemmas), error=str(e))
+
+    def _format_word_info(self, word: str, vocab_word: VocabularyWord) -> dict[str, Any]:
+        """Word information for a word found in the vocabulary database"""
+        return {
+            "id": vocab_word.id,
+            "word": word,
+            "lemma": vocab_word.lemma,
+            "found_word": vocab_word.word,
+            "language": vocab_word.language,
+            "difficulty_level": vocab_word.difficulty_level,
+            "part_of_speech": vocab_word.part_of_speech,
+            "gender": vocab_word.gender,
+            "translation_en": vocab_word.translation_en,
+            "pronunciation": vocab_word.pronunciation,
+            "notes": vocab_word.notes,
+            "found": True,
+        }
+
+    def _format_unknown_word_info(self, word: str, lemma: str, language: str) -> dict[str, Any]:
+        """Word information for a word not in the vocabulary database"""
+        return {
+            "word": word,
+            "lemma": lemma,
+            "language": language,
+            "found": False,
+            "message": "Word not in vocabulary database",
+        }
+
     async def get_word_info(self, word: str, language: str, db: AsyncSession) -> dict[str, Any] | None:
         """Get vocabulary information for a word"""
         # First try lemmatization
@@ -195,31 +262,85 @@ class VocabularyQueryService:
         vocab_word = result.scalar_one_or_none()
 
         if vocab_word:
-            return {
-                "id": vocab_word.id,
-                "word": word,
-                "lemma": vocab_word.lemma,
-                "found_word": vocab_word.word,
-                "language": vocab_word.language,
-                "difficulty_level": vocab_word.difficulty_level,
-                "part_of_speech": vocab_word.part_of_speech,
-                "gender": vocab_word.gender,
-                "translation_en": vocab_word.translation_en,
-                "pronunciation": vocab_word.pronunciation,
-                "notes": vocab_word.notes,
-                "found": True,
-            }
+            return self._format_word_info(word, vocab_word)
 
         # Word not found - track it
         await self._track_unknown_word(word, lemma, language, db)
 
-        return {
-            "word": word,
-            "lemma": lemma,
-            "language": language,
-            "found": False,
-            "message": "Word not in vocabulary database",
-        }
+        return self._format_unknown_word_info(word, lemma, language)
+
+    async def get_words_info(
+        self, words: list[str], language: str, db: AsyncSession, lemmas: dict[str, str] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Get vocabulary information for many words at once
+
+        Resolves the distinct words with one IN (...) query per BULK_LOOKUP_CHUNK_SIZE
+        words instead of one query per word. A lemma match wins over an exact word
+        match, as in get_word_info.
+
+        Args:
+            words: Words to look up; repeated words count as repeated encounters of unknown words
+            language: Language code
+            db: Database session
+            lemmas: Lemmas per word from a contextual analysis; other words are lemmatized off the event loop
+
+        Returns:
+            Dictionary mapping each distinct word to its get_word_info result
+        """
+        occurrences = Counter(words)
+        distinct = list(occurrences)
+        if not distinct:
+            return {}
+
+        lemmas = {word: lemmas[word] for word in distinct if lemmas and lemmas.get(word)}
+        missing = [word for word in distinct if word not in lemmas]
+        if missing:
+            lemmatized = await asyncio.to_thread(self.lemmatization_service.lemmatize_batch, missing)
+            lemmas.update(zip(missing, lemmatized, strict=True))
+
+        by_lemma: dict[str, VocabularyWord] = {}
+        by_word: dict[str, VocabularyWord] = {}
+        for start in range(0, len(distinct), BULK_LOOKUP_CHUNK_SIZE):
+            chunk = distinct[start : start + BULK_LOOKUP_CHUNK_SIZE]
+            stmt = (
+                select(VocabularyWord)
+                .where(
+                    and_(
+                        or_(
+                            func.lower(VocabularyWord.lemma).in_({lemmas[word].lower() for word in chunk}),
+                            func.lower(VocabularyWord.word).in_({word.lower() for word in chunk}),
+                        ),
+                        VocabularyWord.language == language,
+                    )
+                )
+                .order_by(VocabularyWord.id)
+            )
+            result = await db.execute(stmt)
+            for vocab_word in result.scalars():
+                by_lemma.setdefault(vocab_word.lemma.lower(), vocab_word)
+                by_word.setdefault(vocab_word.word.lower(), vocab_word)
+
+        infos: dict[str, dict[str, Any]] = {}
+        unknown_lemmas: dict[str, str] = {}
+        for word in distinct:
+            vocab_word = by_lemma.get(lemmas[word].lower()) or by_word.get(word.lower())
+            if vocab_word:
+                infos[word] = self._format_word_info(word, vocab_word)
+            else:
+                infos[word] = self._format_unknown_word_info(word, lemmas[word], language)
+                unknown_lemmas[word] = lemmas[word]
+
+        # Words not found - track them
+        await self._track_unknown_words(unknown_lemmas, occurrences, language, db)
+
+        logger.debug(
+            "Bulk vocabulary lookup",
+            words=len(distinct),
+            found=len(distinct) - len(unknown_lemmas),
+            queries=-(-len(distinct) // BULK_LOOKUP_CHUNK_SIZE),
+        )
+        return infos
 
     async def get_vocabulary_library(
         self,
@@ -121,6 +121,12 @@ class VocabularyService:
         """Get vocabulary information for a word"""
         return await self.query_service.get_word_info(word, language, db)
 
+    async def get_words_info(
+        self, words: list[str], language: str, db: AsyncSession, lemmas: dict[str, str] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Get vocabulary information for many words with a few bulk queries"""
+        return await self.query_service.get_words_info(words, language, db, lemmas=lemmas)
+
     async def get_vocabulary_library(
         self,
         db: AsyncSession,
@@ -76,3 +76,87 @@ async def test_WhenStreamVideoSetsAcceptRanges_ThenSucceeds(async_client, url_bu
         f"Expected 200 (full content without Range header), got {response.status_code}: {response.text}"
     )
     assert response.headers.get("accept-ranges") == "bytes"
+
+
+def _policy_store(monkeypatch, tmp_path):
+    """Point the videos root and the subtitle source policy store at tmp_path"""
+    from core.config import settings
+    from services.processing import subtitle_source_policy
+    from services.processing.subtitle_source_policy import SubtitleSourcePolicy, SubtitleSourcePolicyStore
+
+    monkeypatch.setattr(type(settings), "get_videos_path", lambda self: tmp_path)
+    store = SubtitleSourcePolicyStore(tmp_path / "policies.json", SubtitleSourcePolicy.FORCE_ASR)
+    monkeypatch.setattr(subtitle_source_policy, "_subtitle_source_policy_store", store)
+    (tmp_path / "episode.mp4").write_bytes(b"video")
+    return store
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_WhenSubtitleSourcePolicySet_ThenStoredForVideo(async_client, url_builder, monkeypatch, tmp_path):
+    """Happy path: a valid policy becomes the video's override."""
+    headers = await _auth(async_client)
+    store = _policy_store(monkeypatch, tmp_path)
+
+    response = await async_client.put(
+        url_builder.url_for("set_subtitle_source_policy"),
+        params={"video_path": "episode.mp4", "policy": "prefer_sidecar"},
+        headers=headers,
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["policy"] == "prefer_sidecar"
+    assert store.get_policy(tmp_path / "episode.mp4").value == "prefer_sidecar"
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_WhenSubtitleSourcePolicyOmitted_ThenResetsToDefault(async_client, url_builder, monkeypatch, tmp_path):
+    """Happy path: omitting the policy removes the override."""
+    from services.processing.subtitle_source_policy import SubtitleSourcePolicy
+
+    headers = await _auth(async_client)
+    store = _policy_store(monkeypatch, tmp_path)
+    store.set_policy(tmp_path / "episode.mp4", SubtitleSourcePolicy.PREFER_SIDECAR)
+
+    response = await async_client.put(
+        url_builder.url_for("set_subtitle_source_policy"), params={"video_path": "episode.mp4"}, headers=headers
+    )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["policy"] is None
+    assert store.get_policy(tmp_path / "episode.mp4") == SubtitleSourcePolicy.FORCE_ASR
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_WhenSubtitleSourcePolicyInvalid_ThenReturns422(async_client, url_builder, monkeypatch, tmp_path):
+    """Invalid input: unknown policy values are rejected."""
+    headers = await _auth(async_client)
+    store = _policy_store(monkeypatch, tmp_path)
+
+    response = await async_client.put(
+        url_builder.url_for("set_subtitle_source_policy"),
+        params={"video_path": "episode.mp4", "policy": "always_sidecar"},
+        headers=headers,
+    )
+
+    assert response.status_code == 422
+    assert not store.policy_file.exists()
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(30)
+async def test_WhenSubtitleSourcePolicyForUnknownVideo_ThenReturns404(async_client, url_builder, monkeypatch, tmp_path):
+    """Invalid input: setting a policy for a missing video returns 404."""
+    headers = await _auth(async_client)
+    store = _policy_store(monkeypatch, tmp_path)
+
+    response = await async_client.put(
+        url_builder.url_for("set_subtitle_source_policy"),
+        params={"video_path": "missing.mp4", "policy": "prefer_sidecar"},
+        headers=headers,
+    )
+
+    assert response.status_code == 404
+    assert not store.policy_file.exists()
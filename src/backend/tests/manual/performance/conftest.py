@@ -0,0 +1,44 @@
+"""
+Shared fixtures for manual performance benchmarks
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+EPISODE_SECONDS = 45 * 60
+
+
+@pytest.fixture(scope="session")
+def long_video(tmp_path_factory) -> Path:
+    """Synthetic 45-minute video with an AAC audio track (encoded once per session)"""
+    if shutil.which("ffmpeg") is None:
+        pytest.skip("performance test: requires ffmpeg")
+
+    video = tmp_path_factory.mktemp("bench") / "episode.mp4"
+    cmd = [
+        "ffmpeg",
+        "-f",
+        "lavfi",
+        "-i",
+        f"color=c=black:s=64x64:r=5:d={EPISODE_SECONDS}",
+        "-f",
+        "lavfi",
+        "-i",
+        f"sine=frequency=440:sample_rate=44100:duration={EPISODE_SECONDS}",
+        "-c:v",
+        "libx264",
+        "-preset",
+        "ultrafast",
+        "-c:a",
+        "aac",
+        "-shortest",
+        "-y",
+        str(video),
+    ]
+    subprocess.run(cmd, check=True, capture_output=True, timeout=600)
+    return video
@@ -0,0 +1,57 @@
+"""Audio chunk extraction benchmark: input seeking vs. output seeking.
+
+Generates a synthetic episode-length video with ffmpeg and times
+ChunkTranscriptionService.extract_audio_chunk at increasing chunk offsets.
+With input seeking the extraction time must stay roughly flat; with output
+seeking it grows with the offset because ffmpeg decodes from 0 to start.
+
+Run with:
+    pytest tests/manual/performance/test_audio_extraction_benchmark.py -m manual -s
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from services.processing.chunk_transcription_service import ChunkTranscriptionService
+
+# Mark as manual test
+pytestmark = [pytest.mark.manual, pytest.mark.performance]
+
+CHUNK_SECONDS = 5 * 60
+OFFSETS = [0.0, 15 * 60.0, 40 * 60.0]
+
+
+async def _time_extraction(service: ChunkTranscriptionService, video: Path, offset: float) -> float:
+    task_id = "bench"
+    task_progress = {task_id: Mock(progress=0, current_step="", message="")}
+
+    started = time.perf_counter()
+    audio = await service.extract_audio_chunk(task_id, task_progress, video, offset, offset + CHUNK_SECONDS)
+    elapsed = time.perf_counter() - started
+
+    service.cleanup_temp_audio_file(audio, video)
+    return elapsed
+
+
+@pytest.mark.asyncio
+@pytest.mark.timeout(600)
+async def test_Whenfast_seek_extracts_late_chunk_ThenTimeStaysFlat(long_video: Path) -> None:
+    """Input seeking keeps late-chunk extraction close to first-chunk extraction."""
+    fast = ChunkTranscriptionService(fast_seek=True, seek_preroll=0.0)
+    slow = ChunkTranscriptionService(fast_seek=False)
+
+    fast_times = [await _time_extraction(fast, long_video, offset) for offset in OFFSETS]
+    slow_times = [await _time_extraction(slow, long_video, offset) for offset in OFFSETS]
+
+    for offset, fast_t, slow_t in zip(OFFSETS, fast_times, slow_times, strict=True):
+        print(f"offset={offset / 60:5.1f}min  input-seek={fast_t:6.3f}s  output-seek={slow_t:6.3f}s")
+
+    # Late chunk must not cost much more than the first one with input seeking
+    assert fast_times[-1] < fast_times[0] * 2 + 0.2
+    # And must beat output seeking for the last chunk
+    assert fast_times[-1] < slow_times[-1]
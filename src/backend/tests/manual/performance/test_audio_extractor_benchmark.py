@@ -0,0 +1,76 @@
+"""Full-episode audio extraction benchmark: ffmpeg subprocess vs. moviepy.
+
+Generates a synthetic episode-length video and times
+services.media.audio_extractor against the previous moviepy
+VideoFileClip path, for the whole file and for a late 5-minute range.
+
+Run with:
+    pytest tests/manual/performance/test_audio_extractor_benchmark.py -m manual -s
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from services.media.audio_extractor import extract_audio_array, extract_audio_from_video
+
+# Mark as manual test
+pytestmark = [pytest.mark.manual, pytest.mark.performance]
+
+RANGE = (40 * 60.0, 45 * 60.0)
+
+
+def _moviepy_extract(video: Path, output: Path, start: float | None = None, end: float | None = None) -> None:
+    """The previous moviepy-based implementation"""
+    try:
+        from moviepy import VideoFileClip
+    except ImportError:
+        from moviepy.editor import VideoFileClip
+
+    clip = VideoFileClip(str(video))
+    audio = clip.audio
+    if start is not None:
+        audio = audio.subclipped(start, end) if hasattr(audio, "subclipped") else audio.subclip(start, end)
+    audio.write_audiofile(str(output), fps=16000, logger=None)
+    clip.close()
+
+
+def _measure(func, *args, **kwargs) -> tuple[float, float]:
+    """Return (seconds, peak Python heap MB) for one call"""
+    tracemalloc.start()
+    started = time.perf_counter()
+    func(*args, **kwargs)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+
+@pytest.mark.timeout(1200)
+def test_Whenffmpeg_extractor_used_ThenFasterThanMoviepy(long_video: Path, tmp_path: Path) -> None:
+    """ffmpeg extraction beats moviepy for full episodes and late ranges."""
+    pytest.importorskip("moviepy")
+
+    ffmpeg_full = _measure(extract_audio_from_video, long_video, tmp_path / "ffmpeg_full.wav")
+    ffmpeg_range = _measure(
+        extract_audio_from_video, long_video, tmp_path / "ffmpeg_range.wav", start_time=RANGE[0], end_time=RANGE[1]
+    )
+    ffmpeg_memory = _measure(extract_audio_array, long_video, start_time=RANGE[0], end_time=RANGE[1])
+    moviepy_full = _measure(_moviepy_extract, long_video, tmp_path / "moviepy_full.wav")
+    moviepy_range = _measure(_moviepy_extract, long_video, tmp_path / "moviepy_range.wav", *RANGE)
+
+    for name, (seconds, peak_mb) in {
+        "ffmpeg full": ffmpeg_full,
+        "ffmpeg range": ffmpeg_range,
+        "ffmpeg range (memory)": ffmpeg_memory,
+        "moviepy full": moviepy_full,
+        "moviepy range": moviepy_range,
+    }.items():
+        print(f"{name:22s} {seconds:7.2f}s  peak heap {peak_mb:8.1f} MB")
+
+    assert ffmpeg_full[0] < moviepy_full[0]
+    assert ffmpeg_range[0] < moviepy_range[0]
@@ -0,0 +1,95 @@
+"""OPUS-CT2 tokenization micro-benchmark: per-text loop vs. batched encode/decode.
+
+Times the tokenizer work around a CTranslate2 call for 1000 subtitle
+segments with the real Marian tokenizer: the previous per-text
+encode/convert_ids_to_tokens (and convert_tokens_to_ids/decode) loop against
+OpusCT2TranslationService._encode_batch/_decode_batch. No CTranslate2 model
+is needed; the source tokens stand in for the hypotheses.
+
+Run with:
+    pytest tests/manual/performance/test_ct2_tokenization_benchmark.py -m manual -s
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from services.translationservice.opus_ct2_implementation import OpusCT2TranslationService
+
+# Mark as manual test
+pytestmark = [pytest.mark.manual, pytest.mark.performance]
+
+MODEL_NAME = "Helsinki-NLP/opus-mt-de-en"
+SEGMENTS = 1000
+ROUNDS = 5
+
+
+@pytest.fixture(scope="module")
+def service() -> OpusCT2TranslationService:
+    """Service with the real tokenizer loaded (no translator)"""
+    transformers = pytest.importorskip("transformers")
+    pytest.importorskip("sentencepiece")
+
+    service = OpusCT2TranslationService(model_name=MODEL_NAME)
+    service._tokenizer = transformers.AutoTokenizer.from_pretrained(MODEL_NAME)
+    return service
+
+
+def _texts() -> list[str]:
+    lines = [
+        "Ja.",
+        "Was machst du denn hier?",
+        "Komm schon, wir müssen los!",
+        "Ich habe keine Ahnung, wovon du redest.",
+        "Na ja… „Wirklich?“ – sagte er!!",
+        "Preis: 3,50€ (inkl. MwSt.)",
+    ]
+    return [f"{lines[i % len(lines)]} ({i})" for i in range(SEGMENTS)]
+
+
+def _loop_encode(tokenizer, texts: list[str]) -> list[list[str]]:
+    """The previous per-text implementation"""
+    return [tokenizer.convert_ids_to_tokens(tokenizer.encode(text, add_special_tokens=True)) for text in texts]
+
+
+def _reference_tokens(tokenizer, text: str) -> list[str]:
+    """What Marian's own preprocessing produces for a single text"""
+    return tokenizer.convert_ids_to_tokens(tokenizer(text)["input_ids"])
+
+
+def _loop_decode(tokenizer, hypotheses: list[list[str]]) -> list[str]:
+    return [
+        tokenizer.decode(tokenizer.convert_tokens_to_ids(tokens), skip_special_tokens=True) for tokens in hypotheses
+    ]
+
+
+def _best_of(func, *args) -> float:
+    timings = []
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def test_WhenTokenizingBatch_ThenFasterThanPerTextLoop(service: OpusCT2TranslationService) -> None:
+    """Batched decode costs less per 1000 segments than the per-text loop; encode keeps Marian's preprocessing."""
+    texts = _texts()
+    tokenizer = service._tokenizer
+
+    # Same tokens either way, including Moses punctuation normalization
+    assert service._encode_batch(texts[:50]) == [_reference_tokens(tokenizer, text) for text in texts[:50]]
+    hypotheses = service._encode_batch(texts)
+
+    timings = {
+        "loop encode": _best_of(_loop_encode, tokenizer, texts),
+        "batched encode": _best_of(service._encode_batch, texts),
+        "loop decode": _best_of(_loop_decode, tokenizer, hypotheses),
+        "batched decode": _best_of(service._decode_batch, hypotheses),
+    }
+    for name, seconds in timings.items():
+        print(f"{name:16s} {seconds * 1000:8.1f} ms / {SEGMENTS} segments")
+
+    assert timings["batched decode"] < timings["loop decode"]
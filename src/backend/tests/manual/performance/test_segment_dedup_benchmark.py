@@ -0,0 +1,85 @@
+"""Within-chunk segment deduplication benchmark.
+
+Translates a dialogue-heavy chunk through ChunkTranslationService with a
+stand-in model whose cost grows with the number of texts, and reports how
+many texts reach the model compared to the number of subtitle segments.
+
+Point LANGPLUG_BENCH_SRT at a real subtitle file to measure an actual
+episode instead of the synthetic dialogue.
+
+Run with:
+    pytest tests/manual/performance/test_segment_dedup_benchmark.py -m manual -s
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from services.processing.chunk_translation_service import ChunkTranslationService
+from services.translationservice.interface import TranslationResult
+from utils.srt_parser import SRTParser, SRTSegment
+
+# Mark as manual test
+pytestmark = [pytest.mark.manual, pytest.mark.performance]
+
+SECONDS_PER_TEXT = 0.002
+
+# Short interjections make up a large share of spoken dialogue
+FILLERS = ["Ja.", "Nein.", "Was?", "Okay.", "Komm schon!", "Danke.", "Hallo?", "Warte!", "Ja, ja.", "Scheiße."]
+
+
+def _synthetic_dialogue(count: int = 600) -> list[SRTSegment]:
+    rng = random.Random(42)
+    segments = []
+    for i in range(count):
+        if rng.random() < 0.25:
+            text = rng.choice(FILLERS)
+        else:
+            text = f"Das ist Satz Nummer {i} in dieser Folge."
+        segments.append(SRTSegment(i + 1, i * 2.0, i * 2.0 + 1.5, text))
+    return segments
+
+
+def _segments() -> list[SRTSegment]:
+    srt_path = os.environ.get("LANGPLUG_BENCH_SRT")
+    if srt_path:
+        return SRTParser.parse_file(srt_path)
+    return _synthetic_dialogue()
+
+
+def _translator() -> Mock:
+    """Model stand-in that costs SECONDS_PER_TEXT per translated text"""
+
+    async def translate_batch_async(texts, source_lang, target_lang):
+        time.sleep(SECONDS_PER_TEXT * len(texts))
+        return [TranslationResult(text, text.upper(), source_lang, target_lang) for text in texts]
+
+    translator = Mock()
+    translator.translate_batch_async = Mock(side_effect=translate_batch_async)
+    return translator
+
+
+@pytest.mark.asyncio
+async def test_WhenChunkHasRepeatedLines_ThenFewerTextsReachModel() -> None:
+    """Every distinct line is translated once; repetitions are filled in."""
+    segments = _segments()
+    translator = _translator()
+    service = ChunkTranslationService(translation_memory=None)
+    service.get_translation_service = Mock(return_value=translator)
+
+    started = time.perf_counter()
+    result = await service._build_translation_texts(None, None, segments, {"target": "de", "native": "en"})
+    elapsed = time.perf_counter() - started
+
+    translated = sum(len(call.args[0]) for call in translator.translate_batch_async.call_args_list)
+    saved = 1 - translated / len(segments)
+    print(f"segments {len(segments):6d}  model texts {translated:6d}  saved {saved:6.1%}  elapsed {elapsed:6.2f}s")
+    print(f"without dedup (estimated) {len(segments) * SECONDS_PER_TEXT:6.2f}s")
+
+    assert len(result) == len(segments)
+    assert translated < len(segments)
@@ -0,0 +1,135 @@
+"""
+Test suite for ChunkArtifactStore
+Tests sharing of user-independent chunk artifacts
+"""
+
+import asyncio
+
+import pytest
+
+from services.processing.chunk_artifact_store import ChunkArtifactStore
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    video = tmp_path / "episode.mp4"
+    video.write_bytes(b"video")
+    return video
+
+
+class TestMakeKey:
+    """Test artifact key derivation"""
+
+    def test_key_includes_range_and_parts(self, video_file):
+        """Different ranges or models produce different keys"""
+        base = ChunkArtifactStore.make_key("transcript", video_file, 0.0, 300.0, "de", "tiny")
+
+        assert base == ChunkArtifactStore.make_key("transcript", video_file, 0.0, 300.0, "de", "tiny")
+        assert base != ChunkArtifactStore.make_key("transcript", video_file, 300.0, 600.0, "de", "tiny")
+        assert base != ChunkArtifactStore.make_key("transcript", video_file, 0.0, 300.0, "de", "large")
+        assert base != ChunkArtifactStore.make_key("translation", video_file, 0.0, 300.0, "de", "tiny")
+
+
+class TestGetOrCompute:
+    """Test computation sharing"""
+
+    @pytest.mark.asyncio
+    async def test_second_request_is_hit(self, video_file):
+        """Stored artifacts are returned without recomputing"""
+        store = ChunkArtifactStore()
+        key = store.make_key("transcript", video_file, 0.0, 300.0)
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            return "srt content"
+
+        assert await store.get_or_compute(key, compute) == "srt content"
+        assert await store.get_or_compute(key, compute) == "srt content"
+
+        assert calls == 1
+        assert store.get_stats()["hits"] == 1
+        assert store.get_stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_computation(self, video_file):
+        """Requests arriving while the artifact is computed wait for it instead of recomputing"""
+        store = ChunkArtifactStore()
+        key = store.make_key("transcript", video_file, 0.0, 300.0)
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return "srt content"
+
+        results = await asyncio.gather(*(store.get_or_compute(key, compute) for _ in range(3)))
+
+        assert results == ["srt content"] * 3
+        assert calls == 1
+        assert store.get_stats()["shared"] == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_propagates_and_is_not_stored(self, video_file):
+        """Waiters see the failure and the next request recomputes"""
+        store = ChunkArtifactStore()
+        key = store.make_key("transcript", video_file, 0.0, 300.0)
+
+        async def failing():
+            await asyncio.sleep(0.02)
+            raise RuntimeError("ffmpeg failed")
+
+        async def succeeding():
+            return "srt content"
+
+        results = await asyncio.gather(
+            store.get_or_compute(key, failing), store.get_or_compute(key, failing), return_exceptions=True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert await store.get_or_compute(key, succeeding) == "srt content"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_computation_is_taken_over_by_waiter(self, video_file):
+        """Cancelling the computing request lets a waiter compute the artifact instead of failing"""
+        store = ChunkArtifactStore()
+        key = store.make_key("transcript", video_file, 0.0, 300.0)
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return "srt content"
+
+        leader = asyncio.create_task(store.get_or_compute(key, compute))
+        await asyncio.sleep(0)
+        followers = [asyncio.create_task(store.get_or_compute(key, compute)) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await asyncio.gather(*followers) == ["srt content"] * 2
+        assert calls == 2  # The cancelled run and one takeover
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self, video_file):
+        """Least recently used artifacts are evicted beyond max_entries"""
+        store = ChunkArtifactStore(max_entries=2)
+        keys = [store.make_key("transcript", video_file, i * 300.0, (i + 1) * 300.0) for i in range(3)]
+
+        async def compute():
+            return "srt"
+
+        await store.get_or_compute(keys[0], compute)
+        await store.get_or_compute(keys[1], compute)
+        await store.get_or_compute(keys[0], compute)  # keys[1] is now least recently used
+        await store.get_or_compute(keys[2], compute)
+
+        stats = store.get_stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+        assert stats["hits"] == 1
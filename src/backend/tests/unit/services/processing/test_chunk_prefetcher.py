@@ -0,0 +1,191 @@
+"""
+Test suite for ChunkPrefetcher
+Tests scheduling, cancellation and yielding to interactive requests
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from services.processing.chunk_prefetcher import ChunkPrefetcher
+from services.transcriptionservice import decoding_bridge
+from services.transcriptionservice.decoding_bridge import run_in_decoding_thread, stream_in_decoding_thread
+
+TARGET = ("/videos/episode.mp4", 300.0, 600.0)
+OTHER_TARGET = ("/videos/episode.mp4", 600.0, 900.0)
+
+
+class TestSchedule:
+    """Test prefetch scheduling"""
+
+    @pytest.mark.asyncio
+    async def test_prefetch_runs_in_background(self):
+        """Scheduled work runs and is counted as completed"""
+        prefetcher = ChunkPrefetcher()
+        done = asyncio.Event()
+
+        async def prefetch():
+            done.set()
+
+        task = prefetcher.schedule(1, TARGET, prefetch)
+        await task
+
+        assert done.is_set()
+        assert prefetcher.get_stats()["completed"] == 1
+        assert prefetcher.get_stats()["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_same_target_is_not_scheduled_twice(self):
+        """Rescheduling the chunk already in flight keeps the running task"""
+        prefetcher = ChunkPrefetcher()
+
+        async def prefetch():
+            await asyncio.sleep(0.05)
+
+        first = prefetcher.schedule(1, TARGET, prefetch)
+        second = prefetcher.schedule(1, TARGET, prefetch)
+        await first
+
+        assert second is None
+        assert prefetcher.get_stats()["scheduled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_contained(self):
+        """A failing prefetch is logged and counted, never raised"""
+        prefetcher = ChunkPrefetcher()
+
+        async def prefetch():
+            raise RuntimeError("ffmpeg failed")
+
+        await prefetcher.schedule(1, TARGET, prefetch)
+
+        assert prefetcher.get_stats()["failed"] == 1
+
+
+class TestCancellation:
+    """Test prefetch cancellation"""
+
+    @pytest.mark.asyncio
+    async def test_request_for_other_chunk_cancels_prefetch(self):
+        """Jumping to a different chunk cancels the speculative work"""
+        prefetcher = ChunkPrefetcher()
+
+        async def prefetch():
+            await asyncio.sleep(10)
+
+        task = prefetcher.schedule(1, TARGET, prefetch)
+        await asyncio.sleep(0)
+
+        assert prefetcher.cancel_for_user(1, keep=OTHER_TARGET) is True
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert prefetcher.get_stats()["cancelled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_request_for_prefetched_chunk_keeps_prefetch(self):
+        """Requesting the chunk being prefetched lets the request join it"""
+        prefetcher = ChunkPrefetcher()
+
+        async def prefetch():
+            await asyncio.sleep(0.01)
+
+        task = prefetcher.schedule(1, TARGET, prefetch)
+
+        assert prefetcher.cancel_for_user(1, keep=TARGET) is False
+        await task
+        assert prefetcher.get_stats()["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_new_schedule_replaces_previous(self):
+        """Only the latest prefetch per user survives"""
+        prefetcher = ChunkPrefetcher()
+
+        async def slow():
+            await asyncio.sleep(10)
+
+        async def fast():
+            pass
+
+        first = prefetcher.schedule(1, TARGET, slow)
+        await asyncio.sleep(0)
+        second = prefetcher.schedule(1, OTHER_TARGET, fast)
+        await second
+
+        assert first.cancelled()
+
+
+class TestInteractivePriority:
+    """Test yielding to interactive requests"""
+
+    @pytest.mark.asyncio
+    async def test_prefetch_waits_for_interactive_requests(self):
+        """Prefetch work does not start while an interactive request is running"""
+        prefetcher = ChunkPrefetcher()
+        started = asyncio.Event()
+
+        async def prefetch():
+            started.set()
+
+        async with prefetcher.interactive():
+            task = prefetcher.schedule(1, TARGET, prefetch)
+            await asyncio.sleep(0.02)
+            assert not started.is_set()
+
+        await task
+        assert started.is_set()
+
+    @pytest.mark.asyncio
+    async def test_running_prefetch_decode_yields_the_worker(self, monkeypatch):
+        """An interactive transcription is not queued behind a running prefetch decode"""
+        executor = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(decoding_bridge, "_executor", executor)
+        prefetcher = ChunkPrefetcher()
+        attempts = 0
+        decoding = asyncio.Event()
+
+        def decode():
+            for segment in range(100):
+                time.sleep(0.01)  # Simulates a blocking decode step
+                yield segment
+
+        async def prefetch():
+            nonlocal attempts
+            attempts += 1
+            async for _ in stream_in_decoding_thread(decode):
+                decoding.set()
+
+        task = prefetcher.schedule(1, TARGET, prefetch)
+        await decoding.wait()
+
+        async with prefetcher.interactive(keep=OTHER_TARGET):
+            started = time.monotonic()
+            assert await run_in_decoding_thread(lambda: "interactive") == "interactive"
+            assert time.monotonic() - started < 0.5
+
+        await task
+        executor.shutdown()
+        assert attempts == 2
+        assert prefetcher.get_stats()["preempted"] == 1
+        assert prefetcher.get_stats()["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_prefetch_of_requested_chunk_is_not_preempted(self):
+        """The interactive request joins the prefetch of its own chunk instead of restarting it"""
+        prefetcher = ChunkPrefetcher()
+        attempts = 0
+
+        async def prefetch():
+            nonlocal attempts
+            attempts += 1
+            await asyncio.sleep(0.02)
+
+        task = prefetcher.schedule(1, TARGET, prefetch)
+        await asyncio.sleep(0)
+
+        async with prefetcher.interactive(keep=TARGET):
+            await task
+
+        assert attempts == 1
+        assert prefetcher.get_stats()["preempted"] == 0
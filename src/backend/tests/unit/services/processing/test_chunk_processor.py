@@ -103,6 +103,102 @@ class TestProcessChunk:
         service.utilities.handle_error.assert_called_once()
 
 
+class TestSharedChunkArtifacts:
+    """Test sharing user-independent artifacts across users"""
+
+    @pytest.fixture
+    def service(self):
+        """Create service with a private artifact store and mocked collaborators"""
+        from services.processing.chunk_artifact_store import ChunkArtifactStore
+        from services.processing.chunk_transcription_service import ChunkTranscriptionService
+        from utils.srt_parser import SRTSegment
+
+        transcription_service = ChunkTranscriptionService(batch_size=0)
+        transcription_service.extract_audio_chunk = AsyncMock(return_value=Path("/temp/audio.wav"))
+        transcription_service.cleanup_temp_audio_file = Mock()
+
+        translation_service = Mock()
+        translation_service.get_model_name = Mock(return_value="Helsinki-NLP/opus-mt-de-en")
+        translation_service.build_translation_segments = AsyncMock(return_value=[])
+        translation_service.translate_all_segments = AsyncMock(
+            return_value=[SRTSegment(index=1, start_time=0.0, end_time=1.0, text="Hello")]
+        )
+
+        service = ChunkProcessingService(
+            Mock(),
+            transcription_service=transcription_service,
+            translation_service=translation_service,
+            utilities=Mock(),
+            artifact_store=ChunkArtifactStore(),
+        )
+        service.utilities.get_authenticated_user = AsyncMock(side_effect=lambda user_id, token: Mock(id=user_id))
+        service.utilities.load_user_language_preferences = Mock(return_value={"target": "de", "native": "en"})
+        service._filter_vocabulary = AsyncMock(return_value=[{"word": "hallo", "active": True}])
+        service._generate_filtered_subtitles = AsyncMock(return_value="/temp/filtered.srt")
+        return service
+
+    @staticmethod
+    async def _transcribe(_task_id, _task_progress, video, _audio, _prefs, start, _end, srt_output=None):
+        srt = srt_output or video.with_suffix(".srt")
+        srt.write_text(f"1\n00:00:00,000 --> 00:00:01,000\nHallo {start:.0f}\n", encoding="utf-8")
+        return str(srt)
+
+    @pytest.mark.asyncio
+    async def test_second_user_reuses_transcript_and_translation(self, service, tmp_path):
+        """Only the first user pays for extraction, transcription and translation"""
+        video_file = tmp_path / "episode.mp4"
+        video_file.write_bytes(b"video")
+        service.utilities.resolve_video_path = Mock(return_value=video_file)
+
+        service.transcription_service.transcribe_chunk = AsyncMock(side_effect=self._transcribe)
+
+        for user_id in (1, 2):
+            task_id = f"task_{user_id}"
+            task_progress = {task_id: Mock(progress=0, current_step="", message="")}
+            await service.process_chunk(str(video_file), 0.0, 300.0, user_id, task_id, task_progress)
+
+        service.transcription_service.extract_audio_chunk.assert_awaited_once()
+        service.transcription_service.transcribe_chunk.assert_awaited_once()
+        service.translation_service.translate_all_segments.assert_awaited_once()
+        assert service._filter_vocabulary.await_count == 2
+        assert service._generate_filtered_subtitles.await_count == 2
+        assert "Hallo" in video_file.with_suffix(".srt").read_text(encoding="utf-8")
+        assert "Hello" in (tmp_path / "episode_translation.srt").read_text(encoding="utf-8")
+
+    @pytest.mark.asyncio
+    async def test_next_chunk_is_prefetched(self, service, tmp_path):
+        """Finishing chunk N prepares chunk N+1 using the user's chunk duration"""
+        from services.processing.chunk_prefetcher import ChunkPrefetcher
+
+        video_file = tmp_path / "episode.mp4"
+        video_file.write_bytes(b"video")
+        service.prefetcher = ChunkPrefetcher()
+        service.utilities.resolve_video_path = Mock(return_value=video_file)
+        service.utilities.get_authenticated_user = AsyncMock(return_value=Mock(id=1, chunk_duration_minutes=5))
+        service.transcription_service.transcribe_chunk = AsyncMock(side_effect=self._transcribe)
+
+        task_progress = {"task_1": Mock(progress=0, current_step="", message="")}
+        await service.process_chunk(str(video_file), 0.0, 300.0, 1, "task_1", task_progress)
+
+        _, prefetch_task = service.prefetcher._tasks[1]
+        await prefetch_task
+
+        extract_calls = service.transcription_service.extract_audio_chunk.await_args_list
+        extracted_ranges = [call.args[3:5] for call in extract_calls]
+        assert extracted_ranges == [(0.0, 300.0), (300.0, 600.0)]
+        assert service.translation_service.translate_all_segments.await_count == 2
+        # The prefetch must not overwrite the SRT of the chunk in use
+        assert "Hallo 0" in video_file.with_suffix(".srt").read_text(encoding="utf-8")
+
+        task_progress = {"task_2": Mock(progress=0, current_step="", message="")}
+        await service.process_chunk(str(video_file), 300.0, 600.0, 1, "task_2", task_progress)
+
+        # Chunk 2 came from the prefetch; chunk 3 is only scheduled so far
+        assert service.transcription_service.extract_audio_chunk.await_count == 2
+        assert "Hallo 300" in video_file.with_suffix(".srt").read_text(encoding="utf-8")
+        service.prefetcher.cancel_all()
+
+
 class TestHealthCheck:
     """Test health check functionality"""
 
@@ -208,3 +304,50 @@ class TestValidateParameters:
         service.validate_parameters()
 
         # Assert
+
+
+class TestSidecarSubtitleSource:
+    """Test processing chunks from existing subtitles instead of ASR"""
+
+    @pytest.mark.asyncio
+    async def test_sidecar_skips_extraction_and_transcription(self, tmp_path):
+        """With prefer_sidecar, the chunk SRT is sliced from the sidecar file"""
+        from services.processing.chunk_transcription_service import ChunkTranscriptionService
+        from services.processing.subtitle_source_policy import SubtitleSourcePolicy, SubtitleSourcePolicyStore
+
+        video_file = tmp_path / "episode.mp4"
+        video_file.write_bytes(b"video")
+        video_file.with_suffix(".sidecar.srt").write_text(
+            "1\n00:05:10,000 --> 00:05:12,000\nGuten Morgen.\n", encoding="utf-8"
+        )
+
+        transcription_service = ChunkTranscriptionService(
+            subtitle_policy=SubtitleSourcePolicyStore(tmp_path / "policies.json", SubtitleSourcePolicy.PREFER_SIDECAR)
+        )
+        transcription_service.extract_audio_chunk = AsyncMock()
+        transcription_service.transcribe_chunk = AsyncMock()
+
+        translation_service = Mock()
+        translation_service.build_translation_segments = AsyncMock(return_value=[])
+
+        service = ChunkProcessingService(
+            Mock(),
+            transcription_service=transcription_service,
+            translation_service=translation_service,
+            utilities=Mock(),
+        )
+        service.utilities.resolve_video_path = Mock(return_value=video_file)
+        service.utilities.get_authenticated_user = AsyncMock(return_value=Mock(id=1))
+        service.utilities.load_user_language_preferences = Mock(return_value={"target": "de", "native": "en"})
+        service._filter_vocabulary = AsyncMock(return_value=[])
+        service._generate_filtered_subtitles = AsyncMock(return_value=str(tmp_path / "episode_filtered.srt"))
+
+        task_progress = {"task_1": Mock(progress=0, current_step="", message="")}
+        await service.process_chunk(str(video_file), 300.0, 600.0, 1, "task_1", task_progress)
+
+        transcription_service.extract_audio_chunk.assert_not_awaited()
+        transcription_service.transcribe_chunk.assert_not_awaited()
+        chunk_srt = video_file.with_suffix(".srt").read_text(encoding="utf-8")
+        assert "Guten Morgen." in chunk_srt
+        assert "00:00:10,000 --> 00:00:12,000" in chunk_srt
+        service._filter_vocabulary.assert_awaited_once()
@@ -6,10 +6,13 @@ Tests audio extraction and transcription for video chunks
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
+import numpy as np
 import pytest
 
 from services.processing.chunk_transcription_service import ChunkTranscriptionError, ChunkTranscriptionService
+from services.processing.subtitle_source_policy import SubtitleSourcePolicy, SubtitleSourcePolicyStore
 from services.transcriptionservice.interface import TranscriptionResult, TranscriptionSegment
+from utils.srt_parser import SRTParser
 
 
 class TestChunkTranscriptionServiceInitialization:
@@ -188,6 +191,108 @@ class TestFindMatchingSrtFile:
         assert result == str(tmp_path / "video.srt")
 
 
+SIDECAR_SRT = """1
+00:00:01,000 --> 00:00:03,000
+Vor dem Chunk.
+
+2
+00:04:58,000 --> 00:05:02,000
+Über die Grenze.
+
+3
+00:06:00,000 --> 00:06:02,500
+Mitten im Chunk.
+
+4
+00:10:30,000 --> 00:10:32,000
+Nach dem Chunk.
+"""
+
+
+class TestSidecarSubtitles:
+    """Test using existing subtitles instead of ASR"""
+
+    @pytest.fixture
+    def policy_store(self, tmp_path):
+        return SubtitleSourcePolicyStore(tmp_path / "policies.json", SubtitleSourcePolicy.PREFER_SIDECAR)
+
+    @pytest.fixture
+    def service(self, policy_store):
+        return ChunkTranscriptionService(subtitle_policy=policy_store)
+
+    @pytest.fixture
+    def video_file(self, tmp_path):
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"video")
+        return video_file
+
+    def test_plain_srt_is_not_a_sidecar(self, service, video_file):
+        """video.srt holds chunk transcripts and must not be mistaken for full subtitles"""
+        video_file.with_suffix(".srt").write_text(SIDECAR_SRT, encoding="utf-8")
+
+        assert service.find_sidecar_subtitles(video_file, "de") is None
+
+    def test_uploaded_copy_preferred_over_language_file(self, service, video_file):
+        """The uploaded sidecar copy wins over video.<lang>.srt"""
+        video_file.with_suffix(".de.srt").write_text(SIDECAR_SRT, encoding="utf-8")
+        video_file.with_suffix(".sidecar.srt").write_text(SIDECAR_SRT, encoding="utf-8")
+
+        assert service.find_sidecar_subtitles(video_file, "de") == video_file.with_suffix(".sidecar.srt")
+
+    def test_slice_clips_and_shifts_to_chunk(self, service, video_file):
+        """Cues overlapping the range are clipped and made chunk-relative"""
+        sidecar = video_file.with_suffix(".de.srt")
+        sidecar.write_text(SIDECAR_SRT, encoding="utf-8")
+
+        segments = SRTParser.parse_content(service.slice_sidecar_subtitles(sidecar, 300.0, 600.0))
+
+        assert [segment.text for segment in segments] == ["Über die Grenze.", "Mitten im Chunk."]
+        assert [segment.index for segment in segments] == [1, 2]
+        assert segments[0].start_time == 0.0
+        assert segments[0].end_time == pytest.approx(2.0)
+        assert segments[1].start_time == pytest.approx(60.0)
+
+    def test_slice_without_cues_returns_none(self, service, video_file):
+        """An empty range falls back to ASR"""
+        sidecar = video_file.with_suffix(".de.srt")
+        sidecar.write_text(SIDECAR_SRT, encoding="utf-8")
+
+        assert service.slice_sidecar_subtitles(sidecar, 1200.0, 1500.0) is None
+
+    @pytest.mark.asyncio
+    async def test_load_sidecar_chunk_writes_chunk_srt(self, service, video_file):
+        """The chunk SRT is written where transcribe_chunk would put it"""
+        video_file.with_suffix(".de.srt").write_text(SIDECAR_SRT, encoding="utf-8")
+        task_id = "test_task"
+        task_progress = {task_id: Mock(progress=0, current_step="", message="")}
+
+        srt_file = await service.load_sidecar_chunk(task_id, task_progress, video_file, 300.0, 600.0, {"target": "de"})
+
+        assert srt_file == str(video_file.with_suffix(".srt"))
+        assert "Mitten im Chunk." in Path(srt_file).read_text(encoding="utf-8")
+        assert task_progress[task_id].progress == 35
+
+    @pytest.mark.asyncio
+    async def test_embedded_subtitles_used_without_sidecar_file(self, service, video_file):
+        """Embedded subtitle streams are extracted once and sliced like a sidecar"""
+        embedded = video_file.with_suffix(".embedded.de.srt")
+        embedded.write_text(SIDECAR_SRT, encoding="utf-8")
+
+        with patch("services.media.subtitle_extractor.extract_embedded_subtitles", return_value=embedded) as extract:
+            srt_content = await service.get_sidecar_chunk_text(video_file, 300.0, 600.0, {"target": "de"})
+
+        extract.assert_called_once_with(video_file, "de", embedded)
+        assert "Mitten im Chunk." in srt_content
+
+    @pytest.mark.asyncio
+    async def test_force_asr_ignores_sidecar(self, service, policy_store, video_file):
+        """A per-video force_asr override disables the sidecar"""
+        video_file.with_suffix(".de.srt").write_text(SIDECAR_SRT, encoding="utf-8")
+        policy_store.set_policy(video_file, SubtitleSourcePolicy.FORCE_ASR)
+
+        assert await service.get_sidecar_chunk_text(video_file, 300.0, 600.0, {"target": "de"}) is None
+
+
 class TestCleanupTempAudioFile:
     """Test temporary audio file cleanup"""
 
@@ -233,9 +338,9 @@ class TestCleanupTempAudioFile:
 class TestExtractAudioChunk:
     """Test audio extraction"""
 
-    @pytest.fixture
-    def service(self):
-        return ChunkTranscriptionService()
+    @pytest.fixture(params=[True, False], ids=["memory", "file"])
+    def service(self, request):
+        return ChunkTranscriptionService(stream_to_memory=request.param)
 
     @pytest.mark.asyncio
     async def test_extract_audio_chunk_ffmpeg_not_found(self, service, tmp_path):
@@ -272,6 +377,164 @@ class TestExtractAudioChunk:
         mock_process.kill.assert_called_once()
 
 
+class TestExtractAudioToMemory:
+    """Test streaming extraction through ffmpeg's stdout"""
+
+    @pytest.fixture
+    def service(self):
+        return ChunkTranscriptionService(stream_to_memory=True, fast_seek=True, seek_preroll=0.0)
+
+    @pytest.mark.asyncio
+    async def test_pcm_converted_to_float32(self, service, tmp_path):
+        """stdout PCM becomes a normalized float32 array and no file is written"""
+        video_file = tmp_path / "video.mp4"
+        video_file.touch()
+        task_id = "test_task"
+        task_progress = {task_id: Mock(progress=0, current_step="", message="")}
+
+        pcm = np.array([0, 16384, -32768, 32767], dtype="<i2").tobytes()
+        mock_process = Mock(returncode=0)
+        mock_process.communicate = AsyncMock(return_value=(pcm, b""))
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process) as spawn:
+            audio = await service.extract_audio_chunk(task_id, task_progress, video_file, 60.0, 90.0)
+
+        cmd = spawn.call_args.args
+        assert cmd[-1] == "pipe:1"
+        assert audio.dtype == np.float32
+        np.testing.assert_allclose(audio, [0.0, 0.5, -1.0, 32767 / 32768])
+        assert list(tmp_path.iterdir()) == [video_file]
+
+    @pytest.mark.asyncio
+    async def test_empty_output_raises(self, service, tmp_path):
+        """No samples on stdout is reported as a missing audio segment"""
+        video_file = tmp_path / "video.mp4"
+        video_file.touch()
+        task_id = "test_task"
+        task_progress = {task_id: Mock(progress=0, current_step="", message="")}
+
+        mock_process = Mock(returncode=0)
+        mock_process.communicate = AsyncMock(return_value=(b"", b""))
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+            with pytest.raises(ChunkTranscriptionError, match="no audio samples"):
+                await service.extract_audio_chunk(task_id, task_progress, video_file, 0.0, 10.0)
+
+    @pytest.mark.asyncio
+    async def test_ffmpeg_failure_raises(self, service, tmp_path):
+        """Non-zero exit code surfaces ffmpeg's stderr"""
+        video_file = tmp_path / "video.mp4"
+        video_file.touch()
+        task_id = "test_task"
+        task_progress = {task_id: Mock(progress=0, current_step="", message="")}
+
+        mock_process = Mock(returncode=1)
+        mock_process.communicate = AsyncMock(return_value=(b"", b"Invalid data found"))
+
+        with patch("asyncio.create_subprocess_exec", return_value=mock_process):
+            with pytest.raises(ChunkTranscriptionError, match="Invalid data found"):
+                await service.extract_audio_chunk(task_id, task_progress, video_file, 0.0, 10.0)
+
+
+class TestEpisodeAudioCacheMode:
+    """Test chunk audio served from the episode audio cache"""
+
+    @pytest.mark.asyncio
+    async def test_extract_audio_chunk_uses_cache(self, tmp_path):
+        """Cached mode returns the in-memory slice and spawns no ffmpeg process"""
+        samples = np.zeros(16000, dtype=np.float32)
+        audio_cache = Mock()
+        audio_cache.get_chunk = AsyncMock(return_value=samples)
+        service = ChunkTranscriptionService(audio_cache=audio_cache)
+
+        video_file = tmp_path / "video.mp4"
+        video_file.touch()
+        task_id = "test_task"
+        task_progress = {task_id: Mock(progress=0, current_step="", message="")}
+
+        with patch("asyncio.create_subprocess_exec") as spawn:
+            audio = await service.extract_audio_chunk(task_id, task_progress, video_file, 300.0, 301.0)
+
+        assert audio is samples
+        audio_cache.get_chunk.assert_awaited_once_with(video_file, 300.0, 301.0)
+        spawn.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_transcribe_chunk_passes_samples(self, tmp_path):
+        """In-memory audio is handed to the backend as-is"""
+        service = ChunkTranscriptionService(batch_size=0)
+        samples = np.zeros(16000, dtype=np.float32)
+
+        video_file = tmp_path / "video.mp4"
+        video_file.touch()
+        task_id = "test_task"
+        task_progress = {task_id: Mock(progress=0, current_step="", message="")}
+
+        mock_service = Mock()
+        mock_service.transcribe_with_progress = AsyncMock(
+            return_value=TranscriptionResult(
+                full_text="Hallo.", segments=[TranscriptionSegment(start_time=0.0, end_time=1.0, text="Hallo.")]
+            )
+        )
+
+        with patch("core.dependencies.get_transcription_service", return_value=mock_service):
+            await service.transcribe_chunk(task_id, task_progress, video_file, samples, {"target": "de"}, 0.0, 1.0)
+
+        assert mock_service.transcribe_with_progress.call_args.args[0] is samples
+
+    def test_cleanup_ignores_in_memory_audio(self, tmp_path):
+        """Nothing to delete for in-memory audio"""
+        service = ChunkTranscriptionService()
+        video_file = tmp_path / "video.mp4"
+        video_file.touch()
+
+        service.cleanup_temp_audio_file(np.zeros(10, dtype=np.float32), video_file)
+
+        assert video_file.exists()
+
+
+class TestBuildFfmpegCommand:
+    """Test ffmpeg seek strategy"""
+
+    def test_fast_seek_puts_ss_before_input(self):
+        """Input seeking: -ss precedes -i so ffmpeg skips decoding up to the offset"""
+        service = ChunkTranscriptionService(fast_seek=True, seek_preroll=0.0)
+
+        cmd = service._build_ffmpeg_command(Path("video.mp4"), 2400.0, 300.0, Path("out.wav"))
+
+        assert cmd.index("-ss") < cmd.index("-i")
+        assert cmd[cmd.index("-ss") + 1] == "2400.0"
+        assert cmd.count("-ss") == 1
+        assert cmd[cmd.index("-t") + 1] == "300.0"
+
+    def test_fast_seek_with_preroll(self):
+        """Pre-roll: coarse input seek before the chunk, accurate output seek over the pre-roll"""
+        service = ChunkTranscriptionService(fast_seek=True, seek_preroll=2.0)
+
+        cmd = service._build_ffmpeg_command(Path("video.mp4"), 600.0, 300.0, Path("out.wav"))
+
+        input_index = cmd.index("-i")
+        assert cmd[:input_index] == ["ffmpeg", "-ss", "598.0"]
+        assert cmd[input_index + 2 : input_index + 4] == ["-ss", "2.0"]
+
+    def test_fast_seek_preroll_clamped_at_file_start(self):
+        """Pre-roll never seeks before 0"""
+        service = ChunkTranscriptionService(fast_seek=True, seek_preroll=5.0)
+
+        cmd = service._build_ffmpeg_command(Path("video.mp4"), 1.0, 30.0, Path("out.wav"))
+
+        assert cmd[1:3] == ["-ss", "0.0"]
+        assert cmd[cmd.index("-i") + 2 : cmd.index("-i") + 4] == ["-ss", "1.0"]
+
+    def test_output_seek_mode(self):
+        """Legacy mode keeps -ss after -i"""
+        service = ChunkTranscriptionService(fast_seek=False)
+
+        cmd = service._build_ffmpeg_command(Path("video.mp4"), 600.0, 300.0, Path("out.wav"))
+
+        assert cmd.index("-i") < cmd.index("-ss")
+
+
 class TestTranscribeChunk:
     """Test transcription"""
 
@@ -400,3 +663,75 @@ class TestTranscribeChunk:
                 await service.transcribe_chunk(
                     task_id, task_progress, video_file, audio_file, {"target": "de"}, 0.0, 30.0
                 )
+
+    @pytest.mark.asyncio
+    async def test_transcribe_chunk_batched_mode(self, tmp_path):
+        """Test batched mode routes through transcribe_batched_with_progress"""
+        service = ChunkTranscriptionService(batch_size=8)
+
+        video_file = tmp_path / "video.mp4"
+        video_file.touch()
+
+        audio_file = tmp_path / "audio.wav"
+        audio_file.touch()
+
+        task_id = "test_task"
+        task_progress = {task_id: Mock(progress=0, current_step="", message="")}
+
+        mock_service = Mock()
+        mock_result = TranscriptionResult(
+            full_text="Batched text.",
+            segments=[TranscriptionSegment(start_time=0.0, end_time=2.0, text="Batched text.")],
+            language="de",
+        )
+        mock_service.transcribe_batched_with_progress = AsyncMock(return_value=mock_result)
+        mock_service.transcribe_with_progress = AsyncMock()
+
+        with patch("core.dependencies.get_transcription_service", return_value=mock_service):
+            result = await service.transcribe_chunk(
+                task_id, task_progress, video_file, audio_file, {"target": "de"}, 0.0, 30.0
+            )
+
+        assert "Batched text." in Path(result).read_text()
+        assert mock_service.transcribe_batched_with_progress.call_args.kwargs["batch_size"] == 8
+        mock_service.transcribe_with_progress.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_transcribe_chunk_result_cache_skips_asr(self, tmp_path):
+        """Second transcription of the same chunk is served from the result cache"""
+        from services.transcriptionservice.result_cache import TranscriptionResultCache
+
+        cache = TranscriptionResultCache(tmp_path / "cache", max_bytes=1024 * 1024)
+        service = ChunkTranscriptionService(batch_size=0, result_cache=cache)
+
+        video_file = tmp_path / "video.mp4"
+        video_file.write_bytes(b"video")
+        audio = np.zeros(16000, dtype=np.float32)
+
+        task_id = "test_task"
+        task_progress = {task_id: Mock(progress=0, current_step="", message="")}
+
+        mock_service = Mock(spec=["transcribe_with_progress", "model_info"])
+        mock_service.model_info = {"name": "faster-whisper-tiny", "loaded": True}
+        mock_service.transcribe_with_progress = AsyncMock(
+            return_value=TranscriptionResult(
+                full_text="Hallo Welt.",
+                segments=[TranscriptionSegment(start_time=0.0, end_time=1.5, text="Hallo Welt.")],
+                language="de",
+            )
+        )
+
+        with patch("core.dependencies.get_transcription_service", return_value=mock_service):
+            first = await service.transcribe_chunk(
+                task_id, task_progress, video_file, audio, {"target": "de"}, 0.0, 30.0
+            )
+            Path(first).unlink()
+            second = await service.transcribe_chunk(
+                task_id, task_progress, video_file, audio, {"target": "de"}, 0.0, 30.0
+            )
+
+        assert mock_service.transcribe_with_progress.await_count == 1
+        assert "Hallo Welt." in Path(second).read_text(encoding="utf-8")
+        assert task_progress[task_id].progress == 35
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
@@ -19,6 +19,7 @@ from unittest.mock import AsyncMock, Mock, patch
 import pytest
 
 from services.processing.chunk_translation_service import ChunkTranslationService
+from services.translationservice.model_registry import TranslationModelRegistry
 from utils.srt_parser import SRTSegment
 
 
@@ -26,10 +27,12 @@ class TestChunkTranslationServiceInitialization:
     """Test service initialization"""
 
     def test_initialization(self):
-        """Test service initializes with empty cache"""
+        """Test service uses the process-wide model registry by default"""
+        from services.translationservice.model_registry import get_translation_model_registry
+
         service = ChunkTranslationService()
 
-        assert service._translation_services == {}
+        assert service.model_registry is get_translation_model_registry()
 
 
 class TestGetTranslationService:
@@ -37,20 +40,20 @@ class TestGetTranslationService:
 
     @pytest.fixture
     def service(self):
-        return ChunkTranslationService()
+        return ChunkTranslationService(model_registry=TranslationModelRegistry())
 
     def test_get_translation_service_creates_new(self, service):
         """Test creating new translation service"""
         with patch("services.processing.chunk_translation_service.TranslationServiceFactory") as MockFactory:
             mock_service = Mock()
-            MockFactory.create_service.return_value = mock_service
+            MockFactory.create_uncached_service.return_value = mock_service
 
             result = service.get_translation_service("de", "en", "standard")
 
             assert result == mock_service
             # Verify factory was called with service_name and model_name
-            MockFactory.create_service.assert_called_once()
-            call_kwargs = MockFactory.create_service.call_args.kwargs
+            MockFactory.create_uncached_service.assert_called_once()
+            call_kwargs = MockFactory.create_uncached_service.call_args.kwargs
             assert "service_name" in call_kwargs
             assert "model_name" in call_kwargs
 
@@ -58,7 +61,7 @@ class TestGetTranslationService:
         """Test translation service is cached"""
         with patch("services.processing.chunk_translation_service.TranslationServiceFactory") as MockFactory:
             mock_service = Mock()
-            MockFactory.create_service.return_value = mock_service
+            MockFactory.create_uncached_service.return_value = mock_service
 
             # First call creates service
             result1 = service.get_translation_service("de", "en", "standard")
@@ -66,33 +69,62 @@ class TestGetTranslationService:
             result2 = service.get_translation_service("de", "en", "standard")
 
             assert result1 == result2
-            assert MockFactory.create_service.call_count == 1
+            assert MockFactory.create_uncached_service.call_count == 1
 
     def test_get_translation_service_different_pairs(self, service):
         """Test different language pairs create separate services"""
         with patch("services.processing.chunk_translation_service.TranslationServiceFactory") as MockFactory:
             mock_service1 = Mock(name="service1")
             mock_service2 = Mock(name="service2")
-            MockFactory.create_service.side_effect = [mock_service1, mock_service2]
+            MockFactory.create_uncached_service.side_effect = [mock_service1, mock_service2]
 
             result1 = service.get_translation_service("de", "en")
             result2 = service.get_translation_service("es", "en")
 
             assert result1 != result2
-            assert MockFactory.create_service.call_count == 2
+            assert MockFactory.create_uncached_service.call_count == 2
+
+    def test_services_shared_across_instances(self):
+        """Instances using the same registry share one model per language pair"""
+        registry = TranslationModelRegistry()
+        with patch("services.processing.chunk_translation_service.TranslationServiceFactory") as MockFactory:
+            MockFactory.create_uncached_service.return_value = Mock()
+
+            first = ChunkTranslationService(model_registry=registry).get_translation_service("de", "en")
+            second = ChunkTranslationService(model_registry=registry).get_translation_service("de", "en")
+
+            assert first is second
+            assert MockFactory.create_uncached_service.call_count == 1
+            assert registry.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_build_translation_texts_releases_model(self):
+        """The model is released after translating so it can be evicted"""
+        registry = TranslationModelRegistry()
+        service = ChunkTranslationService(model_registry=registry)
+        with patch("services.processing.chunk_translation_service.TranslationServiceFactory") as MockFactory:
+            translator = MockFactory.create_uncached_service.return_value
+            translator.translate_batch_async = AsyncMock(side_effect=RuntimeError("model crashed"))
+            translator.translate.side_effect = RuntimeError("model crashed")
+
+            await service._build_translation_texts(
+                None, None, [SRTSegment(1, 0.0, 1.0, "Hallo")], {"target": "de", "native": "en"}
+            )
+
+        assert registry.get_stats()["in_use"] == 0
 
     def test_get_translation_service_different_quality(self, service):
         """Test different quality levels create separate services"""
         with patch("services.processing.chunk_translation_service.TranslationServiceFactory") as MockFactory:
             mock_service1 = Mock(name="standard")
             mock_service2 = Mock(name="high")
-            MockFactory.create_service.side_effect = [mock_service1, mock_service2]
+            MockFactory.create_uncached_service.side_effect = [mock_service1, mock_service2]
 
             result1 = service.get_translation_service("de", "en", "standard")
             result2 = service.get_translation_service("de", "en", "high")
 
             assert result1 != result2
-            assert MockFactory.create_service.call_count == 2
+            assert MockFactory.create_uncached_service.call_count == 2
 
 
 class TestBuildTranslationSegments:
@@ -174,8 +206,15 @@ class TestBuildTranslationSegments:
         from services.translationservice.interface import TranslationResult
 
         mock_translation_service = Mock()
-        mock_translation_service.translate.return_value = TranslationResult(
-            original_text="Other text", translated_text="Translated text", source_language="en", target_language="de"
+        mock_translation_service.translate_batch_async = AsyncMock(
+            return_value=[
+                TranslationResult(
+                    original_text="Other text",
+                    translated_text="Translated text",
+                    source_language="en",
+                    target_language="de",
+                )
+            ]
         )
 
         with patch("services.processing.chunk_translation_service.SRTParser") as MockParser:
@@ -288,7 +327,7 @@ class TestBuildTranslationTexts:
 
         mock_translation_service = Mock()
         mock_result = Mock(translated_text="Hello")
-        mock_translation_service.translate.return_value = mock_result
+        mock_translation_service.translate_batch_async = AsyncMock(return_value=[mock_result])
 
         service.get_translation_service = Mock(return_value=mock_translation_service)
 
@@ -313,8 +352,9 @@ class TestBuildTranslationTexts:
         language_prefs = {"target": "de", "native": "en"}
 
         mock_translation_service = Mock()
-        # First translation fails, second succeeds
+        # The batch fails; retried one by one, the first translation fails and the second succeeds
         mock_result = Mock(translated_text="World")
+        mock_translation_service.translate_batch_async = AsyncMock(side_effect=Exception("Translation error"))
         mock_translation_service.translate.side_effect = [Exception("Translation error"), mock_result]
 
         service.get_translation_service = Mock(return_value=mock_translation_service)
@@ -338,7 +378,7 @@ class TestBuildTranslationTexts:
 
         mock_translation_service = Mock()
         mock_result = Mock(translated_text="Hello")
-        mock_translation_service.translate.return_value = mock_result
+        mock_translation_service.translate_batch_async = AsyncMock(return_value=[mock_result])
 
         service.get_translation_service = Mock(return_value=mock_translation_service)
 
@@ -355,6 +395,123 @@ class TestBuildTranslationTexts:
         final_progress = task_progress["test_task"].progress
         assert final_progress > initial_progress
 
+    @pytest.mark.asyncio
+    async def test_build_translation_texts_batches_segments(self, task_progress):
+        """Segments are translated with one translate_batch call per batch"""
+        service = ChunkTranslationService(batch_size=2)
+        subtitle_segments = [SRTSegment(i, float(i), float(i + 1), f"Satz {i}") for i in range(1, 6)]
+
+        mock_translation_service = Mock()
+        mock_translation_service.translate_batch_async = AsyncMock(
+            side_effect=lambda texts, src, tgt: [Mock(translated_text=t.replace("Satz", "Sentence")) for t in texts]
+        )
+        service.get_translation_service = Mock(return_value=mock_translation_service)
+
+        result = await service._build_translation_texts(
+            task_id="test_task",
+            task_progress=task_progress,
+            subtitle_segments=subtitle_segments,
+            language_preferences={"target": "de", "native": "en"},
+        )
+
+        batches = [call.args[0] for call in mock_translation_service.translate_batch_async.await_args_list]
+        assert batches == [["Satz 1", "Satz 2"], ["Satz 3", "Satz 4"], ["Satz 5"]]
+        mock_translation_service.translate.assert_not_called()
+        assert [seg.text for seg in result] == [f"Sentence {i}" for i in range(1, 6)]
+        assert [seg.start_time for seg in result] == [1.0, 2.0, 3.0, 4.0, 5.0]
+        assert task_progress["test_task"].progress == 95
+
+    @pytest.mark.asyncio
+    async def test_repeated_lines_translated_once(self, task_progress):
+        """Identical segment texts reach the model once and are fanned out to every segment"""
+        service = ChunkTranslationService(batch_size=2)
+        subtitle_segments = [
+            SRTSegment(1, 0.0, 1.0, "Ja."),
+            SRTSegment(2, 1.0, 2.0, "Was?"),
+            SRTSegment(3, 2.0, 3.0, " Ja. "),
+            SRTSegment(4, 3.0, 4.0, "Komm\nschon!"),
+            SRTSegment(5, 4.0, 5.0, "Was?"),
+        ]
+
+        mock_translation_service = Mock()
+        mock_translation_service.translate_batch_async = AsyncMock(
+            side_effect=lambda texts, src, tgt: [Mock(translated_text=t.upper()) for t in texts]
+        )
+        service.get_translation_service = Mock(return_value=mock_translation_service)
+
+        result = await service._build_translation_texts(
+            "test_task", task_progress, subtitle_segments, {"target": "de", "native": "en"}
+        )
+
+        batches = [call.args[0] for call in mock_translation_service.translate_batch_async.await_args_list]
+        assert batches == [["Ja.", "Was?"], ["Komm\nschon!"]]
+        assert [seg.text for seg in result] == ["JA.", "WAS?", "JA.", "KOMM\nSCHON!", "WAS?"]
+        assert [seg.index for seg in result] == [1, 2, 3, 4, 5]
+        assert task_progress["test_task"].message == "Translation completed"
+
+    @pytest.mark.asyncio
+    async def test_translation_memory_hits_skip_model(self, task_progress, tmp_path):
+        """Segments found in the translation memory are not sent to the model"""
+        from services.translationservice.translation_memory import TranslationMemory
+
+        memory = TranslationMemory(tmp_path / "tm.sqlite3")
+        service = ChunkTranslationService(translation_memory=memory)
+        model_name = service.get_model_name("de", "en")
+        memory.put_many(model_name, "de", "en", {"Ja.": "Yes."})
+
+        mock_translation_service = Mock()
+        mock_translation_service.translate_batch_async = AsyncMock(
+            side_effect=lambda texts, src, tgt: [Mock(translated_text=t.upper()) for t in texts]
+        )
+        service.get_translation_service = Mock(return_value=mock_translation_service)
+        subtitle_segments = [
+            SRTSegment(1, 0.0, 1.0, "Ja."),
+            SRTSegment(2, 1.0, 2.0, "Was?"),
+            SRTSegment(3, 2.0, 3.0, "Ja."),
+        ]
+
+        result = await service._build_translation_texts(
+            "test_task", task_progress, subtitle_segments, {"target": "de", "native": "en"}
+        )
+
+        mock_translation_service.translate_batch_async.assert_awaited_once_with(["Was?"], "de", "en")
+        assert [seg.text for seg in result] == ["Yes.", "WAS?", "Yes."]
+        # Fresh translations are remembered for the next chunk
+        assert memory.get_many(model_name, "de", "en", ["Was?"]) == {"Was?": "WAS?"}
+        assert task_progress["test_task"].progress == 95
+
+    @pytest.mark.asyncio
+    async def test_concurrent_chunks_share_micro_batches(self):
+        """With micro-batching, concurrent chunks are translated in one model call"""
+        import asyncio
+
+        from services.translationservice.micro_batcher import _micro_batchers
+
+        mock_translation_service = Mock()
+        mock_translation_service.translate_batch_async = AsyncMock(
+            side_effect=lambda texts, src, tgt: [Mock(translated_text=t.upper()) for t in texts]
+        )
+        task_progress = {"task_1": Mock(progress=0), "task_2": Mock(progress=0)}
+        services = [ChunkTranslationService(micro_batching=True) for _ in range(2)]
+        for service in services:
+            service.get_translation_service = Mock(return_value=mock_translation_service)
+
+        try:
+            first, second = await asyncio.gather(
+                services[0]._build_translation_texts(
+                    "task_1", task_progress, [SRTSegment(1, 0.0, 1.0, "hallo")], {"target": "de", "native": "en"}
+                ),
+                services[1]._build_translation_texts(
+                    "task_2", task_progress, [SRTSegment(1, 0.0, 1.0, "welt")], {"target": "de", "native": "en"}
+                ),
+            )
+        finally:
+            _micro_batchers.pop(mock_translation_service, None)
+
+        mock_translation_service.translate_batch_async.assert_awaited_once_with(["hallo", "welt"], "de", "en")
+        assert first[0].text == "HALLO"
+        assert second[0].text == "WELT"
+
 
 class TestSegmentsOverlap:
     """Test time segment overlap detection"""
@@ -437,8 +594,8 @@ class TestIntegration:
             with patch("services.processing.chunk_translation_service.TranslationServiceFactory") as MockFactory:
                 mock_trans_service = Mock()
                 mock_result = Mock(translated_text="Hello World")
-                mock_trans_service.translate.return_value = mock_result
-                MockFactory.create_service.return_value = mock_trans_service
+                mock_trans_service.translate_batch_async = AsyncMock(return_value=[mock_result])
+                MockFactory.create_uncached_service.return_value = mock_trans_service
 
                 result = await service.build_translation_segments(
                     task_id="test_task",
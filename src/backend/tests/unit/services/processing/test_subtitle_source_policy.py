@@ -0,0 +1,47 @@
+"""
+Test suite for SubtitleSourcePolicyStore
+Tests per-video overrides, the default policy and persistence
+"""
+
+from services.processing.subtitle_source_policy import SubtitleSourcePolicy, SubtitleSourcePolicyStore
+
+
+class TestSubtitleSourcePolicyStore:
+    """Test per-video subtitle source policies"""
+
+    def test_default_policy_without_override(self, tmp_path):
+        """Videos without an override use the default"""
+        store = SubtitleSourcePolicyStore(tmp_path / "policies.json", SubtitleSourcePolicy.FORCE_ASR)
+
+        assert store.get_policy(tmp_path / "video.mp4") == SubtitleSourcePolicy.FORCE_ASR
+
+    def test_override_is_persisted(self, tmp_path):
+        """Overrides survive a new store instance (e.g. a restart)"""
+        policy_file = tmp_path / "policies.json"
+        video_file = tmp_path / "video.mp4"
+        SubtitleSourcePolicyStore(policy_file, SubtitleSourcePolicy.FORCE_ASR).set_policy(
+            video_file, SubtitleSourcePolicy.PREFER_SIDECAR
+        )
+
+        store = SubtitleSourcePolicyStore(policy_file, SubtitleSourcePolicy.FORCE_ASR)
+
+        assert store.get_policy(video_file) == SubtitleSourcePolicy.PREFER_SIDECAR
+        assert store.get_policy(tmp_path / "other.mp4") == SubtitleSourcePolicy.FORCE_ASR
+
+    def test_clearing_override_restores_default(self, tmp_path):
+        """Setting None removes the override"""
+        store = SubtitleSourcePolicyStore(tmp_path / "policies.json", SubtitleSourcePolicy.PREFER_SIDECAR)
+        video_file = tmp_path / "video.mp4"
+        store.set_policy(video_file, SubtitleSourcePolicy.FORCE_ASR)
+
+        store.set_policy(video_file, None)
+
+        assert store.get_policy(video_file) == SubtitleSourcePolicy.PREFER_SIDECAR
+
+    def test_corrupt_policy_file_uses_default(self, tmp_path):
+        """An unreadable policy file does not break chunk processing"""
+        policy_file = tmp_path / "policies.json"
+        policy_file.write_text("{not json", encoding="utf-8")
+        store = SubtitleSourcePolicyStore(policy_file, SubtitleSourcePolicy.FORCE_ASR)
+
+        assert store.get_policy(tmp_path / "video.mp4") == SubtitleSourcePolicy.FORCE_ASR
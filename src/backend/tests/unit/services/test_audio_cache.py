@@ -0,0 +1,130 @@
+"""
+Test suite for the episode-level PCM audio cache
+"""
+
+import asyncio
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from services.media.audio_cache import AudioCacheError, EpisodeAudioCache
+
+
+@pytest.fixture
+def video_file(tmp_path) -> Path:
+    video = tmp_path / "episode.mp4"
+    video.write_bytes(b"fake video")
+    return video
+
+
+@pytest.fixture
+def cache(tmp_path) -> EpisodeAudioCache:
+    """Cache whose decoder writes a ramp signal instead of calling ffmpeg"""
+    cache = EpisodeAudioCache(tmp_path / "cache", max_bytes=10 * 1024 * 1024, sample_rate=100)
+    cache.decode_calls = 0
+
+    def fake_decode(video, pcm_path):
+        cache.decode_calls += 1
+        cache.cache_dir.mkdir(parents=True, exist_ok=True)
+        np.arange(1000, dtype=np.float32).tofile(pcm_path)  # 10 seconds at 100 Hz
+
+    cache._decode_episode = fake_decode
+    return cache
+
+
+class TestGetChunk:
+    """Test chunk slicing from the cached episode"""
+
+    @pytest.mark.asyncio
+    async def test_returns_memory_mapped_slice(self, cache, video_file):
+        """Chunk is a zero-copy view on the cached file"""
+        audio = await cache.get_chunk(video_file, 2.0, 4.0)
+
+        assert audio.dtype == np.float32
+        assert len(audio) == 200
+        assert audio[0] == 200.0
+        assert isinstance(audio.base, np.memmap) or isinstance(audio, np.memmap)
+
+    @pytest.mark.asyncio
+    async def test_decodes_episode_once(self, cache, video_file):
+        """Consecutive chunks reuse the decoded episode"""
+        await cache.get_chunk(video_file, 0.0, 2.0)
+        await cache.get_chunk(video_file, 2.0, 4.0)
+        await cache.get_chunk(video_file, 0.0, 2.0)
+
+        assert cache.decode_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_decode(self, cache, video_file):
+        """Parallel requests for the same episode trigger a single decode"""
+        await asyncio.gather(*(cache.get_chunk(video_file, i, i + 1.0) for i in range(5)))
+
+        assert cache.decode_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_end_clamped_to_episode_length(self, cache, video_file):
+        """Last chunk stops at the end of the audio"""
+        audio = await cache.get_chunk(video_file, 8.0, 30.0)
+
+        assert len(audio) == 200
+
+    @pytest.mark.asyncio
+    async def test_range_beyond_audio_raises(self, cache, video_file):
+        """Range entirely after the end of the episode is an error"""
+        with pytest.raises(AudioCacheError, match="No audio in range"):
+            await cache.get_chunk(video_file, 20.0, 30.0)
+
+    @pytest.mark.asyncio
+    async def test_modified_video_invalidates_entry(self, cache, video_file):
+        """Replacing the video file produces a new cache key"""
+        await cache.get_chunk(video_file, 0.0, 1.0)
+        video_file.write_bytes(b"re-encoded video with different size")
+
+        await cache.get_chunk(video_file, 0.0, 1.0)
+
+        assert cache.decode_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_episode_locks_are_released(self, cache, video_file):
+        """Per-episode locks do not outlive the requests that use them"""
+        await asyncio.gather(*(cache.get_chunk(video_file, i, i + 1.0) for i in range(3)))
+
+        assert len(cache._locks) == 0
+
+
+class TestEnforceQuota:
+    """Test LRU eviction"""
+
+    def _entry(self, cache_dir: Path, name: str, size: int, age: float) -> Path:
+        path = cache_dir / f"{name}.f32"
+        path.write_bytes(b"\0" * size)
+        stamp = time.time() - age
+        os.utime(path, (stamp, stamp))
+        return path
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Oldest entries are removed until the cache fits"""
+        cache = EpisodeAudioCache(tmp_path, max_bytes=250)
+        oldest = self._entry(tmp_path, "a", 100, age=300)
+        middle = self._entry(tmp_path, "b", 100, age=200)
+        newest = self._entry(tmp_path, "c", 100, age=100)
+
+        cache.enforce_quota()
+
+        assert not oldest.exists()
+        assert middle.exists()
+        assert newest.exists()
+
+    def test_keeps_entry_just_added(self, tmp_path):
+        """The newly decoded episode survives even if it alone exceeds the quota"""
+        cache = EpisodeAudioCache(tmp_path, max_bytes=50)
+        other = self._entry(tmp_path, "a", 100, age=100)
+        added = self._entry(tmp_path, "b", 100, age=300)
+
+        cache.enforce_quota(keep=added)
+
+        assert added.exists()
+        assert not other.exists()
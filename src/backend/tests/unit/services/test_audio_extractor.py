@@ -0,0 +1,113 @@
+"""
+Test suite for the ffmpeg-based audio extractor
+"""
+
+import shutil
+import subprocess
+import wave
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from services.media.audio_extractor import (
+    AudioExtractionError,
+    build_ffmpeg_command,
+    extract_audio_array,
+    extract_audio_from_video,
+)
+
+requires_ffmpeg = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not available")
+
+
+@pytest.fixture
+def sine_video(tmp_path):
+    """10-second video with a sine audio track"""
+    video = tmp_path / "clip.mp4"
+    cmd = [
+        "ffmpeg",
+        "-f",
+        "lavfi",
+        "-i",
+        "color=c=black:s=32x32:r=5:d=10",
+        "-f",
+        "lavfi",
+        "-i",
+        "sine=frequency=440:sample_rate=44100:duration=10",
+        "-c:a",
+        "aac",
+        "-shortest",
+        "-y",
+        str(video),
+    ]
+    subprocess.run(cmd, check=True, capture_output=True)
+    return video
+
+
+class TestBuildFfmpegCommand:
+    """Test ffmpeg command construction"""
+
+    def test_full_file(self):
+        """Without a range the whole audio stream is decoded"""
+        cmd = build_ffmpeg_command("ffmpeg", "video.mp4", 16000, None, None, ["out.wav"])
+
+        assert "-ss" not in cmd
+        assert "-t" not in cmd
+        assert cmd[cmd.index("-ar") + 1] == "16000"
+        assert cmd[cmd.index("-ac") + 1] == "1"
+        assert cmd[-1] == "out.wav"
+
+    def test_range_uses_input_seeking(self):
+        """Start offset is placed before -i and the range becomes a duration"""
+        cmd = build_ffmpeg_command("ffmpeg", "video.mp4", 16000, 60.0, 90.0, ["out.wav"])
+
+        assert cmd.index("-ss") < cmd.index("-i")
+        assert cmd[cmd.index("-ss") + 1] == "60.0"
+        assert cmd[cmd.index("-t") + 1] == "30.0"
+
+
+class TestExtractAudioErrors:
+    """Test error mapping"""
+
+    def test_no_audio_track_raises_value_error(self, tmp_path):
+        """Missing audio stream keeps the ValueError contract"""
+        failed = Mock(returncode=1, stdout=b"", stderr=b"Stream map '0:a:0' matches no streams.")
+
+        with patch("services.media.audio_extractor.get_ffmpeg_binary", return_value="ffmpeg"):
+            with patch("subprocess.run", return_value=failed):
+                with pytest.raises(ValueError, match="No audio track"):
+                    extract_audio_from_video(tmp_path / "silent.mp4", tmp_path / "out.wav")
+
+    def test_ffmpeg_failure_raises_extraction_error(self, tmp_path):
+        """Other ffmpeg failures surface stderr"""
+        failed = Mock(returncode=1, stdout=b"", stderr=b"Invalid data found when processing input")
+
+        with patch("services.media.audio_extractor.get_ffmpeg_binary", return_value="ffmpeg"):
+            with patch("subprocess.run", return_value=failed):
+                with pytest.raises(AudioExtractionError, match="Invalid data found"):
+                    extract_audio_array(tmp_path / "broken.mp4")
+
+
+@requires_ffmpeg
+class TestExtractAudioWithFfmpeg:
+    """Test extraction against a real ffmpeg binary"""
+
+    def test_extract_to_wav(self, sine_video, tmp_path):
+        """Full extraction writes a 16 kHz mono WAV"""
+        output = tmp_path / "audio.wav"
+
+        result = extract_audio_from_video(sine_video, output)
+
+        assert result == str(output)
+        with wave.open(result) as wav:
+            assert wav.getframerate() == 16000
+            assert wav.getnchannels() == 1
+            assert wav.getnframes() == pytest.approx(10 * 16000, rel=0.02)
+
+    def test_extract_range_to_memory(self, sine_video):
+        """A time range yields exactly that many samples"""
+        audio = extract_audio_array(sine_video, start_time=2.0, end_time=5.0)
+
+        assert audio.dtype == np.float32
+        assert len(audio) == pytest.approx(3 * 16000, rel=0.02)
+        assert 0.0 < np.abs(audio).max() <= 1.0
@@ -22,7 +22,7 @@ class TestChunkTranscriptionServiceResourceCleanup:
     async def test_When_audio_extraction_succeeds_Then_audio_file_created(self):
         """Test successful audio extraction creates audio file"""
         # Arrange
-        service = ChunkTranscriptionService()
+        service = ChunkTranscriptionService(stream_to_memory=False)
         task_progress = {"task123": Mock(progress=0, current_step="", message="")}
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -55,7 +55,7 @@ class TestChunkTranscriptionServiceResourceCleanup:
     async def test_When_audio_extraction_fails_Then_partial_file_cleaned_up(self):
         """Test failed audio extraction cleans up partial files"""
         # Arrange
-        service = ChunkTranscriptionService()
+        service = ChunkTranscriptionService(stream_to_memory=False)
         task_progress = {"task123": Mock(progress=0, current_step="", message="")}
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -254,7 +254,7 @@ class TestChunkTranscriptionServiceTimeoutConfiguration:
     async def test_When_audio_extraction_Then_timeout_set_to_600_seconds(self):
         """Test audio extraction has 10-minute timeout"""
         # Arrange
-        service = ChunkTranscriptionService()
+        service = ChunkTranscriptionService(stream_to_memory=False)
         task_progress = {"task123": Mock(progress=0, current_step="", message="")}
 
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -395,7 +395,7 @@ class TestChunkTranscriptionServiceProgressTracking:
     async def test_When_extract_audio_chunk_Then_progress_updated(self):
         """Test progress is updated during audio extraction"""
         # Arrange
-        service = ChunkTranscriptionService()
+        service = ChunkTranscriptionService(stream_to_memory=False)
         task_progress = {"task123": Mock(progress=0, current_step="", message="")}
 
         with tempfile.TemporaryDirectory() as tmpdir:
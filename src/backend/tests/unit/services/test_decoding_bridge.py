@@ -0,0 +1,200 @@
+"""
+Test suite for the worker-thread decoding bridge used by transcription backends
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from services.transcriptionservice.decoding_bridge import (
+    run_in_decoding_thread,
+    stream_in_decoding_thread,
+    stream_inline,
+)
+
+
+class TestStreamInDecodingThread:
+    """Test streaming blocking generators through the decoding executor"""
+
+    @pytest.mark.asyncio
+    async def test_yields_items_in_order(self):
+        """Items arrive in production order"""
+
+        def produce():
+            yield from range(5)
+
+        items = [item async for item in stream_in_decoding_thread(produce)]
+
+        assert items == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_producer_runs_off_event_loop_thread(self):
+        """Producer must not execute on the event loop thread"""
+        loop_thread = threading.get_ident()
+
+        def produce():
+            yield threading.get_ident()
+
+        items = [item async for item in stream_in_decoding_thread(produce)]
+
+        assert items[0] != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive_while_decoding(self):
+        """Other coroutines keep running while the producer blocks"""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        def produce():
+            for i in range(3):
+                time.sleep(0.05)  # Simulates a blocking decode step
+                yield i
+
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            items = [item async for item in stream_in_decoding_thread(produce)]
+        finally:
+            ticker_task.cancel()
+
+        assert items == [0, 1, 2]
+        assert ticks >= 5
+
+    @pytest.mark.asyncio
+    async def test_producer_exception_is_reraised(self):
+        """Exceptions from the worker surface in the consumer"""
+
+        def produce():
+            yield 1
+            raise ValueError("decoder crashed")
+
+        received = []
+        with pytest.raises(ValueError, match="decoder crashed"):
+            async for item in stream_in_decoding_thread(produce):
+                received.append(item)
+
+        assert received == [1]
+
+    @pytest.mark.asyncio
+    async def test_early_exit_stops_producer(self):
+        """Breaking out of the loop stops the worker before it decodes everything"""
+        produced = []
+
+        def produce():
+            for i in range(100):
+                time.sleep(0.01)
+                produced.append(i)
+                yield i
+
+        stream = stream_in_decoding_thread(produce, max_buffered=1)
+        async for item in stream:
+            if item == 2:
+                break
+        await stream.aclose()
+        await asyncio.sleep(0.1)
+
+        assert len(produced) < 100
+
+
+class TestRunInDecodingThread:
+    """Test single blocking calls on the decoding executor"""
+
+    @pytest.mark.asyncio
+    async def test_returns_result(self):
+        """Return value and arguments are passed through"""
+        result = await run_in_decoding_thread(lambda a, b=0: a + b, 2, b=3)
+
+        assert result == 5
+
+
+class TestStreamInline:
+    """Test the inline (event loop thread) fallback"""
+
+    @pytest.mark.asyncio
+    async def test_yields_items_on_loop_thread(self):
+        """Inline mode iterates on the calling thread"""
+        loop_thread = threading.get_ident()
+
+        def produce():
+            yield threading.get_ident()
+
+        items = [item async for item in stream_inline(produce)]
+
+        assert items == [loop_thread]
+
+
+class TestFasterWhisperThreadedDecoding:
+    """Test FasterWhisperTranscriptionService decoding through the bridge"""
+
+    @staticmethod
+    def _service_with_fake_model(decode_in_thread: bool):
+        from types import SimpleNamespace
+
+        from services.transcriptionservice.faster_whisper_implementation import FasterWhisperTranscriptionService
+
+        decode_threads = set()
+
+        class FakeModel:
+            def __init__(self):
+                self.calls = []
+
+            def transcribe(self, audio_path, **kwargs):
+                self.calls.append(kwargs)
+
+                def segments():
+                    for i in range(3):
+                        decode_threads.add(threading.get_ident())
+                        yield SimpleNamespace(id=i, start=i * 2.0, end=i * 2.0 + 2.0, text=f" segment {i}")
+
+                info = SimpleNamespace(language="de", language_probability=0.99, duration=6.0)
+                return segments(), info
+
+        service = FasterWhisperTranscriptionService(model_size="tiny", decode_in_thread=decode_in_thread)
+        service._model = FakeModel()
+        return service, decode_threads
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("decode_in_thread", [True, False])
+    async def test_transcribe_with_progress_reports_progress(self, decode_in_thread):
+        """Segments and progress are identical in threaded and inline modes"""
+        service, decode_threads = self._service_with_fake_model(decode_in_thread)
+        progress = []
+
+        async def on_progress(fraction, message):
+            progress.append(fraction)
+
+        result = await service.transcribe_with_progress("audio.wav", language="de", progress_callback=on_progress)
+
+        assert [seg.text for seg in result.segments] == ["segment 0", "segment 1", "segment 2"]
+        assert result.language == "de"
+        assert progress[0] == 0.0
+        assert progress[-1] == 1.0
+        assert (threading.get_ident() in decode_threads) is not decode_in_thread
+
+    @pytest.mark.asyncio
+    async def test_batched_transcription_preserves_vad_options(self):
+        """Batched mode passes batch size and VAD options to the batched pipeline"""
+        service, _ = self._service_with_fake_model(decode_in_thread=True)
+        batched = service._model
+        service._batched_model = batched
+        progress = []
+
+        async def on_progress(fraction, message):
+            progress.append(fraction)
+
+        result = await service.transcribe_batched_with_progress(
+            "audio.wav", language="de", progress_callback=on_progress, batch_size=4
+        )
+
+        assert len(result.segments) == 3
+        assert result.metadata["batched"] is True
+        assert batched.calls[0]["batch_size"] == 4
+        assert batched.calls[0]["vad_filter"] is True
+        assert batched.calls[0]["vad_parameters"] == service.VAD_PARAMETERS
+        assert progress[-1] == 1.0
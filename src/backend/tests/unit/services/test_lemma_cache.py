@@ -0,0 +1,173 @@
+"""
+Test suite for the process-wide lemma cache
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+spacy = pytest.importorskip("spacy")
+
+from spacy.language import Language
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from database.models import Base, VocabularyWord
+from services import lemma_cache, nlp_model_service
+from services.lemma_cache import LemmaCache, TokenAnalysis, warm_lemma_cache
+from services.lemma_resolver import is_proper_name, lemmatize_word
+from services.lemmatization_service import LemmatizationService
+from services.nlp_model_service import NLPModelService
+
+LEXICON = {
+    "Häuser": ("haus", "NOUN"),
+    "ging": ("gehen", "VERB"),
+    "Anna": ("anna", "PROPN"),
+}
+
+
+@Language.component("test_lemma_cache_tagger")
+def _tagger(doc):
+    for token in doc:
+        token.lemma_, token.pos_ = LEXICON.get(token.text, (token.text.lower(), "X"))
+    return doc
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """Fresh process-wide cache for each test"""
+    fresh = LemmaCache(max_entries=100)
+    monkeypatch.setattr(lemma_cache, "_lemma_cache", fresh)
+    return fresh
+
+
+@pytest.fixture
+def nlp(cache, monkeypatch):
+    """Shared NLP model service backed by a blank pipeline with a rule-based tagger"""
+    pipeline = spacy.blank("de")
+    pipeline.add_pipe("test_lemma_cache_tagger")
+    pipeline.pipe = Mock(side_effect=pipeline.pipe)
+    service = NLPModelService()
+    monkeypatch.setattr(nlp_model_service, "_nlp_model_service", service)
+    with patch.object(service, "load_model", return_value=pipeline):
+        yield pipeline
+
+
+class TestLemmaCache:
+    """Test LRU bounds and statistics"""
+
+    def test_hits_and_misses_are_counted(self):
+        cache = LemmaCache()
+        analysis = TokenAnalysis(lemma="gehen", pos="VERB", is_entity=False)
+
+        assert cache.get("de", "ging") is None
+        cache.put("de", "ging", analysis)
+
+        assert cache.get("DE", "ging") == analysis
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == "50.0%"
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LemmaCache(max_entries=2)
+        for word in ("a", "b"):
+            cache.put("de", word, TokenAnalysis(lemma=word, pos="X", is_entity=False))
+        cache.get("de", "a")  # "a" becomes most recently used
+
+        cache.put("de", "c", TokenAnalysis(lemma="c", pos="X", is_entity=False))
+
+        assert cache.get("de", "b") is None
+        assert cache.get("de", "a") is not None
+        assert len(cache) == 2
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_languages_are_separate(self):
+        cache = LemmaCache()
+        cache.put("de", "die", TokenAnalysis(lemma="der", pos="DET", is_entity=False))
+
+        assert cache.get("en", "die") is None
+
+
+class TestSharedCache:
+    """Test that lemma_resolver and LemmatizationService share analyses"""
+
+    def test_lemma_and_proper_name_share_one_spacy_call(self, cache, nlp):
+        assert lemmatize_word("Anna", "de") == "anna"
+        assert is_proper_name("Anna", "de")
+        assert is_proper_name("Anna", "de")
+
+        nlp.pipe.assert_called_once()
+        assert cache.get_stats()["hits"] == 2
+
+    def test_lemmatization_service_reuses_resolver_results(self, cache, nlp):
+        lemmatize_word("Häuser", "de")
+
+        assert LemmatizationService().lemmatize("Häuser") == "Haus"
+        nlp.pipe.assert_called_once()
+
+    def test_fresh_service_instances_start_warm(self, cache, nlp):
+        assert LemmatizationService().lemmatize("ging") == "gehen"
+        assert LemmatizationService().lemmatize("ging") == "gehen"
+
+        nlp.pipe.assert_called_once()
+
+
+class TestWarmLemmaCache:
+    """Test preloading from the vocabulary table"""
+
+    @pytest.mark.asyncio
+    async def test_vocabulary_words_are_loaded(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with AsyncSession(engine) as session:
+            session.add_all(
+                [
+                    VocabularyWord(
+                        word="Haus", lemma="haus", language="de", difficulty_level="A1", part_of_speech="noun"
+                    ),
+                    VocabularyWord(word="gehen", lemma="gehen", language="de", difficulty_level="A1"),
+                    VocabularyWord(word="house", lemma="house", language="en", difficulty_level="A1"),
+                ]
+            )
+            await session.commit()
+
+            cache = LemmaCache()
+            loaded = await warm_lemma_cache(session, cache, language="de")
+        await engine.dispose()
+
+        assert loaded == 2
+        assert cache.get("de", "Haus") == TokenAnalysis(lemma="haus", pos="NOUN", is_entity=False)
+        assert cache.get("de", "haus").lemma == "haus"
+        assert cache.get("de", "gehen").pos == "X"
+        assert cache.get("en", "house") is None
+
+    @pytest.mark.asyncio
+    async def test_case_variants_do_not_evict_frequent_words(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        async with AsyncSession(engine) as session:
+            session.add_all(
+                [
+                    VocabularyWord(word="Haus", lemma="haus", language="de", difficulty_level="A1", frequency_rank=1),
+                    VocabularyWord(word="gehen", lemma="gehen", language="de", difficulty_level="A1", frequency_rank=2),
+                    VocabularyWord(word="Auto", lemma="auto", language="de", difficulty_level="A1", frequency_rank=3),
+                    VocabularyWord(word="Baum", lemma="baum", language="de", difficulty_level="A1", frequency_rank=4),
+                ]
+            )
+            await session.commit()
+
+            cache = LemmaCache(max_entries=4)
+            loaded = await warm_lemma_cache(session, cache, language="de")
+        await engine.dispose()
+
+        assert loaded == 2  # Haus/haus, gehen - Auto/auto would not fit
+        assert len(cache) == 3
+        assert cache.get_stats()["evictions"] == 0
+        assert cache.get("de", "Haus") is not None
+        assert cache.get("de", "haus") is not None
+        assert cache.get("de", "gehen") is not None
+        assert cache.get("de", "Auto") is None
@@ -0,0 +1,64 @@
+"""
+Test suite for the spaCy worker pool
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from services import nlp_executor
+from services.nlp_executor import MIN_TEXTS_PER_TASK, _split, analyze_texts_async
+
+
+def _fake_analyze(texts, language_code, n_process=None):
+    return [{"text": text} for text in texts]
+
+
+class TestSplit:
+    """Test splitting subtitle texts across workers"""
+
+    def test_slices_are_contiguous_and_balanced(self):
+        texts = [str(i) for i in range(MIN_TEXTS_PER_TASK * 3 + 1)]
+
+        slices = _split(texts, 3)
+
+        assert [text for part in slices for text in part] == texts
+        assert [len(part) for part in slices] == [MIN_TEXTS_PER_TASK + 1, MIN_TEXTS_PER_TASK, MIN_TEXTS_PER_TASK]
+
+    def test_small_inputs_use_fewer_workers(self):
+        assert len(_split(["a", "b", "c"], 4)) == 1
+
+
+class TestAnalyzeTextsAsync:
+    """Test running subtitle analysis off the event loop"""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_thread_without_worker_pool(self):
+        with (
+            patch.object(nlp_executor, "get_nlp_executor", return_value=None),
+            patch.object(nlp_executor, "analyze_texts", side_effect=_fake_analyze) as analyze,
+        ):
+            assert await analyze_texts_async(["Hallo"], "de") == [{"text": "Hallo"}]
+
+        analyze.assert_called_once_with(["Hallo"], "de")
+
+    @pytest.mark.asyncio
+    async def test_splits_across_workers_and_keeps_order(self, monkeypatch):
+        texts = [f"Zeile {i}" for i in range(MIN_TEXTS_PER_TASK * 2)]
+        monkeypatch.setattr(nlp_executor, "_executor_workers", 2)
+
+        with (
+            ThreadPoolExecutor(max_workers=2) as pool,
+            patch.object(nlp_executor, "get_nlp_executor", return_value=pool),
+            patch.object(nlp_executor, "analyze_texts", side_effect=_fake_analyze) as analyze,
+        ):
+            analyses = await analyze_texts_async(texts, "de")
+
+        assert [analysis["text"] for analysis in analyses] == texts
+        assert analyze.call_count == 2
+        assert all(call.kwargs == {"n_process": 1} for call in analyze.call_args_list)
+
+    def test_no_pool_when_disabled(self):
+        with patch("core.config.settings.spacy_worker_processes", 0):
+            assert nlp_executor.get_nlp_executor() is None
@@ -0,0 +1,126 @@
+"""
+Test suite for the shared NLP model service
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+spacy = pytest.importorskip("spacy")
+
+from spacy.language import Language
+
+from services.lemma_cache import LemmaCache, TokenAnalysis
+from services.lemmatization_service import LemmatizationService
+from services.nlp_model_service import NLPModelService
+
+LEXICON = {
+    "ging": ("gehen", "VERB"),
+    "Häuser": ("haus", "NOUN"),
+}
+
+
+@Language.component("test_nlp_service_tagger")
+def _tagger(doc):
+    for token in doc:
+        token.lemma_, token.pos_ = LEXICON.get(token.text, (token.text.lower(), "X"))
+    return doc
+
+
+@pytest.fixture
+def pipeline():
+    nlp = spacy.blank("de")
+    nlp.add_pipe("test_nlp_service_tagger")
+    nlp.pipe = Mock(side_effect=nlp.pipe)
+    return nlp
+
+
+class TestModelResolution:
+    """Test model name resolution and loading"""
+
+    def test_model_size_overrides_configured_models(self):
+        with patch("core.config.settings.spacy_model_de", "de_core_news_lg"):
+            assert NLPModelService().resolve_model_name("de") == "de_core_news_lg"
+            assert NLPModelService(model_size="sm").resolve_model_name("de") == "de_core_news_sm"
+
+    def test_unsupported_model_size_is_rejected(self):
+        with pytest.raises(ValueError):
+            NLPModelService(model_size="xl")
+
+    def test_model_is_loaded_once(self, pipeline):
+        service = NLPModelService()
+
+        with patch("spacy.load", return_value=pipeline) as load:
+            assert service.get_model("de") is service.get_model("de")
+
+        load.assert_called_once()
+        assert service.loaded_models() == [service.resolve_model_name("de")]
+
+    def test_missing_model_raises_runtime_error(self):
+        with patch("spacy.load", side_effect=OSError("not installed")):
+            with pytest.raises(RuntimeError):
+                NLPModelService().load_model("de_core_news_sm")
+
+
+class TestBatchLemmatization:
+    """Test batched, cached word analysis"""
+
+    def test_uncached_words_share_one_pipe_call(self, pipeline):
+        service = NLPModelService(lemma_cache=LemmaCache())
+
+        with patch.object(service, "load_model", return_value=pipeline):
+            assert service.lemmatize_batch(["ging", "Häuser", "ging"], "de") == ["gehen", "haus", "gehen"]
+            assert service.lemmatize_batch(["Häuser"], "de") == ["haus"]
+
+        pipeline.pipe.assert_called_once()
+        assert list(pipeline.pipe.call_args.args[0]) == ["ging", "Häuser"]
+
+    def test_cached_words_do_not_load_the_model(self):
+        cache = LemmaCache()
+        cache.put("de", "ging", TokenAnalysis(lemma="gehen", pos="VERB", is_entity=False))
+        service = NLPModelService(lemma_cache=cache)
+
+        with patch.object(service, "load_model", side_effect=RuntimeError) as load_model:
+            assert service.lemmatize_batch(["ging"], "de") == ["gehen"]
+
+        load_model.assert_not_called()
+
+
+class TestLemmatizationService:
+    """Test that LemmatizationService uses the shared service"""
+
+    def test_uses_shared_pipeline(self, pipeline):
+        service = NLPModelService(lemma_cache=LemmaCache())
+
+        with patch.object(service, "load_model", return_value=pipeline):
+            assert LemmatizationService(service).lemmatize_batch(["Häuser", "ging"]) == ["Haus", "gehen"]
+
+    def test_falls_back_to_simple_rules_without_model(self):
+        service = NLPModelService(lemma_cache=LemmaCache())
+        lemmatizer = LemmatizationService(service)
+
+        with patch.object(service, "load_model", side_effect=RuntimeError("not installed")) as load_model:
+            assert lemmatizer.lemmatize("gemacht") == "machen"
+            assert lemmatizer.lemmatize("guter") == "gut"
+
+        load_model.assert_called_once()
+
+
+class TestPipelineProfile:
+    """Test that pipeline profiles trim the loaded components"""
+
+    def test_vocabulary_profile_excludes_parser(self, pipeline):
+        with patch("spacy.load", return_value=pipeline) as load:
+            NLPModelService().load_model("de_core_news_sm")
+
+        assert "parser" in load.call_args.kwargs["exclude"]
+
+    def test_full_profile_loads_every_component(self, pipeline):
+        with patch("spacy.load", return_value=pipeline) as load:
+            NLPModelService(pipeline_profile="full").load_model("de_core_news_sm")
+
+        assert load.call_args.kwargs["exclude"] == []
+
+    def test_unknown_profile_is_rejected(self):
+        with pytest.raises(ValueError):
+            NLPModelService(pipeline_profile="tiny")
@@ -0,0 +1,116 @@
+"""
+Test suite for sentence-level spaCy analysis of subtitles
+
+Uses a blank spaCy pipeline with a small rule-based tagger, so no trained
+model needs to be installed.
+"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+spacy = pytest.importorskip("spacy")
+
+from spacy.language import Language
+from spacy.tokens import Span
+
+from services.filterservice.interface import FilteredSubtitle, WordStatus
+from services.filterservice.subtitle_processing.srt_file_handler import SRTFileHandler
+from services.filterservice.subtitle_processing.subtitle_processor import SubtitleProcessor
+from services.lemma_resolver import TokenAnalysis, analyze_texts
+
+SUBTITLE_PROCESSOR = "services.filterservice.subtitle_processing.subtitle_processor"
+WORD_FILTER = "services.filterservice.subtitle_processing.word_filter"
+
+LEXICON = {
+    "Anna": ("anna", "PROPN"),
+    "ging": ("gehen", "VERB"),
+    "Berlin": ("berlin", "PROPN"),
+    "Häuser": ("haus", "NOUN"),
+    "Bank": ("bank", "NOUN"),
+}
+
+
+@Language.component("test_subtitle_tagger")
+def _tagger(doc):
+    for token in doc:
+        token.lemma_, token.pos_ = LEXICON.get(token.text, (token.text.lower(), "X"))
+    doc.ents = [Span(doc, token.i, token.i + 1, label="PER") for token in doc if token.text == "Bank"]
+    return doc
+
+
+@pytest.fixture
+def nlp():
+    pipeline = spacy.blank("de")
+    pipeline.add_pipe("test_subtitle_tagger")
+    pipeline.pipe = Mock(side_effect=pipeline.pipe)
+    with patch("services.lemma_resolver._load_model", return_value=pipeline):
+        yield pipeline
+
+
+class TestAnalyzeTexts:
+    """Test the single nlp.pipe pass over subtitle texts"""
+
+    def test_one_pipe_call_for_all_texts(self, nlp):
+        analyses = analyze_texts(["Anna ging nach Berlin.", "Häuser!"], "de", n_process=1)
+
+        nlp.pipe.assert_called_once()
+        assert analyses[0]["ging"] == TokenAnalysis(lemma="gehen", pos="VERB", is_entity=False)
+        assert analyses[0]["anna"].is_proper_name
+        assert analyses[1]["häuser"].lemma == "haus"
+
+    def test_entity_membership_comes_from_context(self, nlp):
+        analyses = analyze_texts(["Die Bank"], "de", n_process=1)
+
+        assert analyses[0]["bank"].is_entity
+        assert analyses[0]["bank"].is_proper_name
+
+    def test_empty_input(self, nlp):
+        assert analyze_texts([], "de") == []
+
+
+class TestSubtitleProcessorAnalysis:
+    """Test that subtitle processing uses the per-file analysis"""
+
+    @pytest.mark.asyncio
+    async def test_words_use_pipe_analysis_instead_of_per_word_calls(self, nlp):
+        handler = SRTFileHandler()
+        text = "Anna ging nach Berlin"
+        subtitle = FilteredSubtitle(text, 0.0, 2.0, handler.extract_words_from_text(text, 0.0, 2.0))
+        validator = Mock()
+        validator.is_valid_vocabulary_word.return_value = True
+        vocab_service = Mock()
+        vocab_service.get_word_info = AsyncMock(return_value={"difficulty_level": "C1"})
+        processor = SubtitleProcessor(validator=validator)
+
+        with (
+            patch(f"{WORD_FILTER}.is_proper_name") as per_word_proper,
+            patch(f"{WORD_FILTER}.lemmatize_word") as per_word_lemma,
+        ):
+            await processor.process_subtitles([subtitle], set(), "A2", "de", vocab_service, db=Mock())
+
+        per_word_proper.assert_not_called()
+        per_word_lemma.assert_not_called()
+        words = {word.text: word for word in subtitle.words}
+        assert words["anna"].status == WordStatus.FILTERED_OTHER
+        assert words["berlin"].status == WordStatus.FILTERED_OTHER
+        assert words["ging"].status == WordStatus.ACTIVE
+        assert words["ging"].metadata["lemma"] == "gehen"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_per_word_analysis_when_pipe_fails(self):
+        subtitle = FilteredSubtitle("ging", 0.0, 1.0, SRTFileHandler().extract_words_from_text("ging", 0.0, 1.0))
+        validator = Mock()
+        validator.is_valid_vocabulary_word.return_value = True
+        vocab_service = Mock()
+        vocab_service.get_word_info = AsyncMock(return_value=None)
+        processor = SubtitleProcessor(validator=validator)
+
+        with (
+            patch(f"{SUBTITLE_PROCESSOR}.analyze_texts_async", side_effect=RuntimeError),
+            patch(f"{WORD_FILTER}.is_proper_name", return_value=False),
+            patch(f"{WORD_FILTER}.lemmatize_word", return_value="gehen"),
+        ):
+            await processor.process_subtitles([subtitle], set(), "A2", "de", vocab_service, db=Mock())
+
+        assert subtitle.words[0].metadata["lemma"] == "gehen"
@@ -0,0 +1,156 @@
+"""
+Test suite for embedded subtitle extraction
+"""
+
+import shutil
+import subprocess
+from unittest.mock import Mock, patch
+
+import pytest
+
+from services.media.subtitle_extractor import (
+    SubtitleExtractionError,
+    SubtitleStream,
+    extract_embedded_subtitles,
+    extract_subtitle_stream,
+    probe_subtitle_streams,
+    select_subtitle_stream,
+)
+from utils.srt_parser import SRTParser
+
+requires_ffmpeg = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not available")
+
+SUBTITLES = "1\n00:00:01,000 --> 00:00:02,500\nHallo Welt.\n\n2\n00:00:03,000 --> 00:00:04,000\nBis morgen.\n"
+
+
+@pytest.fixture
+def subtitled_video(tmp_path):
+    """5-second MKV with a forced English and a German subtitle stream"""
+    srt = tmp_path / "source.srt"
+    srt.write_text(SUBTITLES, encoding="utf-8")
+    video = tmp_path / "clip.mkv"
+    cmd = [
+        "ffmpeg",
+        "-f",
+        "lavfi",
+        "-i",
+        "sine=frequency=440:duration=5",
+        "-i",
+        str(srt),
+        "-i",
+        str(srt),
+        "-map",
+        "0",
+        "-map",
+        "1",
+        "-map",
+        "2",
+        "-metadata:s:s:0",
+        "language=eng",
+        "-disposition:s:0",
+        "forced",
+        "-metadata:s:s:1",
+        "language=ger",
+        "-y",
+        str(video),
+    ]
+    subprocess.run(cmd, check=True, capture_output=True)
+    return video
+
+
+class TestSelectSubtitleStream:
+    """Test choosing the stream for the spoken language"""
+
+    def test_language_tag_match(self):
+        """ISO 639-2 container tags are matched against ISO 639-1 codes"""
+        streams = (
+            SubtitleStream(index=2, codec="subrip", language="eng"),
+            SubtitleStream(index=3, codec="subrip", language="ger"),
+        )
+
+        assert select_subtitle_stream(streams, "de").index == 3
+
+    def test_bitmap_and_forced_streams_skipped(self):
+        """PGS needs OCR and forced tracks only cover foreign dialogue"""
+        streams = (
+            SubtitleStream(index=2, codec="hdmv_pgs_subtitle", language="ger"),
+            SubtitleStream(index=3, codec="subrip", language="ger", forced=True),
+        )
+
+        assert select_subtitle_stream(streams, "de") is None
+
+    def test_untagged_stream_used_as_fallback(self):
+        """Untagged text streams are used when no stream carries the language"""
+        streams = (SubtitleStream(index=1, codec="mov_text", language="und"),)
+
+        assert select_subtitle_stream(streams, "de").index == 1
+
+    def test_other_language_never_used(self):
+        """English subtitles are no substitute for a German transcript"""
+        streams = (SubtitleStream(index=1, codec="subrip", language="eng"),)
+
+        assert select_subtitle_stream(streams, "de") is None
+
+
+class TestExtractSubtitleErrors:
+    """Test error mapping"""
+
+    def test_ffmpeg_failure_raises_extraction_error(self, tmp_path):
+        """A failing ffmpeg run leaves no partial file behind"""
+        failed = Mock(returncode=1, stderr=b"Invalid data found when processing input")
+        output = tmp_path / "out.srt"
+
+        with (
+            patch("services.media.subtitle_extractor.get_ffmpeg_binary", return_value="ffmpeg"),
+            patch("services.media.subtitle_extractor.subprocess.run", return_value=failed),
+        ):
+            with pytest.raises(SubtitleExtractionError, match="Invalid data"):
+                extract_subtitle_stream(tmp_path / "clip.mkv", 2, output)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_ffmpeg_timeout_raises_extraction_error(self, tmp_path):
+        """A hanging ffmpeg run is aborted and leaves no partial file behind"""
+        output = tmp_path / "out.srt"
+
+        with (
+            patch("services.media.subtitle_extractor.get_ffmpeg_binary", return_value="ffmpeg"),
+            patch(
+                "services.media.subtitle_extractor.subprocess.run",
+                side_effect=subprocess.TimeoutExpired(cmd="ffmpeg", timeout=600),
+            ),
+        ):
+            with pytest.raises(SubtitleExtractionError, match="timed out"):
+                extract_subtitle_stream(tmp_path / "clip.mkv", 2, output)
+
+        assert list(tmp_path.iterdir()) == []
+
+
+@requires_ffmpeg
+class TestExtractEmbeddedSubtitlesWithFfmpeg:
+    """Integration tests against a real ffmpeg binary"""
+
+    def test_probe_lists_subtitle_streams(self, subtitled_video):
+        """Stream index, language and forced flag are parsed"""
+        streams = probe_subtitle_streams(subtitled_video)
+
+        assert [(s.index, s.language, s.forced) for s in streams] == [(1, "eng", True), (2, "ger", False)]
+        assert all(s.is_text for s in streams)
+
+    def test_extracts_language_stream_once(self, subtitled_video, tmp_path):
+        """The German stream is converted to SRT and reused afterwards"""
+        output = tmp_path / "clip.embedded.de.srt"
+
+        result = extract_embedded_subtitles(subtitled_video, "de", output)
+
+        segments = SRTParser.parse_file(str(result))
+        assert [segment.text for segment in segments] == ["Hallo Welt.", "Bis morgen."]
+        assert segments[0].start_time == pytest.approx(1.0, abs=0.05)
+
+        with patch("services.media.subtitle_extractor.extract_subtitle_stream") as extract:
+            assert extract_embedded_subtitles(subtitled_video, "de", output) == output
+        extract.assert_not_called()
+
+    def test_no_stream_for_language(self, subtitled_video, tmp_path):
+        """Videos without subtitles in the spoken language fall back to ASR"""
+        assert extract_embedded_subtitles(subtitled_video, "es", tmp_path / "clip.embedded.es.srt") is None
@@ -0,0 +1,148 @@
+"""
+Test suite for the content-addressed transcription result cache
+"""
+
+import os
+
+import pytest
+
+from services.transcriptionservice.interface import TranscriptionResult, TranscriptionSegment
+from services.transcriptionservice.result_cache import TranscriptionResultCache, model_fingerprint
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    video = tmp_path / "episode.mp4"
+    video.write_bytes(b"\x00" * 1024)
+    return video
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TranscriptionResultCache(tmp_path / "cache", max_bytes=10 * 1024 * 1024)
+
+
+def _result(text: str = "Guten Morgen.") -> TranscriptionResult:
+    return TranscriptionResult(
+        full_text=text,
+        segments=[
+            TranscriptionSegment(start_time=0.0, end_time=1.25, text=text, confidence=0.9),
+            TranscriptionSegment(start_time=1.25, end_time=3.0, text="Wie geht's?"),
+        ],
+        language="de",
+        duration=3.0,
+    )
+
+
+class TestCacheKey:
+    """Test cache key derivation"""
+
+    def test_key_is_stable(self, cache, video_file):
+        """Same inputs produce the same key"""
+        first = cache.make_key(video_file, 0.0, 300.0, "tiny", "de", {"batch_size": 0})
+        second = cache.make_key(video_file, 0.0, 300.0, "tiny", "de", {"batch_size": 0})
+
+        assert first == second
+
+    @pytest.mark.parametrize(
+        "changed",
+        [
+            {"start_time": 300.0, "end_time": 600.0},
+            {"model": "large-v3"},
+            {"language": "en"},
+            {"options": {"batch_size": 16}},
+        ],
+    )
+    def test_key_changes_with_inputs(self, cache, video_file, changed):
+        """Any input that affects the transcription changes the key"""
+        base = {"start_time": 0.0, "end_time": 300.0, "model": "tiny", "language": "de", "options": {"batch_size": 0}}
+
+        assert cache.make_key(video_file, **base) != cache.make_key(video_file, **{**base, **changed})
+
+    def test_key_changes_when_video_replaced(self, cache, video_file):
+        """Replacing the video file invalidates its entries"""
+        before = cache.make_key(video_file, 0.0, 300.0, "tiny", "de")
+        stat = video_file.stat()
+        os.utime(video_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert cache.make_key(video_file, 0.0, 300.0, "tiny", "de") != before
+
+    def test_model_fingerprint_ignores_runtime_state(self):
+        """Loading the model or moving it to another device keeps the fingerprint"""
+
+        class Service:
+            def __init__(self, loaded, device):
+                self.model_info = {
+                    "name": "faster-whisper-tiny",
+                    "compute_type": "int8",
+                    "loaded": loaded,
+                    "device": device,
+                }
+
+        assert model_fingerprint(Service(False, "cpu")) == model_fingerprint(Service(True, "cuda"))
+
+
+class TestGetPut:
+    """Test storing and loading results"""
+
+    def test_roundtrip(self, cache, video_file):
+        """Stored segments come back with timings, text and language"""
+        key = cache.make_key(video_file, 0.0, 300.0, "tiny", "de")
+
+        cache.put(key, _result())
+        loaded = cache.get(key)
+
+        assert [(s.start_time, s.end_time, s.text) for s in loaded.segments] == [
+            (0.0, 1.25, "Guten Morgen."),
+            (1.25, 3.0, "Wie geht's?"),
+        ]
+        assert loaded.full_text == "Guten Morgen. Wie geht's?"
+        assert loaded.language == "de"
+        assert loaded.metadata == {"cached": True}
+
+    def test_hit_miss_metrics(self, cache, video_file):
+        """Misses and hits are counted"""
+        key = cache.make_key(video_file, 0.0, 300.0, "tiny", "de")
+
+        assert cache.get(key) is None
+        cache.put(key, _result())
+        cache.get(key)
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["stores"] == 1
+        assert stats["hit_ratio"] == "50.0%"
+
+    def test_corrupt_entry_is_discarded(self, cache, video_file):
+        """Unreadable entries count as misses and are removed"""
+        key = cache.make_key(video_file, 0.0, 300.0, "tiny", "de")
+        cache.cache_dir.mkdir(parents=True)
+        cache.entry_path(key).write_bytes(b"not gzip")
+
+        assert cache.get(key) is None
+        assert not cache.entry_path(key).exists()
+        assert cache.get_stats()["errors"] == 1
+
+
+class TestEviction:
+    """Test LRU eviction under the disk quota"""
+
+    def test_least_recently_used_entry_evicted(self, tmp_path, video_file):
+        """Once over quota the oldest untouched entry goes first"""
+        cache = TranscriptionResultCache(tmp_path / "cache", max_bytes=10 * 1024 * 1024)
+        keys = [cache.make_key(video_file, i * 300.0, (i + 1) * 300.0, "tiny", "de") for i in range(3)]
+        for age, key in enumerate(keys):
+            cache.put(key, _result(f"Chunk {age}"))
+            os.utime(cache.entry_path(key), (1_000_000 + age, 1_000_000 + age))
+
+        # Reading the oldest entry makes it the most recently used
+        cache.get(keys[0])
+        entry_size = cache.entry_path(keys[0]).stat().st_size
+        cache.max_bytes = entry_size * 2 + entry_size // 2
+        cache.enforce_quota()
+
+        assert cache.entry_path(keys[0]).exists()
+        assert not cache.entry_path(keys[1]).exists()
+        assert cache.entry_path(keys[2]).exists()
+        assert cache.get_stats()["evictions"] == 1
@@ -0,0 +1,155 @@
+"""
+Test suite for length-bucketed translation batching
+"""
+
+from types import SimpleNamespace
+
+from services.translationservice.batching import adaptive_decoding_length, length_buckets
+from services.translationservice.opus_ct2_implementation import OpusCT2TranslationService
+
+
+class TestLengthBuckets:
+    """Test grouping inputs by length"""
+
+    def test_groups_similar_lengths(self):
+        assert length_buckets([30, 2, 3, 28, 1], bucket_size=2) == [[4, 1], [2, 3], [0]]
+
+    def test_covers_every_position_once(self):
+        buckets = length_buckets([5, 1, 5, 1, 3, 3, 3], bucket_size=3)
+
+        assert sorted(position for bucket in buckets for position in bucket) == list(range(7))
+        assert all(len(bucket) <= 3 for bucket in buckets)
+
+    def test_empty_input(self):
+        assert length_buckets([], bucket_size=8) == []
+
+
+class TestAdaptiveDecodingLength:
+    """Test the decoding limit derived from input length"""
+
+    def test_scales_with_longest_input(self):
+        assert adaptive_decoding_length([4, 10], limit=256) == 30
+
+    def test_capped_by_limit(self):
+        assert adaptive_decoding_length([200], limit=256) == 256
+
+
+class _FakeTokenizer:
+    """Whitespace tokenizer standing in for a Hugging Face tokenizer (ids are the tokens)"""
+
+    eos_token = "</s>"
+    all_special_tokens = ["</s>", "<unk>", "<pad>"]
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, texts, add_special_tokens=True):
+        self.calls += 1
+        return {"input_ids": [[*text.split(), "</s>"] for text in texts]}
+
+    def convert_ids_to_tokens(self, ids):
+        return ids
+
+    def convert_tokens_to_ids(self, tokens):
+        return tokens
+
+    def batch_decode(self, sequences, skip_special_tokens=True):
+        self.calls += 1
+        return [" ".join(token for token in ids if token not in self.all_special_tokens) for ids in sequences]
+
+
+class _FakeSentencePiece:
+    """SentencePiece processor with batched encode/decode"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, texts, out_type=str):
+        self.calls += 1
+        return [["\u2581" + word for word in text.split()] for text in texts]
+
+    def decode(self, batch):
+        self.calls += 1
+        return ["".join(pieces).replace("\u2581", " ").strip() for pieces in batch]
+
+
+class _FakeMarianTokenizer(_FakeTokenizer):
+    """Tokenizer exposing SentencePiece models like MarianTokenizer"""
+
+    def __init__(self):
+        super().__init__()
+        self.spm_source = _FakeSentencePiece()
+        self.spm_target = _FakeSentencePiece()
+
+    def __call__(self, texts, add_special_tokens=True):
+        self.calls += 1
+        return {"input_ids": [[*pieces, "</s>"] for pieces in self.spm_source.encode(texts)]}
+
+
+class _FakeTranslator:
+    """Records CTranslate2 calls and echoes upper-cased tokens"""
+
+    def __init__(self):
+        self.calls = []
+
+    def translate_batch(self, batch, **kwargs):
+        self.calls.append((batch, kwargs))
+        return [SimpleNamespace(hypotheses=[[token.upper() for token in tokens[:-1]] + ["</s>"]]) for tokens in batch]
+
+
+class TestOpusCT2LengthBucketing:
+    """Test bucketing in OpusCT2TranslationService.translate_batch"""
+
+    def _service(self):
+        service = OpusCT2TranslationService()
+        service._tokenizer = _FakeTokenizer()
+        service._translator = _FakeTranslator()
+        return service
+
+    def test_results_keep_input_order(self):
+        service = self._service()
+        texts = ["ein sehr langer satz mit vielen vielen worten", "ja", "was ist los"]
+
+        results = service.translate_batch(texts, "de", "en", max_batch_size=2)
+
+        assert [result.original_text for result in results] == texts
+        assert [result.translated_text for result in results] == [text.upper() for text in texts]
+
+    def test_short_inputs_batched_apart_from_long_ones(self):
+        service = self._service()
+        texts = ["ein sehr langer satz mit vielen vielen worten", "ja", "was ist los"]
+
+        service.translate_batch(texts, "de", "en", max_batch_size=2)
+
+        calls = service._translator.calls
+        assert [len(batch) for batch, _ in calls] == [2, 1]
+        assert calls[0][0] == [["ja", "</s>"], ["was", "ist", "los", "</s>"]]
+        assert calls[0][1]["max_decoding_length"] == adaptive_decoding_length([2, 4], limit=256)
+        assert calls[1][1]["max_decoding_length"] == adaptive_decoding_length([9], limit=256)
+
+
+class TestOpusCT2BatchedTokenization:
+    """Test batched encode/decode in OpusCT2TranslationService"""
+
+    def test_tokenizer_called_once_per_direction(self):
+        service = OpusCT2TranslationService()
+        service._tokenizer = _FakeTokenizer()
+        service._translator = _FakeTranslator()
+
+        results = service.translate_batch(["hallo welt", "ja", "was ist los"], "de", "en")
+
+        assert [result.translated_text for result in results] == ["HALLO WELT", "JA", "WAS IST LOS"]
+        assert service._tokenizer.calls == 2
+
+    def test_marian_encodes_through_tokenizer(self):
+        """Encoding keeps Marian's preprocessing; decoding uses the target SentencePiece model"""
+        service = OpusCT2TranslationService()
+        service._tokenizer = _FakeMarianTokenizer()
+        service._translator = _FakeTranslator()
+
+        results = service.translate_batch(["hallo welt", "ja"], "de", "en")
+
+        assert service._translator.calls[0][0] == [["\u2581ja", "</s>"], ["\u2581hallo", "\u2581welt", "</s>"]]
+        assert [result.translated_text for result in results] == ["HALLO WELT", "JA"]
+        assert service._tokenizer.calls == 1
+        assert service._tokenizer.spm_target.calls == 1
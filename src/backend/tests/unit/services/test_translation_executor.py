@@ -0,0 +1,103 @@
+"""
+Test suite for the worker-thread executor used by translation services
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from services.translationservice.executor import run_in_translation_thread
+from services.translationservice.interface import ITranslationService, TranslationResult
+
+
+class _BlockingTranslator(ITranslationService):
+    """Minimal translation service whose translate_batch blocks like a real model"""
+
+    def __init__(self):
+        self.threads = []
+
+    def initialize(self) -> None:
+        pass
+
+    def cleanup(self) -> None:
+        pass
+
+    @property
+    def service_name(self) -> str:
+        return "blocking"
+
+    @property
+    def is_initialized(self) -> bool:
+        return True
+
+    def translate(self, text: str, source_lang: str, target_lang: str) -> TranslationResult:
+        return self.translate_batch([text], source_lang, target_lang)[0]
+
+    def translate_batch(self, texts: list[str], source_lang: str, target_lang: str) -> list[TranslationResult]:
+        self.threads.append(threading.get_ident())
+        time.sleep(0.05)  # Simulates a blocking model call
+        return [TranslationResult(text, text.upper(), source_lang, target_lang) for text in texts]
+
+    def get_supported_languages(self) -> dict[str, str]:
+        return {"de": "German", "en": "English"}
+
+    def is_language_supported(self, lang_code: str) -> bool:
+        return lang_code in self.get_supported_languages()
+
+
+class TestRunInTranslationThread:
+    """Test running blocking calls on the translation executor"""
+
+    @pytest.mark.asyncio
+    async def test_returns_result_and_forwards_arguments(self):
+        """Positional and keyword arguments reach the callable"""
+
+        def combine(a, b, *, c):
+            return a + b + c
+
+        assert await run_in_translation_thread(combine, 1, 2, c=3) == 6
+
+    @pytest.mark.asyncio
+    async def test_exceptions_propagate(self):
+        """Errors raised on the worker thread surface in the caller"""
+
+        def fail():
+            raise RuntimeError("model crashed")
+
+        with pytest.raises(RuntimeError, match="model crashed"):
+            await run_in_translation_thread(fail)
+
+
+class TestTranslateBatchAsync:
+    """Test the async batch API of ITranslationService"""
+
+    @pytest.mark.asyncio
+    async def test_runs_off_event_loop_thread(self):
+        """translate_batch executes on a worker thread"""
+        translator = _BlockingTranslator()
+
+        results = await translator.translate_batch_async(["hallo", "welt"], "de", "en")
+
+        assert [result.translated_text for result in results] == ["HALLO", "WELT"]
+        assert translator.threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive_while_translating(self):
+        """Other coroutines keep running while a batch translates"""
+        translator = _BlockingTranslator()
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker_task = asyncio.create_task(ticker())
+        await translator.translate_batch_async(["hallo"], "de", "en")
+        await translator.translate_batch_async(["welt"], "de", "en")
+        ticker_task.cancel()
+
+        assert ticks >= 5
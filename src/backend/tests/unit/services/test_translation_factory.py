@@ -174,3 +174,26 @@ class TestTranslationFactoryServiceRegistry:
             service = TranslationServiceFactory.create_service(service_name)
             assert service is not None
             assert isinstance(service, ITranslationService)
+
+
+class _StubTranslationService:
+    """Stands in for a service class; loads nothing"""
+
+    def __init__(self, model_name: str = "stub"):
+        self.model_name = model_name
+
+
+class TestUncachedServices:
+    """Test instances created for owners that manage their lifecycle"""
+
+    def test_uncached_instances_are_not_shared(self, monkeypatch):
+        monkeypatch.setitem(TranslationServiceFactory._services, "stub", _StubTranslationService)
+        monkeypatch.setattr(TranslationServiceFactory, "_instances", {})
+
+        owned = TranslationServiceFactory.create_uncached_service("stub", model_name="de-en", source_lang="de")
+        cached = TranslationServiceFactory.create_service("stub", model_name="de-en")
+
+        assert owned.model_name == "de-en"
+        assert owned is not cached
+        assert owned is not TranslationServiceFactory.create_uncached_service("stub", model_name="de-en")
+        assert list(TranslationServiceFactory._instances.values()) == [cached]
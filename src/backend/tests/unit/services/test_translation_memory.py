@@ -0,0 +1,95 @@
+"""
+Test suite for the persistent translation memory
+"""
+
+from services.translationservice.translation_memory import TranslationMemory, normalize_segment_text
+
+MODEL = "Helsinki-NLP/opus-mt-de-en"
+
+
+class TestNormalizeSegmentText:
+    """Test normalization of memory keys"""
+
+    def test_collapses_whitespace_and_line_breaks(self):
+        assert normalize_segment_text("  Komm\nschon!  ") == "Komm schon!"
+
+    def test_applies_nfc(self):
+        assert normalize_segment_text("Müde") == "Müde"
+
+    def test_keeps_case_and_punctuation(self):
+        assert normalize_segment_text("Ja?") != normalize_segment_text("ja.")
+
+
+class TestTranslationMemory:
+    """Test lookups, persistence and statistics"""
+
+    def test_unknown_texts_are_misses(self, tmp_path):
+        memory = TranslationMemory(tmp_path / "tm.sqlite3")
+
+        assert memory.get_many(MODEL, "de", "en", ["Hallo"]) == {}
+        assert memory.get_stats()["misses"] == 1
+
+    def test_stored_translation_is_served_from_lru(self, tmp_path):
+        memory = TranslationMemory(tmp_path / "tm.sqlite3")
+        memory.put_many(MODEL, "de", "en", {"Hallo  Welt": "Hello world"})
+
+        found = memory.get_many(MODEL, "de", "en", ["Hallo Welt", "Tschüss"])
+
+        assert found == {"Hallo Welt": "Hello world"}
+        stats = memory.get_stats()
+        assert stats["lru_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == "50.0%"
+
+    def test_entries_persist_across_instances(self, tmp_path):
+        first = TranslationMemory(tmp_path / "tm.sqlite3")
+        first.put_many(MODEL, "de", "en", {"Ja.": "Yes."})
+        first.close()
+
+        second = TranslationMemory(tmp_path / "tm.sqlite3")
+
+        assert second.get_many(MODEL, "de", "en", ["Ja."]) == {"Ja.": "Yes."}
+        assert second.get_stats()["db_hits"] == 1
+        # The database hit is now cached in the LRU
+        second.get_many(MODEL, "de", "en", ["Ja."])
+        assert second.get_stats()["lru_hits"] == 1
+
+    def test_keys_include_model_and_languages(self, tmp_path):
+        memory = TranslationMemory(tmp_path / "tm.sqlite3")
+        memory.put_many(MODEL, "de", "en", {"Ja.": "Yes."})
+
+        assert memory.get_many("other-model", "de", "en", ["Ja."]) == {}
+        assert memory.get_many(MODEL, "de", "es", ["Ja."]) == {}
+
+    def test_lru_is_bounded(self, tmp_path):
+        memory = TranslationMemory(tmp_path / "tm.sqlite3", lru_size=2)
+        memory.put_many(MODEL, "de", "en", {"a": "A", "b": "B", "c": "C"})
+
+        assert memory.get_stats()["lru_entries"] == 2
+        # Evicted entries are still found in the database
+        assert memory.get_many(MODEL, "de", "en", ["a"]) == {"a": "A"}
+
+    def test_large_lookups_are_chunked(self, tmp_path):
+        memory = TranslationMemory(tmp_path / "tm.sqlite3", lru_size=0)
+        texts = [f"Satz {i}" for i in range(1200)]
+        memory.put_many(MODEL, "de", "en", {text: text.upper() for text in texts})
+
+        assert len(memory.get_many(MODEL, "de", "en", texts)) == 1200
+
+    def test_database_errors_degrade_to_empty_memory(self, tmp_path):
+        blocker = tmp_path / "not_a_directory"
+        blocker.write_text("")
+        memory = TranslationMemory(blocker / "tm.sqlite3", lru_size=0)
+
+        memory.put_many(MODEL, "de", "en", {"Ja.": "Yes."})
+
+        assert memory.get_many(MODEL, "de", "en", ["Ja."]) == {}
+        assert memory.get_stats()["errors"] == 2
+
+    def test_reset_stats(self, tmp_path):
+        memory = TranslationMemory(tmp_path / "tm.sqlite3")
+        memory.get_many(MODEL, "de", "en", ["Hallo"])
+
+        memory.reset_stats()
+
+        assert memory.get_stats()["total"] == 0
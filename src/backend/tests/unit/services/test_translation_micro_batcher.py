@@ -0,0 +1,81 @@
+"""
+Test suite for cross-request translation micro-batching
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from services.translationservice.interface import TranslationResult
+from services.translationservice.micro_batcher import TranslationMicroBatcher
+
+
+def _mock_service():
+    """Translation service echoing upper-cased texts"""
+    service = Mock()
+    service.translate_batch_async = AsyncMock(
+        side_effect=lambda texts, src, tgt: [TranslationResult(t, t.upper(), src, tgt) for t in texts]
+    )
+    return service
+
+
+class TestTranslationMicroBatcher:
+    """Test coalescing concurrent translation requests"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_model_call(self):
+        """Requests arriving within the wait window are translated together"""
+        service = _mock_service()
+        batcher = TranslationMicroBatcher(service, max_batch_size=64, max_wait_ms=20)
+
+        first, second = await asyncio.gather(
+            batcher.translate_batch(["hallo", "welt"], "de", "en"),
+            batcher.translate_batch(["tschüss"], "de", "en"),
+        )
+
+        service.translate_batch_async.assert_awaited_once_with(["hallo", "welt", "tschüss"], "de", "en")
+        assert [result.translated_text for result in first] == ["HALLO", "WELT"]
+        assert [result.translated_text for result in second] == ["TSCHÜSS"]
+        assert batcher.get_stats()["requests_per_batch"] == 2.0
+
+    @pytest.mark.asyncio
+    async def test_language_pairs_are_not_mixed(self):
+        """Each language pair gets its own model call"""
+        service = _mock_service()
+        batcher = TranslationMicroBatcher(service, max_wait_ms=20)
+
+        await asyncio.gather(
+            batcher.translate_batch(["hallo"], "de", "en"),
+            batcher.translate_batch(["hola"], "es", "en"),
+        )
+
+        assert service.translate_batch_async.await_count == 2
+        pairs = {call.args[1:] for call in service.translate_batch_async.await_args_list}
+        assert pairs == {("de", "en"), ("es", "en")}
+
+    @pytest.mark.asyncio
+    async def test_full_batch_dispatched_without_waiting(self):
+        """Reaching max_batch_size skips the wait window"""
+        service = _mock_service()
+        batcher = TranslationMicroBatcher(service, max_batch_size=2, max_wait_ms=10_000)
+
+        results = await asyncio.wait_for(batcher.translate_batch(["a", "b"], "de", "en"), timeout=1)
+
+        assert len(results) == 2
+
+    @pytest.mark.asyncio
+    async def test_model_error_reaches_every_caller(self):
+        """A failing batch fails all requests in it"""
+        service = Mock()
+        service.translate_batch_async = AsyncMock(side_effect=RuntimeError("model crashed"))
+        batcher = TranslationMicroBatcher(service, max_wait_ms=20)
+
+        results = await asyncio.gather(
+            batcher.translate_batch(["hallo"], "de", "en"),
+            batcher.translate_batch(["welt"], "de", "en"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        service.translate_batch_async.assert_awaited_once()
@@ -0,0 +1,112 @@
+"""
+Test suite for ahead-of-time CTranslate2 model preparation
+"""
+
+from argparse import Namespace
+from unittest.mock import patch
+
+from services.translationservice import cli
+from services.translationservice.factory import TranslationServiceFactory
+from services.translationservice.opus_ct2_implementation import OpusCT2TranslationService, prepared_model_dir
+
+MODEL = "Helsinki-NLP/opus-mt-de-en"
+
+
+def _prepare(models_dir, model_name=MODEL):
+    model_dir = prepared_model_dir(models_dir, model_name)
+    model_dir.mkdir(parents=True)
+    (model_dir / "model.bin").write_bytes(b"")
+    return model_dir
+
+
+class TestGetOrConvertModel:
+    """Test model resolution in OpusCT2TranslationService"""
+
+    def test_prepared_model_is_used_without_conversion(self, tmp_path):
+        model_dir = _prepare(tmp_path)
+        service = OpusCT2TranslationService(model_name=MODEL, models_dir=tmp_path)
+
+        with patch("services.translationservice.opus_ct2_implementation.prepare_ct2_model") as prepare:
+            assert service._get_or_convert_model() == str(model_dir)
+
+        prepare.assert_not_called()
+
+    def test_missing_model_is_converted_into_models_dir(self, tmp_path):
+        service = OpusCT2TranslationService(model_name=MODEL, device="cpu", models_dir=tmp_path)
+
+        with patch("services.translationservice.opus_ct2_implementation.prepare_ct2_model") as prepare:
+            model_path = service._get_or_convert_model()
+
+        expected_dir = prepared_model_dir(tmp_path, MODEL)
+        assert model_path == str(expected_dir)
+        prepare.assert_called_once_with(MODEL, expected_dir, quantization="int8")
+
+
+class TestGetCt2ModelNames:
+    """Test listing the models behind registered OPUS-CT2 services"""
+
+    def test_lists_unique_opus_models_only(self):
+        model_names = TranslationServiceFactory.get_ct2_model_names()
+
+        assert MODEL in model_names
+        assert "Helsinki-NLP/opus-mt-tc-big-de-es" in model_names
+        assert len(model_names) == len(set(model_names))
+        assert not any("nllb" in name for name in model_names)
+
+
+class TestPrepareModelsCommand:
+    """Test the prepare command of the translation model CLI"""
+
+    def _args(self, tmp_path):
+        return Namespace(
+            output_dir=str(tmp_path), pair=["de-en", "de-es"], model=None, quantization="int8", force=False
+        )
+
+    def test_converts_missing_and_skips_prepared_models(self, tmp_path):
+        _prepare(tmp_path)
+
+        with patch.object(cli, "prepare_ct2_model") as prepare:
+            assert cli.prepare_models(self._args(tmp_path)) == 0
+
+        prepare.assert_called_once_with(
+            "Helsinki-NLP/opus-mt-de-es",
+            prepared_model_dir(tmp_path, "Helsinki-NLP/opus-mt-de-es"),
+            quantization="int8",
+            force=False,
+        )
+
+    def test_failure_sets_exit_code(self, tmp_path):
+        with patch.object(cli, "prepare_ct2_model", side_effect=RuntimeError("download failed")) as prepare:
+            assert cli.prepare_models(self._args(tmp_path)) == 1
+
+        # A failing model does not stop the others
+        assert prepare.call_count == 2
+
+
+class TestMain:
+    """Test argument parsing of the translation model CLI"""
+
+    def test_prepare_accepts_model_selection_options(self, tmp_path):
+        with patch.object(cli, "prepare_ct2_model") as prepare:
+            exit_code = cli.main(
+                ["prepare", "--pair", "de-en", "--pair", "de-es", "-o", str(tmp_path), "--quantization", "float16"]
+            )
+
+        assert exit_code == 0
+        assert [call.args[0] for call in prepare.call_args_list] == [
+            "Helsinki-NLP/opus-mt-de-en",
+            "Helsinki-NLP/opus-mt-de-es",
+        ]
+        assert prepare.call_args.kwargs["quantization"] == "float16"
+
+    def test_list_accepts_model_selection_options(self, tmp_path):
+        with patch.object(cli, "list_models", return_value=0) as list_models:
+            assert cli.main(["list", "--model", "Helsinki-NLP/opus-mt-de-en", "--output-dir", str(tmp_path)]) == 0
+
+        args = list_models.call_args.args[0]
+        assert args.model == ["Helsinki-NLP/opus-mt-de-en"]
+        assert args.output_dir == str(tmp_path)
+
+    def test_missing_command_prints_help(self, capsys):
+        assert cli.main([]) == 1
+        assert "prepare" in capsys.readouterr().out
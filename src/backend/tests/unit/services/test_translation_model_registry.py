@@ -0,0 +1,124 @@
+"""
+Test suite for the process-wide translation model registry
+"""
+
+import threading
+from unittest.mock import Mock
+
+from services.translationservice.micro_batcher import _micro_batchers, get_translation_micro_batcher
+from services.translationservice.model_registry import TranslationModelRegistry
+
+
+def _model(memory_mb=100.0):
+    """Translation service reporting a fixed footprint"""
+    service = Mock()
+    service.memory_footprint_mb = memory_mb
+    return service
+
+
+class TestTranslationModelRegistry:
+    """Test reference counting, LRU eviction and statistics"""
+
+    def test_acquire_creates_once_and_shares(self):
+        registry = TranslationModelRegistry()
+        create = Mock(return_value=_model())
+
+        first = registry.acquire("de-en", create)
+        second = registry.acquire("de-en", create)
+
+        assert first is second
+        create.assert_called_once()
+        stats = registry.get_stats()
+        assert stats["loads"] == 1
+        assert stats["hits"] == 1
+        assert stats["in_use"] == 1
+
+    def test_idle_models_evicted_in_lru_order_over_budget(self):
+        registry = TranslationModelRegistry(memory_budget_mb=250)
+        models = {pair: _model() for pair in ("de-en", "de-es", "de-fr")}
+
+        for pair in ("de-en", "de-es"):
+            registry.acquire(pair, lambda pair=pair: models[pair])
+            registry.release(pair)
+        registry.acquire("de-en", Mock())  # de-en becomes most recently used
+        registry.release("de-en")
+        registry.acquire("de-fr", lambda: models["de-fr"])
+        registry.release("de-fr")
+
+        models["de-es"].cleanup.assert_called_once()
+        models["de-en"].cleanup.assert_not_called()
+        models["de-fr"].cleanup.assert_not_called()
+        assert registry.get_stats()["evictions"] == 1
+        assert registry.memory_usage_mb() == 200
+
+    def test_models_in_use_are_not_evicted(self):
+        registry = TranslationModelRegistry(memory_budget_mb=50)
+        in_use = registry.acquire("de-en", lambda: _model())
+
+        registry.acquire("de-es", lambda: _model())
+        registry.release("de-es")
+
+        in_use.cleanup.assert_not_called()
+        assert registry.get_stats()["registered"] == 1
+
+        registry.release("de-en")
+        in_use.cleanup.assert_called_once()
+
+    def test_evicted_model_is_created_again(self):
+        registry = TranslationModelRegistry(memory_budget_mb=0)
+        create = Mock(side_effect=lambda: _model())
+
+        with registry.lease("de-en", create):
+            pass
+        with registry.lease("de-en", create):
+            pass
+
+        assert create.call_count == 2
+
+    def test_unknown_footprint_uses_estimate(self):
+        registry = TranslationModelRegistry()
+        registry.acquire("de-en", lambda: _model(memory_mb=None))
+
+        assert registry.memory_usage_mb() == 500
+
+    def test_unbalanced_release_is_ignored(self):
+        registry = TranslationModelRegistry()
+        registry.release("de-en")
+
+        registry.acquire("de-en", lambda: _model())
+        registry.release("de-en")
+        registry.release("de-en")
+
+        assert registry.get_stats()["in_use"] == 0
+
+    def test_concurrent_acquire_creates_one_model(self):
+        registry = TranslationModelRegistry()
+        create = Mock(side_effect=lambda: _model())
+        results = []
+
+        threads = [threading.Thread(target=lambda: results.append(registry.acquire("de-en", create))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        create.assert_called_once()
+        assert len({id(service) for service in results}) == 1
+
+    def test_eviction_drops_micro_batcher(self):
+        registry = TranslationModelRegistry(memory_budget_mb=0)
+
+        with registry.lease("de-en", lambda: _model()) as service:
+            get_translation_micro_batcher(service)
+
+        service.cleanup.assert_called_once()
+        assert service not in _micro_batchers
+
+    def test_creation_locks_are_not_kept(self):
+        registry = TranslationModelRegistry(memory_budget_mb=0)
+
+        for pair in ("de-en", "de-es", "de-fr"):
+            with registry.lease(pair, lambda: _model()):
+                pass
+
+        assert registry._creating == {}
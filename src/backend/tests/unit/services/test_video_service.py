@@ -3,11 +3,13 @@ Test suite for VideoService
 Tests focus on business logic for video scanning, file resolution, and path handling
 """
 
+import io
 from collections.abc import Generator
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+from fastapi import UploadFile
 
 from api.models.video import VideoInfo
 from services.videoservice.video_service import VideoService
@@ -1323,3 +1325,38 @@ class TestVideoServiceExceptionCoverage(ServiceTestBase):
         assert len(result["errors"]) >= 1
         assert any("ProblematicSeries" in error for error in result["errors"])
         assert any("Cannot access series directory" in error for error in result["errors"])
+
+
+class TestVideoServiceSubtitleUpload(ServiceTestBase):
+    """Test subtitle uploads and the sidecar copy used by chunk processing"""
+
+    SRT = b"1\n00:00:01,000 --> 00:00:02,000\nHallo\n"
+
+    @pytest.fixture
+    def video_file(self, tmp_path):
+        video = tmp_path / "episode.mp4"
+        video.write_bytes(b"video")
+        with patch("services.videoservice.video_service.settings") as mock_settings:
+            mock_settings.get_videos_path.return_value = tmp_path
+            yield video
+
+    @pytest.mark.asyncio
+    async def test_srt_upload_creates_sidecar(self, video_service, video_file):
+        """An SRT upload is also kept as video.sidecar.srt"""
+        subtitle_path = await video_service.upload_subtitle(
+            "episode.mp4", UploadFile(io.BytesIO(self.SRT), filename="episode.srt")
+        )
+
+        assert subtitle_path == video_file.with_suffix(".srt")
+        assert video_file.with_suffix(".sidecar.srt").read_bytes() == self.SRT
+
+    @pytest.mark.asyncio
+    async def test_non_srt_upload_removes_sidecar(self, video_service, video_file):
+        """A VTT upload is not used as a sidecar and replaces an earlier SRT sidecar"""
+        sidecar = video_file.with_suffix(".sidecar.srt")
+        sidecar.write_bytes(self.SRT)
+        vtt = b"WEBVTT\n\n00:00:01.000 --> 00:00:02.000\nHallo\n"
+
+        await video_service.upload_subtitle("episode.mp4", UploadFile(io.BytesIO(vtt), filename="episode.vtt"))
+
+        assert not sidecar.exists()
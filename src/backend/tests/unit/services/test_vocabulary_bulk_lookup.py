@@ -0,0 +1,147 @@
+"""
+Test suite for bulk vocabulary lookups per subtitle file
+"""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from database.models import Base, UnknownWord, VocabularyWord
+from services.filterservice.interface import FilteredSubtitle
+from services.filterservice.subtitle_processing.srt_file_handler import SRTFileHandler
+from services.filterservice.subtitle_processing.subtitle_processor import SubtitleProcessor
+from services.lemma_cache import TokenAnalysis
+from services.vocabulary.vocabulary_query_service import VocabularyQueryService
+
+SUBTITLE_PROCESSOR = "services.filterservice.subtitle_processing.subtitle_processor"
+WORD_FILTER = "services.filterservice.subtitle_processing.word_filter"
+
+LEMMAS = {"häuser": "haus", "ging": "gehen", "gestern": "gestern", "quatsch": "quatsch"}
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    statements = []
+    event.listen(engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    async with AsyncSession(engine) as db:
+        db.add_all(
+            [
+                VocabularyWord(word="Haus", lemma="haus", language="de", difficulty_level="A1"),
+                VocabularyWord(word="gehen", lemma="gehen", language="de", difficulty_level="A1"),
+                VocabularyWord(word="gestern", lemma="gestern", language="de", difficulty_level="A2"),
+            ]
+        )
+        await db.commit()
+        statements.clear()
+        db.statements = statements
+        yield db
+    await engine.dispose()
+
+
+@pytest.fixture
+def query_service():
+    service = VocabularyQueryService()
+    service.lemmatization_service = Mock()
+    service.lemmatization_service.lemmatize_batch.side_effect = lambda words: [LEMMAS[word] for word in words]
+    return service
+
+
+class TestGetWordsInfo:
+    """Test VocabularyQueryService.get_words_info"""
+
+    @pytest.mark.asyncio
+    async def test_resolves_words_by_lemma_and_surface_form(self, session, query_service):
+        infos = await query_service.get_words_info(["häuser", "ging", "gestern", "quatsch"], "de", session)
+
+        assert infos["häuser"]["found"] and infos["häuser"]["found_word"] == "Haus"
+        assert infos["ging"]["difficulty_level"] == "A1"
+        assert infos["gestern"]["difficulty_level"] == "A2"
+        assert infos["quatsch"] == query_service._format_unknown_word_info("quatsch", "quatsch", "de")
+        query_service.lemmatization_service.lemmatize_batch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_given_lemmas_are_not_lemmatized_again(self, session, query_service):
+        infos = await query_service.get_words_info(["häuser", "ging"], "de", session, lemmas={"häuser": "haus"})
+
+        assert infos["häuser"]["found_word"] == "Haus"
+        assert infos["ging"]["found_word"] == "gehen"
+        query_service.lemmatization_service.lemmatize_batch.assert_called_once_with(["ging"])
+
+    @pytest.mark.asyncio
+    async def test_one_query_per_chunk(self, session, query_service):
+        with patch("services.vocabulary.vocabulary_query_service.BULK_LOOKUP_CHUNK_SIZE", 2):
+            await query_service.get_words_info(["häuser", "ging", "gestern"], "de", session)
+
+        vocabulary_queries = [sql for sql in session.statements if "FROM vocabulary_words" in sql]
+        assert len(vocabulary_queries) == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_words_tracked_with_occurrence_counts(self, session, query_service):
+        await query_service.get_words_info(["quatsch", "ging", "quatsch"], "de", session)
+        await query_service.get_words_info(["quatsch"], "de", session)
+
+        unknown = (await session.execute(select(UnknownWord))).scalars().all()
+        assert [(word.word, word.frequency_count) for word in unknown] == [("quatsch", 3)]
+
+    @pytest.mark.asyncio
+    async def test_empty_input(self, session, query_service):
+        assert await query_service.get_words_info([], "de", session) == {}
+        assert session.statements == []
+
+
+class TestSubtitleProcessorBulkLookup:
+    """Test that subtitle processing resolves a file's words with one bulk lookup"""
+
+    def _subtitles(self, *texts):
+        handler = SRTFileHandler()
+        return [FilteredSubtitle(text, 0.0, 1.0, handler.extract_words_from_text(text, 0.0, 1.0)) for text in texts]
+
+    @pytest.mark.asyncio
+    async def test_words_resolved_with_one_bulk_call(self):
+        validator = Mock()
+        validator.is_valid_vocabulary_word.return_value = True
+        vocab_service = Mock()
+        vocab_service.get_word_info = AsyncMock()
+        vocab_service.get_words_info = AsyncMock(
+            return_value={"ging": {"difficulty_level": "A1"}, "gestern": {"difficulty_level": "C1"}}
+        )
+        subtitles = self._subtitles("ging gestern", "ging")
+        processor = SubtitleProcessor(validator=validator)
+
+        with (
+            patch(f"{SUBTITLE_PROCESSOR}.analyze_texts_async", return_value=[{}, {}]),
+            patch(f"{WORD_FILTER}.is_proper_name", return_value=False),
+            patch(f"{WORD_FILTER}.lemmatize_word", side_effect=lambda word, language: word),
+        ):
+            result = await processor.process_subtitles(subtitles, set(), "A2", "de", vocab_service, db=Mock())
+
+        vocab_service.get_words_info.assert_awaited_once()
+        assert vocab_service.get_words_info.call_args.args[0] == ["ging", "gestern", "ging"]
+        vocab_service.get_word_info.assert_not_called()
+        assert result.statistics["active_words"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lemmas_from_subtitle_analysis_are_passed_on(self):
+        validator = Mock()
+        validator.is_valid_vocabulary_word.return_value = True
+        vocab_service = Mock()
+        vocab_service.get_words_info = AsyncMock(return_value={})
+        subtitles = self._subtitles("Häuser gestern", "ging")
+        analyses = [{"häuser": TokenAnalysis(lemma="haus", pos="NOUN", is_entity=False)}, {}]
+        processor = SubtitleProcessor(validator=validator)
+
+        with (
+            patch(f"{SUBTITLE_PROCESSOR}.analyze_texts_async", return_value=analyses),
+            patch(f"{WORD_FILTER}.is_proper_name", return_value=False),
+            patch(f"{WORD_FILTER}.lemmatize_word", side_effect=lambda word, language: word),
+        ):
+            await processor.process_subtitles(subtitles, set(), "A2", "de", vocab_service, db=Mock())
+
+        assert vocab_service.get_words_info.call_args.kwargs["lemmas"] == {"häuser": "haus"}